@@ -0,0 +1,236 @@
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from biocypher._logger import logger
+from benchmarks.synthetic import SyntheticBoard
+
+logger.debug(f"Loading module {__name__}.")
+
+
+COMMENTS_PATTERN = re.compile(
+    r'(\w+): issue\(number: (\d+)\) \{\s*comments\(last: (\d+)(?:, before: "(\d+)")?\)'
+)
+FIELD_VALUE_BY_NAME_PATTERN = re.compile(r'(\w+): fieldValueByName\(name: "([^"]+)"\)')
+FILTER_TERM_PATTERN = re.compile(
+    r'(\w+):((?:"[^"]*"|[^\s,]+)(?:,(?:"[^"]*"|[^\s,]+))*)'
+)
+MUTATION_PATTERN = re.compile(
+    r"(\w+): updateProjectV2ItemFieldValue|updateProjectV2ItemFieldValue"
+)
+RATE_LIMIT = {"cost": 1, "remaining": 4999, "resetAt": "2099-01-01T00:00:00Z"}
+
+
+class MockGitHubServer(ThreadingHTTPServer):
+    """
+    Local stand-in for the GitHub GraphQL API, serving a synthetic board.
+    Answers the queries sent by `GitHubAdapter` (project id, fields, item
+    pages, filtered items, items by id, batched comments, and field
+    mutations) and counts the requests and response bytes. `GET /_stats`
+    returns the counters and `GET /_reset` resets them.
+
+    Args:
+        board: The board to serve.
+        address: Host and port to listen on. Port 0 picks a free port.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, board: SyntheticBoard, address: tuple = ("127.0.0.1", 0)):
+        super().__init__(address, MockGitHubHandler)
+
+        self.board = board
+        self.requests = 0
+        self.bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return "http://%s:%s/graphql" % self.server_address[:2]
+
+    def count(self, size: int):
+        with self._lock:
+            self.requests += 1
+            self.bytes += size
+
+    def answer(self, query: str, variables: dict) -> dict:
+        """
+        Build the response of a GraphQL request.
+        """
+
+        board = self.board
+
+        if query.lstrip().startswith("mutation"):
+            return {
+                "data": {
+                    alias or "updateProjectV2ItemFieldValue": {"clientMutationId": None}
+                    for alias in MUTATION_PATTERN.findall(query)
+                }
+            }
+
+        if "organization(" in query:
+            data = {"organization": {"projectV2": {"id": "PVT_benchmark"}}}
+        elif "fields(first" in query:
+            data = {"node": {"fields": {"nodes": board.fields}}}
+        elif "fieldValueByName" in query:
+            data = self._find_items(query, variables)
+        elif "items(first" in query:
+            first = variables["first"]
+            start = int(variables.get("after") or 0)
+            end = start + first
+            data = {
+                "node": {
+                    "items": {
+                        "nodes": board.items[start:end],
+                        "pageInfo": {
+                            "endCursor": str(end),
+                            "hasNextPage": end < len(board.items),
+                        },
+                    }
+                }
+            }
+        elif "nodes(ids" in query:
+            data = {"nodes": [board.get_item(item_id) for item_id in variables["ids"]]}
+        elif "issue(number" in query:
+            data = {
+                "repository": {
+                    alias: {
+                        "comments": self._get_comments(
+                            int(number), int(k), before, "body" in query
+                        )
+                    }
+                    for alias, number, k, before in COMMENTS_PATTERN.findall(query)
+                }
+            }
+        else:
+            return {"errors": [{"message": "Unsupported query."}]}
+
+        if "rateLimit" in query:
+            data["rateLimit"] = RATE_LIMIT
+
+        return {"data": data}
+
+    def _find_items(self, query: str, variables: dict) -> dict:
+        """
+        Page through the items with only the requested field values, keeping
+        the items that match the `query` filter, e.g. `status:Todo,"In
+        Progress"`. Cursors are the index of the next item on the board.
+        """
+
+        aliases = FIELD_VALUE_BY_NAME_PATTERN.findall(query)
+        terms = {
+            name: {value.strip('"') for value in values.split(",")}
+            for name, values in FILTER_TERM_PATTERN.findall(
+                variables.get("query") or ""
+            )
+        }
+
+        first = variables["first"]
+        start = int(variables.get("after") or 0)
+        end = min(start + first, len(self.board.items))
+
+        nodes = []
+        for item in self.board.items[start:end]:
+            values = {
+                (value.get("field") or {}).get("name", "Iteration"): value
+                for value in item["fieldValues"]["nodes"]
+            }
+            if any(
+                _get_value(values.get(name.capitalize())) not in accepted
+                for name, accepted in terms.items()
+            ):
+                continue
+            node = {"id": item["id"]}
+            for alias, name in aliases:
+                node[alias] = values.get(name)
+            nodes.append(node)
+
+        return {
+            "node": {
+                "items": {
+                    "nodes": nodes,
+                    "pageInfo": {
+                        "endCursor": str(end),
+                        "hasNextPage": end < len(self.board.items),
+                    },
+                }
+            }
+        }
+
+    def _get_comments(self, number: int, k: int, before: str, bodies: bool) -> dict:
+        """
+        Page backwards through the comments of an issue. Cursors are the
+        index of the first comment of a page.
+        """
+
+        comments = self.board.comments.get(number, [])
+        end = int(before) if before else len(comments)
+        start = max(0, end - k)
+
+        nodes = comments[start:end]
+        if not bodies:
+            nodes = [
+                {key: value for key, value in node.items() if key != "body"}
+                for node in nodes
+            ]
+
+        return {
+            "nodes": nodes,
+            "pageInfo": {"hasPreviousPage": start > 0, "startCursor": str(start)},
+        }
+
+
+def _get_value(value: dict):
+    if not value:
+        return None
+    return value.get("name") or value.get("text") or value.get("title")
+
+
+class MockGitHubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length))
+
+        body = json.dumps(
+            self.server.answer(payload["query"], payload.get("variables") or {})
+        ).encode()
+        self.server.count(len(body))
+        self._send(body)
+
+    def do_GET(self):
+        if self.path == "/_reset":
+            self.server.requests = self.server.bytes = 0
+
+        self._send(
+            json.dumps(
+                {"requests": self.server.requests, "bytes": self.server.bytes}
+            ).encode()
+        )
+
+    def _send(self, body: bytes):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(board_options: dict, port_queue):
+    """
+    Serve a synthetic board until the process is terminated. Meant as the
+    target of a separate process, so that the server does not compete with
+    the benchmarked code for the GIL.
+
+    Args:
+        board_options: Keyword arguments of `SyntheticBoard`.
+        port_queue: Queue the URL of the server is put on once it listens.
+    """
+
+    server = MockGitHubServer(SyntheticBoard(**board_options))
+    port_queue.put(server.url)
+    server.serve_forever()
@@ -0,0 +1,365 @@
+"""
+Benchmark the GitHub adapter against a local stand-in of the GraphQL API.
+
+For each board size, a synthetic board is served by a mock server in a
+separate process, and the download, processing, and BioCypher write stages
+are each run in a fresh process, which receives the state left by the
+previous stage. Wall time, request count, response bytes, peak RSS, and nodes
+per second are recorded per stage and saved as JSON, which can be compared
+with the results of a previous run:
+
+    python -m benchmarks.run --sizes 100 1000 10000
+    python -m benchmarks.run --compare benchmarks/results/<previous>.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import pickle
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from itertools import chain
+import requests
+from tabulate import tabulate
+from project_planning.instrumentation import peak_rss_mb
+
+DEFAULT_SIZES = [100, 1000, 10000, 50000]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--comments", type=float, default=3)
+    parser.add_argument("--labels", type=float, default=2)
+    parser.add_argument("--assignees", type=float, default=1)
+    parser.add_argument("--people", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--adapter-options",
+        type=json.loads,
+        default={},
+        help="JSON object of additional GitHubAdapter arguments.",
+    )
+    parser.add_argument(
+        "--skip-write", action="store_true", help="Skip the BioCypher write stage."
+    )
+    parser.add_argument(
+        "--head-ontology",
+        help="URL or path of the head ontology, e.g. a local copy for offline runs.",
+    )
+    parser.add_argument("--output", help="Path of the results file.")
+    parser.add_argument("--compare", help="Results file of a previous run.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Relative slowdown or growth reported as regression.",
+    )
+    args = parser.parse_args()
+
+    board_options = {
+        "comments": args.comments,
+        "labels": args.labels,
+        "assignees": args.assignees,
+        "people": args.people,
+        "seed": args.seed,
+    }
+
+    results = []
+    for size in args.sizes:
+        print(f"Benchmarking a board of {size} items.", file=sys.stderr)
+        results.extend(
+            _benchmark_board(
+                dict(board_options, items=size),
+                args.adapter_options,
+                None if args.skip_write else args.head_ontology or "",
+            )
+        )
+
+    report = {
+        "metadata": {
+            "commit": _get_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "board": board_options,
+            "adapter_options": args.adapter_options,
+        },
+        "results": results,
+    }
+
+    output = args.output or os.path.join(
+        "benchmarks",
+        "results",
+        f"{datetime.now():%Y%m%d-%H%M%S}-{report['metadata']['commit'] or 'local'}.json",
+    )
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    print(_format_results(results))
+    print(f"Results written to {output}.", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+        table, regressions = compare(baseline["results"], results, args.tolerance)
+        print(table)
+
+        if regressions:
+            print(f"{regressions} regressions.", file=sys.stderr)
+            sys.exit(1)
+
+
+def _run_isolated(func, *args):
+    """
+    Run a function in a fresh process, so that peak RSS is measured per
+    benchmark stage.
+    """
+
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_put_result, args=(queue, func, *args))
+    process.start()
+    result = queue.get()
+    process.join()
+
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
+def _put_result(queue, func, *args):
+    try:
+        queue.put(func(*args))
+    except Exception as e:
+        queue.put(e)
+        raise
+
+
+def _benchmark_board(
+    board_options: dict, adapter_options: dict, head_ontology: str
+) -> list:
+    """
+    Serve a synthetic board and run each adapter stage against it in a fresh
+    process. The state left by a stage is passed to the next one through a
+    pickle file, so the peak RSS of a stage includes its input, but not the
+    memory of the previous stages.
+
+    Args:
+        board_options: Keyword arguments of `SyntheticBoard`.
+        adapter_options: Additional keyword arguments of `GitHubAdapter`.
+        head_ontology: URL or path of the head ontology for the write stage,
+            empty for the configured one, or None to skip the write stage.
+
+    Returns:
+        List of result rows, one per stage.
+    """
+
+    from benchmarks.mock_server import serve
+
+    context = multiprocessing.get_context("spawn")
+    url_queue = context.Queue()
+    server = context.Process(target=serve, args=(board_options, url_queue))
+    server.start()
+
+    try:
+        url = url_queue.get(timeout=600)
+        os.environ.setdefault("BIOCYPHER_GITHUB_PROJECT_TOKEN", "benchmark")
+
+        with tempfile.TemporaryDirectory() as directory:
+            downloaded = os.path.join(directory, "download.pickle")
+            processed = os.path.join(directory, "process.pickle")
+
+            stages = [
+                ("download", _download, None, downloaded, adapter_options),
+                ("process", _process, downloaded, processed, adapter_options),
+            ]
+            if head_ontology is not None:
+                stages.append(("write", _write, processed, None, head_ontology))
+
+            rows = [_run_isolated(_run_stage, url, *stage) for stage in stages]
+    finally:
+        server.terminate()
+        server.join()
+
+    # Throughput of every stage is given relative to the final graph
+    nodes, edges = rows[1].pop("nodes"), rows[1].pop("edges")
+    for row in rows:
+        row["items"] = board_options["items"]
+        row["nodes"] = nodes
+        row["edges"] = edges
+        row["nodes_per_sec"] = round(nodes / row["wall_time"], 1)
+
+    return rows
+
+
+def _run_stage(
+    url: str, stage: str, func, input_path: str, output_path: str, *args
+) -> dict:
+    """
+    Run and measure one stage in the current process.
+
+    Args:
+        url: URL of the mock server.
+        stage: Name of the stage.
+        func: Function of the stage, called with the state of the previous
+            stage, the URL, and `args`. Returns the state for the next stage
+            and a dictionary of additional result values.
+        input_path: Pickle file of the state of the previous stage, if any.
+        output_path: Pickle file for the state of this stage, if any. It is
+            written after the stage is measured.
+
+    Returns:
+        The result row of the stage.
+    """
+
+    state = None
+    if input_path:
+        with open(input_path, "rb") as f:
+            state = pickle.load(f)
+
+    base_url = url.rsplit("/", 1)[0]
+    requests.get(f"{base_url}/_reset")
+
+    start = time.perf_counter()
+    state, values = func(state, url, *args)
+    wall_time = time.perf_counter() - start
+
+    stats = requests.get(f"{base_url}/_stats").json()
+
+    row = {
+        "stage": stage,
+        "wall_time": round(wall_time, 4),
+        "requests": stats["requests"],
+        "response_bytes": stats["bytes"],
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        **values,
+    }
+
+    if output_path:
+        with open(output_path, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    return row
+
+
+def _download(state, url: str, adapter_options: dict) -> tuple:
+    from project_planning.adapters.github_adapter import GitHubAdapter
+
+    with GitHubAdapter(api_url=url, download=False, **adapter_options) as adapter:
+        adapter._download_data()
+
+    return (adapter._projects, adapter._items, adapter._item_projects), {}
+
+
+def _process(state, url: str, adapter_options: dict) -> tuple:
+    from project_planning.adapters.github_adapter import GitHubAdapter
+
+    with GitHubAdapter(api_url=url, download=False, **adapter_options) as adapter:
+        adapter._projects, adapter._items, adapter._item_projects = state
+        adapter._set_primary_project()
+        adapter._process_data()
+
+    nodes, edges = adapter.get_nodes(), adapter.get_edges()
+    return (nodes, edges), {"nodes": len(nodes), "edges": len(edges)}
+
+
+def _write(state, url: str, head_ontology: str) -> tuple:
+    from biocypher import BioCypher
+    from project_planning.writer import ShardedNeo4jWriter
+
+    nodes, edges = state
+
+    with tempfile.TemporaryDirectory() as directory:
+        options = {"output_directory": os.path.join(directory, "build2neo")}
+        if head_ontology:
+            options["head_ontology"] = {"url": head_ontology, "root_node": "entity"}
+
+        bc = BioCypher(**options)
+        writer = ShardedNeo4jWriter(bc)
+        writer.write(chain(nodes, edges))
+        bc.write_import_call()
+
+    return None, {}
+
+
+def _get_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _format_results(results: list) -> str:
+    columns = [
+        "items",
+        "stage",
+        "wall_time",
+        "requests",
+        "response_bytes",
+        "peak_rss_mb",
+        "nodes",
+        "nodes_per_sec",
+    ]
+    return tabulate(
+        [[row.get(column) for column in columns] for row in results],
+        headers=columns,
+    )
+
+
+def compare(baseline: list, results: list, tolerance: float = 0.2) -> tuple:
+    """
+    Compare results with those of a previous run. Wall time, requests, and
+    peak RSS that grew by more than `tolerance` are reported as regressions.
+
+    Args:
+        baseline: Result rows of the previous run.
+        results: Result rows of the current run.
+        tolerance: Relative growth that is tolerated.
+
+    Returns:
+        Tuple of the formatted comparison table and the number of
+        regressions.
+    """
+
+    previous = {(row["items"], row["stage"]): row for row in baseline}
+
+    table = []
+    regressions = 0
+    for row in results:
+        old = previous.get((row["items"], row["stage"]))
+        if old is None:
+            continue
+
+        line = [row["items"], row["stage"]]
+        for metric in ("wall_time", "requests", "peak_rss_mb"):
+            change = (row[metric] - old[metric]) / old[metric] if old[metric] else 0
+            flag = ""
+            if change > tolerance:
+                flag = " !"
+                regressions += 1
+            line.append(f"{old[metric]} -> {row[metric]} ({change:+.0%}){flag}")
+        table.append(line)
+
+    return (
+        tabulate(
+            table, headers=["items", "stage", "wall_time", "requests", "peak_rss_mb"]
+        ),
+        regressions,
+    )
+
+
+if __name__ == "__main__":
+    main()
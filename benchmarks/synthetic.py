@@ -0,0 +1,156 @@
+import random
+from biocypher._logger import logger
+
+logger.debug(f"Loading module {__name__}.")
+
+
+STATUSES = ["Todo", "In Progress", "Scheduled", "Done", "Closed / Parked"]
+SIZES = ["XS", "S", "M", "L", "XL"]
+PRIORITIES = ["P0", "P1", "P2"]
+TIMESLOTS = [f"{day} {hour}:00" for day in ["Mon", "Tue", "Wed"] for hour in (10, 14)]
+DURATIONS = ["30 min", "1 h", "2 h"]
+ITERATIONS = 6
+
+
+class SyntheticBoard:
+    """
+    Deterministic synthetic GitHub project board, shaped like the responses
+    of the GraphQL queries of `GitHubAdapter`.
+
+    Args:
+        items: Number of issues on the board.
+        comments: Mean number of comments per issue.
+        labels: Mean number of labels per issue.
+        assignees: Mean number of assignees per issue.
+        people: Number of distinct users assigned and commenting.
+        seed: Seed of the random generator.
+        repository: Repository of the issues, as "owner/name".
+    """
+
+    def __init__(
+        self,
+        items: int = 1000,
+        comments: float = 3,
+        labels: float = 2,
+        assignees: float = 1,
+        people: int = 50,
+        seed: int = 0,
+        repository: str = "biocypher/project-planning",
+    ):
+        self.repository = repository
+
+        rng = random.Random(seed)
+        people = [f"user{index}" for index in range(people)]
+        label_names = [f"label{index}" for index in range(20)]
+
+        self.fields = self._make_fields()
+        self.items = []
+        self.comments = {}
+
+        for number in range(1, items + 1):
+            self.items.append(
+                self._make_item(rng, number, people, label_names, labels, assignees)
+            )
+            self.comments[number] = [
+                {
+                    "author": {"login": rng.choice(people)},
+                    "id": f"IC_{number}_{index}",
+                    "body": f"Comment {index} on issue {number}. " * 4,
+                }
+                for index in range(_sample_count(rng, comments))
+            ]
+
+        self._items_by_id = {item["id"]: item for item in self.items}
+
+    def get_item(self, item_id: str) -> dict:
+        return self._items_by_id.get(item_id)
+
+    def _make_fields(self) -> list:
+        def single_select(name, options):
+            return {
+                "id": f"PVTSSF_{name}",
+                "name": name,
+                "options": [
+                    {"id": f"{name}_{index}", "name": option}
+                    for index, option in enumerate(options)
+                ],
+            }
+
+        return [
+            {"id": "PVTF_Title", "name": "Title"},
+            single_select("Status", STATUSES),
+            single_select("Size", SIZES),
+            single_select("Priority", PRIORITIES),
+            single_select("Timeslot", TIMESLOTS),
+            single_select("Duration", DURATIONS),
+            {
+                "id": "PVTIF_Iteration",
+                "name": "Iteration",
+                "configuration": {
+                    "iterations": [
+                        {
+                            "startDate": f"2026-01-{1 + 14 * index:02d}",
+                            "id": f"it{index}",
+                        }
+                        for index in range(ITERATIONS)
+                    ]
+                },
+            },
+        ]
+
+    def _make_item(self, rng, number, people, label_names, labels, assignees):
+        iteration = rng.randrange(ITERATIONS)
+        field_values = [
+            {"text": f"Issue {number}", "field": {"name": "Title"}},
+            {"name": rng.choice(STATUSES), "field": {"name": "Status"}},
+            {"name": rng.choice(SIZES), "field": {"name": "Size"}},
+            {"name": rng.choice(PRIORITIES), "field": {"name": "Priority"}},
+            {"title": f"Iteration {iteration}", "iterationId": f"it{iteration}"},
+        ]
+        if rng.random() < 0.3:
+            field_values.append(
+                {"name": rng.choice(TIMESLOTS), "field": {"name": "Timeslot"}}
+            )
+            field_values.append(
+                {"name": rng.choice(DURATIONS), "field": {"name": "Duration"}}
+            )
+
+        uses = " ".join(f"#{rng.randint(1, number)}" for _ in range(rng.randrange(3)))
+
+        return {
+            "id": f"PVTI_{number}",
+            "updatedAt": "2026-01-01T00:00:00Z",
+            "fieldValues": {"nodes": field_values},
+            "content": {
+                "title": f"Issue {number}",
+                "body": f"Description of issue {number}.\nUses: {uses}\n",
+                "number": number,
+                "updatedAt": "2026-01-01T00:00:00Z",
+                "repository": {"nameWithOwner": self.repository},
+                "labels": {
+                    "edges": [
+                        {"node": {"name": name}}
+                        for name in rng.sample(
+                            label_names,
+                            min(_sample_count(rng, labels), len(label_names)),
+                        )
+                    ]
+                },
+                "assignees": {
+                    "nodes": [
+                        {"login": login}
+                        for login in rng.sample(
+                            people, min(_sample_count(rng, assignees), len(people))
+                        )
+                    ]
+                },
+            },
+        }
+
+
+def _sample_count(rng: random.Random, mean: float) -> int:
+    """
+    Draw a count between 0 and twice the mean, with the given mean.
+    """
+
+    return rng.randint(0, round(2 * mean))
@@ -0,0 +1,106 @@
+# Tuesday noon, schedule this week's issues and post the schedule
+import argparse
+import sys
+from project_planning.adapters.github_adapter import (
+    GitHubAdapter,
+    GitHubAdapterNodeType,
+    GitHubAdapterProjectField,
+)
+from project_planning.scheduling import TimeslotScheduler
+
+SCHEDULE_HEADING = "## Current Schedule"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Assign timeslots to project items and post the schedule."
+    )
+    parser.add_argument(
+        "--status",
+        nargs="+",
+        default=["Todo"],
+        help="Statuses of the items to schedule.",
+    )
+    parser.add_argument("--scheduled-status", default="Scheduled")
+    parser.add_argument(
+        "--default-duration",
+        default="1 h",
+        help="Duration of items without one. It is written to these items, so "
+        "it must match an option of the Duration field, if the board has one.",
+    )
+    parser.add_argument(
+        "--snapshot",
+        help="Project snapshot to update incrementally instead of downloading "
+        "the fields needed for scheduling.",
+    )
+    parser.add_argument("--readme", default="README.md")
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only print the schedule, without changing the board or README.",
+    )
+    args = parser.parse_args()
+
+    if args.snapshot:
+        adapter = GitHubAdapter(snapshot_path=args.snapshot, incremental=True)
+    else:
+        # Timeslot and duration come with the status; no comments are needed
+        adapter = GitHubAdapter(
+            node_types=[GitHubAdapterNodeType.PROJECT],
+            node_fields=[
+                GitHubAdapterProjectField.TITLE,
+                GitHubAdapterProjectField.STATUS,
+                GitHubAdapterProjectField.PRIORITY,
+                GitHubAdapterProjectField.ASSIGNEES,
+            ],
+            edge_types=[],
+        )
+
+    with adapter:
+        scheduler = TimeslotScheduler(
+            adapter.get_field_options("Timeslot"),
+            statuses=args.status,
+            scheduled_status=args.scheduled_status,
+            priorities=adapter.get_field_options("Priority"),
+            default_duration=args.default_duration,
+            durations=adapter.get_field_options("Duration"),
+        )
+        schedule = scheduler.solve(adapter.get_items())
+        text = schedule.render()
+
+        if args.dry_run:
+            print(text)
+            return
+
+        # Only changed timeslots and statuses are written, in bulk
+        result = adapter.mutate_fields(schedule.get_changes())
+
+    # Don't post a schedule that the board doesn't match
+    if result["failed"]:
+        for (item_id, field_name, option_name), reason in result["failed"]:
+            print(
+                f"Could not set {field_name} of {item_id} to {option_name}: "
+                f"{reason}",
+                file=sys.stderr,
+            )
+        sys.exit(1)
+
+    # Replace the schedule at the end of README.md
+    with open(args.readme, "r") as f:
+        lines = f.readlines()
+
+    for i, line in enumerate(lines):
+        if line.startswith(SCHEDULE_HEADING):
+            lines = lines[: i + 1]
+            break
+    else:
+        lines.append(f"\n{SCHEDULE_HEADING}\n")
+
+    lines.append("\n" + text)
+
+    with open(args.readme, "w") as f:
+        f.writelines(lines)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,9 @@
+import os
 from biocypher import BioCypher
 from project_planning.adapters.github_adapter import GitHubAdapter
+from project_planning.columnar import ColumnarExporter
+from project_planning.instrumentation import Instrumentation
+from project_planning.writer import ShardedNeo4jWriter
 import pandas as pd
 
 pd.set_option("display.max_columns", None)
@@ -7,9 +11,20 @@ pd.set_option("display.max_rows", None)
 
 
 def main():
-    bc = BioCypher()
+    # Set BIOCYPHER_GITHUB_PROFILE to "cprofile" or "pyinstrument" to profile
+    instrumentation = Instrumentation(profile=os.getenv("BIOCYPHER_GITHUB_PROFILE"))
 
-    adapter = GitHubAdapter()
+    with instrumentation.profile():
+        build(instrumentation)
+
+    instrumentation.write_report()
+
+
+def build(instrumentation: Instrumentation):
+    with instrumentation.stage("setup"):
+        bc = BioCypher()
+
+    adapter = GitHubAdapter(streaming=True, instrumentation=instrumentation)
 
     # bc.add_nodes(adapter.get_nodes())
     # bc.add_edges(adapter.get_edges())
@@ -20,11 +35,29 @@ def main():
     #     print(name)
     #     print(df.head())
 
-    bc.write_nodes(adapter.get_nodes())
-    bc.write_edges(adapter.get_edges())
-    bc.write_schema_info(as_node=True)
-    bc.write_import_call()
-    bc.summary()
+    elements = adapter.get_nodes_and_edges()
+
+    # Set BIOCYPHER_GITHUB_EXPORT to a directory to also export the nodes and
+    # edges as columnar tables for analytics
+    export_directory = os.getenv("BIOCYPHER_GITHUB_EXPORT")
+    exporter = None
+    if export_directory:
+        exporter = ColumnarExporter(export_directory)
+        elements = exporter.tee(elements)
+
+    # Write sharded admin import files while the project is downloaded
+    with instrumentation.stage("download and write"):
+        writer = ShardedNeo4jWriter(bc)
+        writer.write(elements)
+
+    if exporter is not None:
+        with instrumentation.stage("export"):
+            exporter.close()
+
+    with instrumentation.stage("finalise"):
+        bc.write_schema_info(as_node=True)
+        bc.write_import_call()
+        bc.summary()
 
 
 if __name__ == "__main__":
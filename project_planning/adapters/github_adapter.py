@@ -1,13 +1,213 @@
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import os
-from enum import Enum, auto
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from enum import Enum
 from itertools import chain
+from textwrap import indent
 from biocypher._logger import logger
+from project_planning.cache import ResponseCache
+from project_planning.comments import CommentPolicy
+from project_planning.decoding import JSONDecoder
+from project_planning.instrumentation import Instrumentation
+from project_planning.item import ProjectItem
+from project_planning.rate_limit import RateLimiter
+from project_planning.references import extract_uses
+from project_planning.registry import GraphRegistry
+from project_planning.snapshot import ProjectSnapshot
 
 logger.debug(f"Loading module {__name__}.")
 
 
+GITHUB_API_URL = "https://api.github.com/graphql"
+
+# GitHub rejects queries that could return more than 500,000 nodes, and
+# connections return at most 100 nodes per page
+NODE_LIMIT = 500_000
+MAX_PAGE_SIZE = 100
+
+# Changes made this long before a download started are fetched again by the
+# next incremental build, allowing for clock skew and replication lag
+HIGH_WATER_MARK_WINDOW = timedelta(minutes=5)
+FIELD_VALUES_LIMIT = 100
+LABELS_LIMIT = 10
+ASSIGNEES_LIMIT = 10
+
+RATE_LIMIT_SELECTION = """
+  rateLimit {
+    cost
+    remaining
+    resetAt
+  }"""
+
+TEXT_VALUE_FRAGMENT = """
+... on ProjectV2ItemFieldTextValue {
+  text
+  field {
+    ... on ProjectV2FieldCommon {
+      name
+    }
+  }
+}"""
+
+SINGLE_SELECT_VALUE_FRAGMENT = """
+... on ProjectV2ItemFieldSingleSelectValue {
+  name
+  field {
+    ... on ProjectV2FieldCommon {
+      name
+    }
+  }
+}"""
+
+ITERATION_VALUE_FRAGMENT = """
+... on ProjectV2ItemFieldIterationValue {
+  title
+  iterationId
+}"""
+
+LABELS_SELECTION = """
+labels(first: %s) {
+  edges {
+    node {
+      name
+    }
+  }
+}""" % (
+    LABELS_LIMIT,
+)
+
+ASSIGNEES_SELECTION = """
+assignees(first: %s) {
+  nodes {
+    login
+  }
+}""" % (
+    ASSIGNEES_LIMIT,
+)
+
+ITEM_SELECTION = """
+id
+updatedAt
+fieldValues(first: %s) {
+  nodes {%s
+  }
+}
+content {
+  ... on Issue {%s
+  }
+}"""
+
+REPOSITORY_SELECTION = """
+repository {
+  nameWithOwner
+}"""
+
+ITEM_LISTING_SELECTION = """
+id
+updatedAt
+content {
+  ... on Issue {
+    number
+    updatedAt
+    repository {
+      nameWithOwner
+    }
+  }
+}"""
+
+PROJECT_ID_QUERY = """
+query($organization: String!, $number: Int!) {
+  organization(login: $organization) {
+    projectV2(number: $number) {
+      id
+    }
+  }
+}
+"""
+
+ITEMS_PAGE_QUERY = """
+query($id: ID!, $first: Int!, $after: String) {
+  node(id: $id) {
+    ... on ProjectV2 {
+      items(first: $first, after: $after) {
+        nodes {%s
+        }
+        pageInfo {
+          endCursor
+          hasNextPage
+        }
+      }
+    }
+  }%s
+}
+"""
+
+ITEM_FILTER_QUERY = """
+query($id: ID!, $first: Int!, $after: String%s) {
+  node(id: $id) {
+    ... on ProjectV2 {
+      items(first: $first, after: $after%s) {
+        nodes {
+          id%s
+        }
+        pageInfo {
+          endCursor
+          hasNextPage
+        }
+      }
+    }
+  }%s
+}
+"""
+
+FIELD_VALUE_BY_NAME_SELECTION = """
+%s: fieldValueByName(name: %s) {
+  ... on ProjectV2ItemFieldSingleSelectValue {
+    name
+  }
+  ... on ProjectV2ItemFieldTextValue {
+    text
+  }
+  ... on ProjectV2ItemFieldIterationValue {
+    title
+  }
+}"""
+
+ITEMS_BY_ID_QUERY = """
+query($ids: [ID!]!) {
+  nodes(ids: $ids) {
+    ... on ProjectV2Item {%s
+    }
+  }%s
+}
+"""
+
+
+class GitHubAPIError(RuntimeError):
+    """
+    Raised when a GraphQL query returns errors or no data, e.g. once the
+    retries of a `RATE_LIMITED` error are exhausted.
+
+    Attributes:
+        errors: The GraphQL errors of the response.
+    """
+
+    def __init__(self, message: str, errors: list = None):
+        self.errors = errors or []
+        details = "; ".join(
+            error.get("type") or error.get("message") or str(error)
+            for error in self.errors
+        )
+        super().__init__(f"{message}: {details}" if details else message)
+
+
 class GitHubAdapterNodeType(Enum):
     """
     Define types of nodes the adapter can provide.
@@ -16,6 +216,8 @@ class GitHubAdapterNodeType(Enum):
     PERSON = "person"
     PROJECT = "project"
     ITERATION = "iteration"
+    COMMENT = "comment"
+    DATA_TYPE = "data type"
 
 
 class GitHubAdapterProjectField(Enum):
@@ -41,6 +243,46 @@ class GitHubAdapterEdgeType(Enum):
 
     LEADS = "leads"
     PART_OF = "part of"
+    HAS_COMMENT = "has comment"
+    USES = "uses"
+
+
+PROJECT_PROPERTIES = {
+    GitHubAdapterProjectField.TITLE: "title",
+    GitHubAdapterProjectField.DESCRIPTION: "description",
+    GitHubAdapterProjectField.LABELS: "labels",
+    GitHubAdapterProjectField.STATUS: "status",
+    GitHubAdapterProjectField.SIZE: "size",
+    GitHubAdapterProjectField.PRIORITY: "priority",
+    GitHubAdapterProjectField.ITERATION: "iteration",
+    GitHubAdapterProjectField.ASSIGNEES: "assignees",
+    GitHubAdapterProjectField.ISSUE: "issue_number",
+}
+
+
+DEFAULT_PROJECTS = [("biocypher", 6)]
+
+# Selections that require iteration values, assignees, or comments
+ITERATION_SELECTIONS = (
+    GitHubAdapterNodeType.ITERATION,
+    GitHubAdapterProjectField.ITERATION,
+    GitHubAdapterEdgeType.PART_OF,
+)
+ASSIGNEE_SELECTIONS = (
+    GitHubAdapterNodeType.PERSON,
+    GitHubAdapterProjectField.ASSIGNEES,
+    GitHubAdapterEdgeType.LEADS,
+)
+COMMENT_SELECTIONS = (
+    GitHubAdapterNodeType.COMMENT,
+    GitHubAdapterEdgeType.HAS_COMMENT,
+)
+# Selections generated from the "Uses:" lines of the issue bodies
+DEPENDENCY_SELECTIONS = (
+    GitHubAdapterNodeType.DATA_TYPE,
+    GitHubAdapterEdgeType.PART_OF,
+    GitHubAdapterEdgeType.USES,
+)
 
 
 class GitHubAdapter:
@@ -53,6 +295,48 @@ class GitHubAdapter:
         node_fields: List of node fields to include in the result.
         edge_types: List of edge types to include in the result.
         edge_fields: List of edge fields to include in the result.
+        comment_batch_size: Number of issues whose comments are fetched in a
+            single GraphQL request.
+        max_workers: Maximum number of GraphQL requests in flight at the same
+            time.
+        concurrent: Whether to overlap independent requests. Set to False to
+            run all requests sequentially, e.g. for debugging.
+        pool_size: Maximum number of pooled keep-alive connections to the
+            GitHub API. Defaults to `max_workers`.
+        timeout: Timeout in seconds for each API request.
+        snapshot_path: Path of an on-disk snapshot of the fetched project.
+            If given, the snapshot is updated after every build.
+        streaming: Whether to download and process the project lazily, page
+            by page, while `get_nodes()` and `get_edges()` are consumed. The
+            returned generators can only be consumed once. Not compatible
+            with snapshots.
+        incremental: Whether to only fetch items and comments changed since
+            the snapshot was taken, and to only return nodes and edges that
+            changed since then. Requires `snapshot_path`.
+        cache: Response cache for GraphQL queries, e.g. a
+            `SQLiteResponseCache`. Mutations are never cached.
+        rate_limiter: Rate limiter pacing and retrying the API requests. Pass
+            the same instance to several adapters to share one budget.
+        projects: List of (organization, project number) tuples of the
+            project boards to ingest into one graph. Boards are fetched in
+            parallel; issues on several boards are only included once, with
+            the item of the first board. Defaults to `DEFAULT_PROJECTS`.
+        api_url: URL of the GraphQL endpoint, e.g. a local stand-in for
+            benchmarks. Defaults to the `BIOCYPHER_GITHUB_API_URL`
+            environment variable or `GITHUB_API_URL`.
+        instrumentation: Collector of stage timings and of one span per
+            GraphQL request. Pass the instance used by the build script to
+            get the adapter stages into its report.
+        json_backend: Library used to decode the responses, "msgspec",
+            "orjson", or "json". Defaults to the `BIOCYPHER_GITHUB_JSON`
+            environment variable or the fastest installed one.
+        comment_policy: Which comments to load: for which items, how many
+            per issue, and whether with full bodies. Defaults to the 10
+            most recent comments of every issue. Comments of other issues
+            can still be loaded on demand with `get_comments()`.
+        download: Whether to download and process the project on
+            construction. Set to False to only use targeted queries such as
+            `find_items()` and the mutations, e.g. in maintenance scripts.
     """
 
     def __init__(
@@ -61,36 +345,182 @@ class GitHubAdapter:
         node_fields: str = None,
         edge_types: str = None,
         edge_fields: str = None,
+        comment_batch_size: int = 50,
+        max_workers: int = 8,
+        concurrent: bool = True,
+        pool_size: int = None,
+        timeout: float = 30,
+        snapshot_path: str = None,
+        incremental: bool = False,
+        streaming: bool = False,
+        cache: ResponseCache = None,
+        rate_limiter: RateLimiter = None,
+        projects: list = None,
+        api_url: str = None,
+        instrumentation: Instrumentation = None,
+        json_backend: str = None,
+        comment_policy: CommentPolicy = None,
+        download: bool = True,
     ):
         self._set_types_and_fields(node_types, node_fields, edge_types, edge_fields)
+        self._item_selection = self._build_item_selection()
+        self._page_size = self._get_items_page_size()
+
+        if comment_batch_size < 1:
+            raise ValueError("comment_batch_size must be at least 1.")
 
-        self._nodes = []
-        self._edges = []
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+
+        self.comment_batch_size = comment_batch_size
+        self.max_workers = max_workers
+        self.concurrent = concurrent
+        # Shared by all threads, so that nested thread pools (boards, pages,
+        # and comment chunks) keep to max_workers requests in flight
+        self._request_slots = threading.BoundedSemaphore(max_workers)
+        self.pool_size = pool_size or max_workers
+        self.timeout = timeout
+
+        if incremental and not snapshot_path:
+            raise ValueError("Incremental builds require a snapshot_path.")
+
+        if streaming and snapshot_path:
+            raise ValueError("Streaming mode does not support snapshots.")
+
+        if not download and (streaming or snapshot_path):
+            raise ValueError(
+                "Streaming mode and snapshots require downloading the project."
+            )
+
+        self.incremental = incremental
+        self.streaming = streaming
+        self.cache = cache
+        self.comment_policy = comment_policy or CommentPolicy()
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.projects = projects or DEFAULT_PROJECTS
+        self.api_url = api_url or os.getenv("BIOCYPHER_GITHUB_API_URL", GITHUB_API_URL)
+        self.instrumentation = instrumentation or Instrumentation()
+        self.decoder = JSONDecoder(json_backend or os.getenv("BIOCYPHER_GITHUB_JSON"))
+        self._projects = [
+            {"organization": organization, "number": number}
+            for organization, number in self.projects
+        ]
+        self._item_projects = {}
+        self._snapshot = ProjectSnapshot.load(snapshot_path) if snapshot_path else None
+
+        self._graph = GraphRegistry()
+        self._removed_nodes = []
+        self._removed_edges = []
+        self._changed_issues = None
+        self._server_time = None
+        self._server_filtering = True
 
         self._setup_api()
-        self._download_data()
-        self._process_nodes()
-        self._process_edges()
+
+        if not download:
+            # Only queries and mutations; project ids and fields are fetched
+            # when first needed
+            self._items = {}
+            self._nodes = []
+            self._edges = []
+            return
+
+        if streaming:
+            # Data is downloaded while get_nodes() / get_edges() are consumed
+            self._stream_iterator = None
+            self._stream_buffers = {True: deque(), False: deque()}
+            self._items = {}
+            return
+
+        with self.instrumentation.stage("download"):
+            self._download_data()
+        self._process_data()
+
+        if self._snapshot is not None:
+            self._update_snapshot()
 
     def get_nodes(self) -> list:
         """
         Returns a list of node tuples for node types specified in the
-        adapter constructor.
+        adapter constructor. In streaming mode, returns a generator instead.
 
         Returns:
             List of nodes.
         """
 
+        if self.streaming:
+            return self._consume_stream(nodes=True)
+
         return self._nodes
 
     def get_edges(self):
         """
         Returns a list of edge tuples for edge types specified in the
-        adapter constructor.
+        adapter constructor. In streaming mode, returns a generator instead.
         """
 
+        if self.streaming:
+            return self._consume_stream(nodes=False)
+
         return self._edges
 
+    def get_nodes_and_edges(self):
+        """
+        Returns a generator of node and edge tuples. In streaming mode, they
+        are yielded in the order they are generated while the project is
+        downloaded, without buffering the edges until the nodes are consumed.
+        Use either this method or `get_nodes` and `get_edges`, not both.
+        """
+
+        if self.streaming:
+            return self._stream()
+
+        return chain(self._nodes, self._edges)
+
+    def get_removed_nodes(self) -> list:
+        """
+        Returns the ids of nodes that were emitted by the previous build but
+        no longer exist. Only populated in incremental mode.
+        """
+
+        return self._removed_nodes
+
+    def get_removed_edges(self) -> list:
+        """
+        Returns the (source, target, label) keys of edges that were emitted by
+        the previous build but no longer exist. Only populated in incremental
+        mode.
+        """
+
+        return self._removed_edges
+
+    def get_items(self) -> list:
+        """
+        Returns the downloaded project items as `ProjectItem`s, e.g. to read
+        their field values for scheduling. Empty in streaming mode and
+        without download.
+        """
+
+        return list(self._items.values())
+
+    def get_field_options(self, field_name: str) -> list:
+        """
+        Returns the option names of a single-select field of the first
+        project board, in board order. Empty if the field does not exist.
+
+        Args:
+            field_name: The name of the field, e.g. "Timeslot".
+        """
+
+        project = self._projects[0]
+
+        if "field_index" not in project:
+            self._resolve_projects()
+
+        field = project["field_index"].get(field_name)
+
+        return list(field[1]) if field else []
+
     def _get_token(self):
         token = os.getenv("BIOCYPHER_GITHUB_PROJECT_TOKEN")
         if not token:
@@ -108,35 +538,461 @@ class GitHubAdapter:
         """
 
         # Set the API endpoint and headers
-        self.url = "https://api.github.com/graphql"
-        self.headers = {"Authorization": f"Bearer {self._get_token()}"}
+        self.url = self.api_url
+        self.headers = {
+            "Authorization": f"Bearer {self._get_token()}",
+            "Accept-Encoding": "gzip",
+        }
+
+        # Share one keep-alive connection pool between all requests
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        http_adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.pool_size,
+        )
+        self._session.mount("https://", http_adapter)
+        self._session.mount("http://", http_adapter)
+
+    def _post(self, data: dict) -> requests.Response:
+        """
+        Send a request to the GitHub GraphQL API through the shared session,
+        paced and retried by the rate limiter. At most `max_workers` requests
+        are in flight at the same time, across all threads of the adapter.
+
+        Args:
+            data: The request payload, containing the query.
+
+        Returns:
+            The API response.
+        """
+
+        def post():
+            with self._request_slots:
+                return self._session.post(self.url, json=data, timeout=self.timeout)
+
+        return self.rate_limiter.call(post)
+
+    def _query(self, data: dict, query_type: str = None, items: bool = False) -> dict:
+        """
+        Send a request to the GitHub GraphQL API and parse the response,
+        serving it from the response cache if possible. Only successful
+        responses of query types with a TTL are cached; mutations (no query
+        type) always go to the API, and fail if the cache is offline.
+
+        Args:
+            data: The request payload, containing the query.
+            query_type: Kind of query (e.g. "fields", "comments"), used to
+                select the cache TTL.
+            items: Whether the response holds full project items, which are
+                then parsed into `ProjectItem`s while decoding.
+
+        Returns:
+            The parsed response JSON.
+        """
+
+        start = time.perf_counter()
+        cacheable = self.cache is not None and self.cache.is_cacheable(query_type)
+        decode = self.decoder.decode_items if items else self.decoder.decode
+
+        if cacheable:
+            text = self.cache.get(data, query_type, self.url)
+            if text is not None:
+                parse_start = time.perf_counter()
+                response_json = decode(text)
+                self.instrumentation.add_span(
+                    query_type,
+                    start,
+                    cached=True,
+                    response_bytes=len(text),
+                    parse_time=round(time.perf_counter() - parse_start, 4),
+                )
+                return response_json
+
+        response = self._post(data)
+        request = response.request
+        span = {
+            "status": response.status_code,
+            "request_bytes": len(request.body or b"") if request else 0,
+            "response_bytes": len(response.content),
+        }
+
+        # Fail with the HTTP error once retries are exhausted
+        if not response.ok:
+            self.instrumentation.add_span(query_type, start, **span)
+        response.raise_for_status()
+
+        if self._server_time is None:
+            self._server_time = _parse_http_date(response.headers.get("Date"))
+
+        # Decode the raw bytes; response.text would decode them into a str
+        # first, guessing the encoding
+        parse_start = time.perf_counter()
+        response_json = decode(response.content)
+        span["parse_time"] = round(time.perf_counter() - parse_start, 4)
+
+        if cacheable and "errors" not in response_json:
+            self.cache.set(data, query_type, response.content.decode("utf-8"), self.url)
+
+        rate_limit = (response_json.get("data") or {}).get("rateLimit")
+        if rate_limit:
+            self.rate_limiter.update(rate_limit)
+            span["cost"] = rate_limit.get("cost")
+
+        self.instrumentation.add_span(query_type, start, **span)
+
+        return response_json
+
+    def _get_data(self, response_json: dict, description: str, partial=False):
+        """
+        Get the data of a query response.
+
+        Args:
+            response_json: The parsed response.
+            description: What was queried, for the error message.
+            partial: Whether to accept partial data with errors, e.g. when
+                some of several requested nodes no longer exist. The errors
+                are logged.
+
+        Raises:
+            GitHubAPIError: If the response has no data, or has errors and
+                partial data is not accepted.
+        """
+
+        data = response_json.get("data")
+        errors = response_json.get("errors")
+
+        if not data or (errors and not partial):
+            raise GitHubAPIError(
+                f"Failed to query {description}",
+                errors or [{"message": response_json.get("message")}],
+            )
+
+        if errors:
+            logger.warning(f"Errors while querying {description}: {errors}")
+
+        return data
+
+    def close(self):
+        """
+        Close the HTTP session and its pooled connections.
+        """
+
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
 
     def _download_data(self):
         """
-        Download data from the GitHub project page using the API.
+        Download data from the GitHub project pages using the API.
+        """
+
+        if self.incremental and not self._snapshot.is_empty:
+            self._changed_issues = set()
+
+        # Server time of the first response, see _query()
+        started = datetime.now(timezone.utc)
+        self._server_time = None
+
+        # Boards are independent of each other
+        items_per_project = self._run_concurrently(
+            [
+                lambda project=project: self._download_project(project)
+                for project in self._projects
+            ]
+        )
+
+        self._items = {}
+        for project, items in zip(self._projects, items_per_project):
+            self._add_project_items(project, items, self._items)
+
+        self._set_primary_project()
+
+        if self._snapshot is not None:
+            # Items are immutable once parsed, so they can be shared
+            self._snapshot.items = dict(self._items)
+
+            # Items edited while the board is listed can have timestamps below
+            # the newest one seen, so the mark is the start of the download
+            start = min(filter(None, (started, self._server_time)))
+            self._snapshot.high_water_mark = (start - HIGH_WATER_MARK_WINDOW).strftime(
+                "%Y-%m-%dT%H:%M:%SZ"
+            )
+
+    def _download_project(self, project: dict) -> dict:
+        """
+        Download the id, fields, and items of one project board.
+
+        Args:
+            project: Project state, holding at least the organization and
+                project number. Its id, fields, and field index are added.
+
+        Returns:
+            Dictionary mapping issue key to item.
         """
 
         # Get the project ID
-        self._id = self._get_project_id(self.url, self.headers)
+        project["id"] = self._get_project_id(
+            self.url, self.headers, project["organization"], project["number"]
+        )
+
+        if self._changed_issues is not None:
+            get_items = self._get_changed_project_items
+        else:
+            get_items = self._get_project_items
+
+        # Get the project fields and items; both only depend on the ID
+        project["fields"], items = self._run_concurrently(
+            [
+                lambda: self._get_project_fields(self.url, self.headers, project["id"]),
+                lambda: get_items(self.url, self.headers, project["id"]),
+            ]
+        )
+        project["field_index"] = self._index_fields(project["fields"])
+
+        return items
+
+    def _add_project_items(self, project: dict, items: dict, merged: dict):
+        """
+        Add the items of a project board to the merged items, skipping issues
+        that are already on a previous board.
+        """
+
+        for key, item in items.items():
+            if key in merged:
+                logger.debug(f"Issue {key} is on several boards, keeping the first.")
+                continue
+
+            merged[key] = item
+            self._item_projects[item.id] = project
+
+    def _set_primary_project(self):
+        """
+        Expose the id and fields of the first project board, which are used
+        for items not found on any board.
+        """
 
-        # Get the project fields
-        self._fields = self._get_project_fields(self.url, self.headers, self._id)
+        primary = self._projects[0]
+        self._id = primary["id"]
+        self._fields = primary["fields"]
+        self._field_index = primary["field_index"]
 
-        # Get the project items
-        self._items = self._get_project_items(self.url, self.headers, self._id)
+    def _get_item_project(self, item_id: str) -> dict:
+        """
+        Get the project board an item belongs to, defaulting to the first.
+        """
+
+        return self._item_projects.get(item_id, self._projects[0])
+
+    def _update_snapshot(self):
+        """
+        Compare the generated nodes and edges to the previous build, reduce
+        them to the changes in incremental mode, and save the snapshot.
+        """
+
+        nodes, edges, removed_nodes, removed_edges = self._snapshot.diff(
+            self._nodes, self._edges
+        )
+
+        if self.incremental:
+            logger.info(
+                f"Incremental build: {len(nodes)} changed nodes, "
+                f"{len(edges)} changed edges, {len(removed_nodes)} removed "
+                f"nodes, {len(removed_edges)} removed edges."
+            )
+            self._nodes = nodes
+            self._edges = edges
+            self._removed_nodes = removed_nodes
+            self._removed_edges = removed_edges
+
+        self._snapshot.save()
+
+    def _run_concurrently(self, calls: list) -> list:
+        """
+        Run independent API calls, overlapping them in a thread pool of at
+        most `max_workers` threads unless the adapter is in sequential mode.
+        Calls may run concurrently themselves; the number of requests in
+        flight is limited in `_post()`.
+
+        Args:
+            calls: List of callables without arguments.
+
+        Returns:
+            List of the results of the calls, in the order of the calls.
+        """
+
+        if not self.concurrent or len(calls) < 2:
+            return [call() for call in calls]
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(calls))
+        ) as executor:
+            futures = [executor.submit(call) for call in calls]
+            return [future.result() for future in futures]
+
+    def find_items(self, fields: dict) -> list:
+        """
+        Find the cards whose project fields have the given values, without
+        downloading the project. Only the item ids and the values of the
+        given fields are requested, and where the API supports it, the items
+        are also filtered on the server. The ids can be passed straight to
+        `mutate_fields()`.
+
+        Args:
+            fields: Dictionary mapping field names to a value or a list of
+                accepted values, e.g. `{"Status": "Scheduled"}`. Values are
+                option names, texts, or iteration titles.
+
+        Returns:
+            List of the ids of the matching items of all project boards.
+        """
+
+        accepted = {
+            name: {value} if isinstance(value, str) else set(value)
+            for name, value in fields.items()
+        }
+
+        self._resolve_projects()
+
+        ids_per_project = self._run_concurrently(
+            [
+                lambda project=project: self._find_project_items(
+                    project["id"], accepted
+                )
+                for project in self._projects
+            ]
+        )
+
+        item_ids = []
+        for project, ids in zip(self._projects, ids_per_project):
+            for item_id in ids:
+                self._item_projects[item_id] = project
+            item_ids.extend(ids)
+
+        logger.info(f"Found {len(item_ids)} items matching {fields}.")
+
+        return item_ids
+
+    def _find_project_items(self, id_: str, accepted: dict) -> list:
+        """
+        Page through the items of a project with a minimal selection and
+        return the ids of the items whose field values are accepted.
+        """
+
+        names = list(accepted)
+        selection = "".join(
+            FIELD_VALUE_BY_NAME_SELECTION % (f"f{index}", json.dumps(name))
+            for index, name in enumerate(names)
+        )
+        search = self._get_search_query(accepted)
+
+        item_ids = []
+        cursor = None
+
+        while True:
+            server_filtering = search is not None and self._server_filtering
+            data = {
+                "query": ITEM_FILTER_QUERY
+                % (
+                    ", $query: String" if server_filtering else "",
+                    ", query: $query" if server_filtering else "",
+                    indent(selection, " " * 10),
+                    RATE_LIMIT_SELECTION,
+                ),
+                "variables": {"id": id_, "first": MAX_PAGE_SIZE, "after": cursor},
+            }
+            if server_filtering:
+                data["variables"]["query"] = search
+
+            response_json = self._query(data, "listing")
+
+            if server_filtering and "errors" in response_json:
+                # Filtering items is not supported by every API version
+                logger.info(
+                    "Server-side item filtering unavailable, filtering locally."
+                )
+                self._server_filtering = False
+                continue
+
+            items = self._get_data(response_json, "project items")["node"]["items"]
+
+            for node in items["nodes"]:
+                if not node:
+                    continue
+                values = [
+                    _get_field_value(node.get(f"f{index}"))
+                    for index in range(len(names))
+                ]
+                if all(value in accepted[name] for name, value in zip(names, values)):
+                    item_ids.append(node["id"])
+
+            page_info = items["pageInfo"]
+            if not page_info.get("hasNextPage"):
+                return item_ids
+            cursor = page_info.get("endCursor")
+
+    def _get_search_query(self, accepted: dict) -> str:
+        """
+        Build the project filter query, e.g. `status:Scheduled`, for the
+        server-side filtering of `find_items()`. Returns None if a field name
+        or value cannot be expressed in the filter syntax.
+        """
+
+        terms = []
+        for name, values in accepted.items():
+            if not name.isalnum() or not all(
+                isinstance(value, str) for value in values
+            ):
+                return None
+            terms.append(
+                name.lower()
+                + ":"
+                + ",".join(
+                    json.dumps(value) if not value.isalnum() else value
+                    for value in sorted(values)
+                )
+            )
+
+        return " ".join(terms)
+
+    def _resolve_projects(self):
+        """
+        Get the ids and fields of the project boards that have not been
+        downloaded, e.g. for queries and mutations without a full download.
+        """
+
+        missing = [
+            project for project in self._projects if "field_index" not in project
+        ]
+
+        def resolve(project):
+            project["id"] = self._get_project_id(
+                self.url, self.headers, project["organization"], project["number"]
+            )
+            project["fields"] = self._get_project_fields(
+                self.url, self.headers, project["id"]
+            )
+            project["field_index"] = self._index_fields(project["fields"])
+
+        self._run_concurrently(
+            [lambda project=project: resolve(project) for project in missing]
+        )
+
+        if missing:
+            self._set_primary_project()
 
     def mutate_column(self, item_id: str, new_column: str):
         """
         Move a card to a new column.
         """
 
-        # find the id of the status field and the column
-        for field in self._fields:
-            if field.get("name") == "Status":
-                field_id = field.get("id")
-                for option in field.get("options"):
-                    if option.get("name") == new_column:
-                        field_value = option.get("id")
+        # find the id of the status field and the option
+        project = self._get_item_project(item_id)
+        field_id, field_value = self._get_option_ids("Status", new_column, project)
 
         query = """
           mutation {
@@ -147,7 +1003,7 @@ class GitHubAdapter:
         """ % (
             field_id,
             item_id,
-            self._id,
+            project["id"],
             field_value,
         )
 
@@ -155,32 +1011,19 @@ class GitHubAdapter:
         data = {"query": query}
 
         # Send the API request
-        response = requests.post(self.url, headers=self.headers, json=data)
-
-        # Parse the response JSON
-        response_json = json.loads(response.text)
+        response_json = self._query(data)
 
-        # Extract the data from the response JSON
-        data = response_json.get("data")
+        # Fail on GraphQL errors, e.g. an unknown option or missing permissions
+        self._get_data(response_json, "mutate_column")
 
     def mutate_timeslot(self, item_id: str, new_timeslot: str):
         """
         Update the timeslot value of a card.
         """
 
-        field_value = None
-
-        # find the id of the status field and the column
-        for field in self._fields:
-            if field.get("name") == "Timeslot":
-                field_id = field.get("id")
-                for option in field.get("options"):
-                    if option.get("name") == new_timeslot:
-                        field_value = option.get("id")
-
-        if not field_value:
-            logger.warning(f"Could not find {new_timeslot} in field options.")
-            return
+        # find the id of the timeslot field and the option
+        project = self._get_item_project(item_id)
+        field_id, field_value = self._get_option_ids("Timeslot", new_timeslot, project)
 
         query = """
           mutation {
@@ -191,7 +1034,7 @@ class GitHubAdapter:
         """ % (
             field_id,
             item_id,
-            self._id,
+            project["id"],
             field_value,
         )
 
@@ -199,26 +1042,19 @@ class GitHubAdapter:
         data = {"query": query}
 
         # Send the API request
-        response = requests.post(self.url, headers=self.headers, json=data)
-
-        # Parse the response JSON
-        response_json = json.loads(response.text)
+        response_json = self._query(data)
 
-        # Extract the data from the response JSON
-        data = response_json.get("data")
+        # Fail on GraphQL errors, e.g. an unknown option or missing permissions
+        self._get_data(response_json, "mutate_timeslot")
 
     def mutate_duration(self, item_id: str, new_duration: str):
         """
         Update the duration of an event (card).
         """
 
-        # find the id of the status field and the column
-        for field in self._fields:
-            if field.get("name") == "Duration":
-                field_id = field.get("id")
-                for option in field.get("options"):
-                    if option.get("name") == new_duration:
-                        field_value = option.get("id")
+        # find the id of the duration field and the option
+        project = self._get_item_project(item_id)
+        field_id, field_value = self._get_option_ids("Duration", new_duration, project)
 
         query = """
           mutation {
@@ -229,7 +1065,7 @@ class GitHubAdapter:
         """ % (
             field_id,
             item_id,
-            self._id,
+            project["id"],
             field_value,
         )
 
@@ -237,161 +1073,221 @@ class GitHubAdapter:
         data = {"query": query}
 
         # Send the API request
-        response = requests.post(self.url, headers=self.headers, json=data)
+        response_json = self._query(data)
 
-        # Parse the response JSON
-        response_json = json.loads(response.text)
+        # Fail on GraphQL errors, e.g. an unknown option or missing permissions
+        self._get_data(response_json, "mutate_duration")
 
-        # Extract the data from the response JSON
-        data = response_json.get("data")
+    def mutate_fields(
+        self, changes: list, chunk_size: int = 50, dry_run: bool = False
+    ) -> dict:
+        """
+        Update single-select field values of many cards at once. The changes
+        are packed into GraphQL documents of up to `chunk_size` aliased
+        mutations each, which are sent one after another. If a request
+        fails, the changes of its chunk are reported as failed and the
+        remaining chunks are still sent.
 
-    def _get_project_id(self, url: str, headers: dict) -> str:
-        query = """
-                query{
-                    organization(login: "biocypher"){
-                        projectV2(number: 6) {
-                            id
-                        }
-                    }
-                }
-                """
+        Args:
+            changes: List of (item id, field name, option name) tuples, e.g.
+                `(item_id, "Status", "Closed / Parked")`.
+            chunk_size: Maximum number of mutations per request.
+            dry_run: Whether to only resolve and report the changes without
+                sending any mutation.
 
-        # Send the API request
-        response = requests.post(url, headers=headers, json={"query": query})
+        Returns:
+            Dictionary with the list of resolved changes under "planned", the
+            changes applied by the API under "updated", and (change, reason)
+            tuples of changes that could not be applied under "failed".
 
-        if response.status_code == 200:
-            response_data = response.json()
-            # Check for errors in the response data
-            if "errors" in response_data:
-                print("Errors in the response:", response_data["errors"])
-            else:
-                project_id = response_data["data"]["organization"]["projectV2"]["id"]
-                return project_id
-        else:
-            print("Failed to fetch project ID, status code:", response.status_code)
+        Raises:
+            ValueError: If `chunk_size` is less than 1.
+        """
 
-    def _get_project_fields(self, url: str, headers: dict, id_: str) -> dict:
-        query = (
-            """
-                query{
-                    node(id: "%s") {
-                        ... on ProjectV2 {
-                            fields(first: 20) {
-                                nodes {
-                                    ... on ProjectV2Field {
-                                        id
-                                        name
-                                    }
-                                    ... on ProjectV2SingleSelectField {
-                                        id
-                                        name
-                                        options {
-                                            id
-                                            name
-                                        }
-                                    }
-                                    ... on ProjectV2IterationField {
-                                      id
-                                      name
-                                      configuration {
-                                        iterations {
-                                          startDate
-                                          id
-                                        }
-                                      }
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-                """
-            % id_
-        )
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1.")
 
-        # Set the request data as a dictionary
-        data = {"query": query}
+        result = {"planned": [], "updated": [], "failed": []}
+        mutations = []
 
-        # Send the API request
-        response = requests.post(url, headers=headers, json=data)
+        for change in changes:
+            item_id, field_name, option_name = change
 
-        # Parse the response JSON
-        response_json = json.loads(response.text)
+            project = self._get_item_project(item_id)
 
-        # Extract the data from the response JSON
-        data = response_json.get("data")
-        return data.get("node").get("fields").get("nodes")
+            try:
+                field_id, option_id = self._get_option_ids(
+                    field_name, option_name, project
+                )
+            except ValueError as e:
+                result["failed"].append((change, str(e)))
+                continue
 
-    def _get_project_items(self, url: str, headers: dict, id_: str) -> dict:
-        nodes = []
+            result["planned"].append(change)
+            mutations.append((change, field_id, item_id, project["id"], option_id))
+
+        if dry_run:
+            logger.info(
+                f"Dry run: would apply {len(mutations)} field updates in "
+                f"{-(-len(mutations) // chunk_size)} requests."
+            )
+            return result
+
+        for start in range(0, len(mutations), chunk_size):
+            chunk = mutations[start : start + chunk_size]
+
+            query = "mutation {%s\n}" % "".join(
+                """
+                  m%s: updateProjectV2ItemFieldValue (input: {fieldId: "%s", itemId: "%s", projectId: "%s", value: {singleSelectOptionId: "%s"} }) {
+                    clientMutationId
+                  }"""
+                % (index, field_id, item_id, project_id, option_id)
+                for index, (_, field_id, item_id, project_id, option_id) in enumerate(
+                    chunk
+                )
+            )
+
+            try:
+                response_json = self._query({"query": query})
+            except (requests.RequestException, GitHubAPIError) as e:
+                logger.warning(f"Field update request failed: {e}")
+                result["failed"].extend((change, str(e)) for change, *_ in chunk)
+                continue
+
+            # Map errors back to the aliased mutation they belong to
+            errors = {}
+            for error in response_json.get("errors", []):
+                alias = (error.get("path") or [None])[0]
+                errors[alias] = error.get("message")
+
+            data = response_json.get("data") or {}
+
+            for index, (change, *_) in enumerate(chunk):
+                alias = f"m{index}"
+                if alias in errors or data.get(alias) is None:
+                    reason = (
+                        errors.get(alias)
+                        or errors.get(None)
+                        or (response_json.get("message", "No response for mutation."))
+                    )
+                    result["failed"].append((change, reason))
+                else:
+                    result["updated"].append(change)
+
+        if result["failed"]:
+            logger.warning(f"{len(result['failed'])} field updates failed.")
+
+        return result
+
+    def _index_fields(self, fields: list) -> dict:
+        """
+        Build the lookup index of project fields, mapping field name to
+        field id and option name to option id.
+        """
+
+        return {
+            field["name"]: (
+                field["id"],
+                {option["name"]: option["id"] for option in field.get("options", [])},
+            )
+            for field in fields
+            if field
+        }
+
+    def _get_option_ids(
+        self, field_name: str, option_name: str, project: dict = None
+    ) -> tuple:
+        """
+        Find the ids of a single-select field and one of its options.
+
+        Args:
+            field_name: The name of the field.
+            option_name: The name of the option.
+            project: The project board of the field. Defaults to the first.
+
+        Returns:
+            Tuple of field id and option id.
+
+        Raises:
+            ValueError: If the field or the option does not exist.
+        """
+
+        project = project or self._projects[0]
+
+        if "field_index" not in project:
+            self._resolve_projects()
+
+        field_index = project["field_index"]
+
+        if field_name not in field_index:
+            raise ValueError(
+                f"Unknown field {field_name}. Available fields: "
+                f"{', '.join(field_index)}."
+            )
+
+        field_id, options = field_index[field_name]
+
+        if option_name not in options:
+            raise ValueError(
+                f"Unknown option {option_name} of field {field_name}. "
+                f"Available options: {', '.join(options)}."
+            )
 
+        return field_id, options[option_name]
+
+    def _get_project_id(
+        self,
+        url: str,
+        headers: dict,
+        organization: str = "biocypher",
+        number: int = 6,
+    ) -> str:
+        data = {
+            "query": PROJECT_ID_QUERY,
+            "variables": {"organization": organization, "number": number},
+        }
+
+        # Send the API request
+        response_data = self._query(data, "project_id")
+
+        data = self._get_data(response_data, f"project {organization}/{number}")
+
+        return data["organization"]["projectV2"]["id"]
+
+    def _get_project_fields(self, url: str, headers: dict, id_: str) -> dict:
         query = (
             """
                 query{
-                  node(id: "%s") {
-                    ... on ProjectV2 {
-                      items(first: 20) {
-                        nodes {
-                          id
-                          fieldValues(first: 100) {
-                            nodes {
-                              ... on ProjectV2ItemFieldTextValue {
-                                text
-                                field {
-                                  ... on ProjectV2FieldCommon {
-                                    name
-                                  }
-                                }
-                              }
-                              ... on ProjectV2ItemFieldIterationValue {
-                                title
-                                iterationId
-                              }
-                              ... on ProjectV2ItemFieldDateValue {
-                                date
-                                field {
-                                  ... on ProjectV2FieldCommon {
-                                    name
-                                  }
-                                }
-                              }
-                              ... on ProjectV2ItemFieldSingleSelectValue {
-                                name
-                                field {
-                                  ... on ProjectV2FieldCommon {
-                                    name
-                                  }
-                                }
-                              }
-                            }
-                          }
-                          content {
-                            ... on Issue {
-                              title
-                              body
-                              number
-                              labels(first: 10) {
-                                edges {
-                                  node {
-                                    name
-                                  }
-                                }
-                              }
-                              assignees(first: 10) {
+                    node(id: "%s") {
+                        ... on ProjectV2 {
+                            fields(first: 20) {
                                 nodes {
-                                  login
+                                    ... on ProjectV2Field {
+                                        id
+                                        name
+                                    }
+                                    ... on ProjectV2SingleSelectField {
+                                        id
+                                        name
+                                        options {
+                                            id
+                                            name
+                                        }
+                                    }
+                                    ... on ProjectV2IterationField {
+                                      id
+                                      name
+                                      configuration {
+                                        iterations {
+                                          startDate
+                                          id
+                                        }
+                                      }
+                                    }
                                 }
-                              }
                             }
-                          }
                         }
-                        pageInfo {
-                          endCursor
-                          hasNextPage
-                        }
-                      }
                     }
-                  }
                 }
                 """
             % id_
@@ -401,117 +1297,282 @@ class GitHubAdapter:
         data = {"query": query}
 
         # Send the API request
-        response = requests.post(url, headers=headers, json=data)
+        response_json = self._query(data, "fields")
+
+        # Extract the data from the response JSON
+        data = self._get_data(response_json, "project fields")
+        return data.get("node").get("fields").get("nodes")
 
-        # Parse the response JSON
-        response_json = json.loads(response.text)
+    def _get_project_items(self, url: str, headers: dict, id_: str) -> dict:
+        """
+        Get all items of a project that are linked to an issue.
+
+        Returns:
+            Dictionary mapping issue key to `ProjectItem`.
+        """
+
+        node_dict = {}
+
+        for page in self._iter_project_item_pages(id_):
+            for item in page:
+                node_dict[item.issue_key] = item
+
+        return node_dict
+
+    def _get_issue_key(self, content: dict) -> str:
+        """
+        Get the repository-qualified key of an issue, e.g.
+        "biocypher/project-planning#12".
+        """
+
+        return f"{content['repository']['nameWithOwner']}#{content['number']}"
 
-        nodes.extend(response_json.get("data").get("node").get("items").get("nodes"))
+    def _iter_project_item_pages(self, id_: str):
+        """
+        Page through the project items. Unless the adapter is in sequential
+        mode, the next page is requested in the background while the current
+        one is being consumed.
+
+        Args:
+            id_: The project ID.
+
+        Yields:
+            Lists of `ProjectItem`s, one per page. Items not linked to an
+            issue are left out.
+        """
+
+        executor = ThreadPoolExecutor(max_workers=1) if self.concurrent else None
+
+        try:
+            page = self._get_project_items_page(id_)
+
+            while True:
+                nodes, page_info = page
+
+                if not page_info.get("hasNextPage"):
+                    yield nodes
+                    return
+
+                if executor:
+                    page = executor.submit(
+                        self._get_project_items_page, id_, page_info.get("endCursor")
+                    )
+                    yield nodes
+                    page = page.result()
+                else:
+                    yield nodes
+                    page = self._get_project_items_page(id_, page_info.get("endCursor"))
+        finally:
+            if executor:
+                executor.shutdown(wait=False)
+
+    def _get_project_items_page(self, id_: str, cursor: str = None) -> tuple:
+        """
+        Get one page of project items.
+
+        Args:
+            id_: The project ID.
+            cursor: The end cursor of the previous page, if any.
+
+        Returns:
+            Tuple of the list of `ProjectItem`s and the page info.
+        """
+
+        # Set the request data as a dictionary
+        data = {
+            "query": ITEMS_PAGE_QUERY
+            % (indent(self._item_selection, " " * 10), RATE_LIMIT_SELECTION),
+            "variables": {"id": id_, "first": self._page_size, "after": cursor},
+        }
+
+        # Send the API request
+        response_json = self._query(data, "items", items=True)
 
         # Extract the data from the response JSON
-        pageInfo = response_json.get("data").get("node").get("items").get("pageInfo")
-
-        while pageInfo.get("hasNextPage"):
-            next_query = """
-                            query{
-                              node(id: "%s") {
-                                ... on ProjectV2 {
-                                  items(first: 20, after: "%s") {
-                                    nodes {
-                                      id
-                                      fieldValues(first: 100) {
-                                        nodes {
-                                          ... on ProjectV2ItemFieldTextValue {
-                                            text
-                                            field {
-                                              ... on ProjectV2FieldCommon {
-                                                name
-                                              }
-                                            }
-                                          }
-                                          ... on ProjectV2ItemFieldIterationValue {
-                                            title
-                                            iterationId
-                                          }
-                                          ... on ProjectV2ItemFieldDateValue {
-                                            date
-                                            field {
-                                              ... on ProjectV2FieldCommon {
-                                                name
-                                              }
-                                            }
-                                          }
-                                          ... on ProjectV2ItemFieldSingleSelectValue {
-                                            name
-                                            field {
-                                              ... on ProjectV2FieldCommon {
-                                                name
-                                              }
-                                            }
-                                          }
-                                        }
-                                      }
-                                      content {
-                                        ... on Issue {
-                                          title
-                                          body
-                                          number
-                                          labels(first: 10) {
-                                            edges {
-                                              node {
-                                                name
-                                              }
-                                            }
-                                          assignees(first: 10) {
-                                            nodes {
-                                              login
-                                            }
-                                          }
-                                        }
-                                      }
-                                    }
-                                    pageInfo {
-                                      endCursor
-                                      hasNextPage
-                                    }
-                                  }
-                                }
-                              }
-                            }
-                            """ % (
-                id_,
-                pageInfo.get("endCursor"),
-            )
+        items = self._get_data(response_json, "project items")["node"]["items"]
 
-            # Set the request data as a dictionary
-            data = {"query": next_query}
+        return items.get("nodes"), items.get("pageInfo")
 
-            # Send the API request
-            response = requests.post(url, headers=headers, json=data)
+    def _build_item_selection(self) -> str:
+        """
+        Build the GraphQL selection of a project item, requesting only the
+        field values and issue content needed for the configured node fields.
+        The item id, modification times and issue number are always
+        requested; the Title field value identifies items and is always
+        requested as well.
+        """
 
-            # Parse the response JSON
-            response_json = json.loads(response.text)
+        field_values = [TEXT_VALUE_FRAGMENT]
 
-            nodes.extend(
-                response_json.get("data").get("node").get("items").get("nodes")
-            )
+        if self._requested(
+            GitHubAdapterProjectField.STATUS,
+            GitHubAdapterProjectField.SIZE,
+            GitHubAdapterProjectField.PRIORITY,
+            GitHubAdapterNodeType.DATA_TYPE,
+            GitHubAdapterEdgeType.USES,
+        ):
+            field_values.append(SINGLE_SELECT_VALUE_FRAGMENT)
 
-            # Extract the data from the response JSON
-            pageInfo = (
-                response_json.get("data").get("node").get("items").get("pageInfo")
-            )
+        if self._requested(*ITERATION_SELECTIONS):
+            field_values.append(ITERATION_VALUE_FRAGMENT)
+
+        content = ["\nnumber", "\nupdatedAt", REPOSITORY_SELECTION]
+
+        if self._requested(
+            GitHubAdapterProjectField.DESCRIPTION, *DEPENDENCY_SELECTIONS
+        ):
+            content.append("\nbody")
+
+        if self._requested(GitHubAdapterProjectField.LABELS):
+            content.append(LABELS_SELECTION)
+
+        if self._requested(*ASSIGNEE_SELECTIONS):
+            content.append(ASSIGNEES_SELECTION)
+
+        return ITEM_SELECTION % (
+            FIELD_VALUES_LIMIT,
+            indent("".join(field_values), " " * 4),
+            indent("".join(content), " " * 4),
+        )
+
+    def _get_items_page_size(self) -> int:
+        """
+        Get the largest page size for item queries that stays within the
+        node limit of the GitHub API, given the nested connections of the
+        item selection. The rate limit cost of a query is one point per 100
+        connections requested, so the cost per item is the same for all page
+        sizes and the largest page needs the fewest round trips.
+        """
+
+        nodes_per_item = 1 + FIELD_VALUES_LIMIT
+        connections_per_item = 1
+
+        if self._requested(GitHubAdapterProjectField.LABELS):
+            nodes_per_item += LABELS_LIMIT
+            connections_per_item += 1
+
+        if self._requested(*ASSIGNEE_SELECTIONS):
+            nodes_per_item += ASSIGNEES_LIMIT
+            connections_per_item += 1
+
+        page_size = min(MAX_PAGE_SIZE, NODE_LIMIT // nodes_per_item)
+
+        logger.debug(
+            f"Fetching {page_size} items per page, estimated cost "
+            f"{-(-(1 + connections_per_item * page_size) // 100)} points per page."
+        )
+
+        return page_size
+
+    def _get_changed_project_items(self, url: str, headers: dict, id_: str) -> dict:
+        """
+        Get the project items based on the snapshot, re-fetching only items
+        whose card or issue changed since the snapshot's high-water mark.
+        Items no longer on the board are dropped.
+
+        Returns:
+            Dictionary mapping issue key to item, as `_get_project_items`.
+        """
+
+        mark = self._snapshot.high_water_mark
+        listing = []
+        cursor = None
+
+        # List all items with their modification times only
+        while True:
+            data = {
+                "query": ITEMS_PAGE_QUERY
+                % (indent(ITEM_LISTING_SELECTION, " " * 10), RATE_LIMIT_SELECTION),
+                "variables": {"id": id_, "first": MAX_PAGE_SIZE, "after": cursor},
+            }
+
+            response_json = self._query(data, "listing")
+
+            items = self._get_data(response_json, "project items")["node"]["items"]
+            listing.extend(items.get("nodes"))
+
+            if not items.get("pageInfo").get("hasNextPage"):
+                break
+            cursor = items.get("pageInfo").get("endCursor")
 
         node_dict = {}
+        changed_ids = []
+        changed_issues = set()
 
-        for node in nodes:
-            if not node["content"].get("number"):
+        for node in listing:
+            if not (node.get("content") or {}).get("number"):
                 continue
 
-            issue_number = node["content"]["number"]
-            node_dict[issue_number] = node
+            key = self._get_issue_key(node["content"])
+            previous = self._snapshot.items.get(key)
+            if (
+                previous is None
+                or previous.id != node["id"]
+                or node["updatedAt"] >= mark
+                or node["content"]["updatedAt"] >= mark
+            ):
+                changed_ids.append(node["id"])
+                changed_issues.add(key)
+            else:
+                node_dict[key] = previous
+
+        # Fetch the full content of changed items only
+        chunks = [
+            changed_ids[start : start + MAX_PAGE_SIZE]
+            for start in range(0, len(changed_ids), MAX_PAGE_SIZE)
+        ]
+        for nodes in self._run_concurrently(
+            [lambda chunk=chunk: self._get_items_by_id(chunk) for chunk in chunks]
+        ):
+            for item in nodes:
+                node_dict[item.issue_key] = item
+
+        self._changed_issues.update(changed_issues)
+
+        logger.info(
+            f"{len(changed_ids)} of {len(node_dict)} items changed since {mark}."
+        )
 
         return node_dict
 
+    def _get_items_by_id(self, ids: list) -> list:
+        """
+        Get the full content of project items by their node ids.
+
+        Args:
+            ids: Up to 100 project item ids.
+
+        Returns:
+            List of `ProjectItem`s. Items not linked to an issue are left
+            out.
+        """
+
+        data = {
+            "query": ITEMS_BY_ID_QUERY
+            % (indent(self._item_selection, " " * 6), RATE_LIMIT_SELECTION),
+            "variables": {"ids": ids},
+        }
+
+        response_json = self._query(data, "items_by_id", items=True)
+
+        # Items removed in the meantime come back as errors
+        data = self._get_data(response_json, "project items by id", partial=True)
+        return data["nodes"]
+
+    def _process_data(self):
+        """
+        Generate the nodes and edges of the downloaded items, fetching their
+        comments.
+        """
+
+        with self.instrumentation.stage("process nodes"):
+            self._process_nodes()
+        with self.instrumentation.stage("process edges"):
+            self._process_edges()
+
+        self._nodes = self._graph.get_nodes()
+        self._edges = self._graph.get_edges()
+
     def _process_nodes(self):
         """
         Returns a list of node tuples for node types specified in the
@@ -521,214 +1582,474 @@ class GitHubAdapter:
         logger.info("Generating nodes.")
 
         # Fields
-        for field in self._fields:
-            if not field:
-                continue
-            if field["name"] not in [
-                "Status",
-                "Size",
-                "Priority",
-            ]:
-                continue
+        for project in self._projects:
+            for node in self._generate_field_nodes(project["fields"]):
+                self._graph.add(node)
 
-            for option in field["options"]:
-                name = option["name"].lower()
-                type = field["name"].lower()
+        # Retrieve comments for titled issues in batched requests
+        issue_keys = self._get_comment_issue_keys(self._items.values())
+
+        if not self._requested(*COMMENT_SELECTIONS):
+            comments_by_issue = {}
+        elif self._changed_issues is None:
+            comments_by_issue = self._get_comments_batch(issue_keys)
+        else:
+            # Incremental build: reuse comments of unchanged issues
+            comments_by_issue = {
+                issue_key: self._snapshot.comments[issue_key]
+                for issue_key in issue_keys
+                if issue_key not in self._changed_issues
+                and issue_key in self._snapshot.comments
+            }
+            comments_by_issue.update(
+                self._get_comments_batch(
+                    [
+                        issue_key
+                        for issue_key in issue_keys
+                        if issue_key not in comments_by_issue
+                    ]
+                )
+            )
 
-                self._nodes.append((name, type, {}))
+        if self._snapshot is not None:
+            self._snapshot.comments = comments_by_issue
 
         # Individual cards
-        for key, value in self._items.items():
-            # add fields to item
-            fields = [
-                field
-                for field in value.get("fieldValues", {}).get("nodes", [])
-                if field
-            ]
+        for item in self._items.values():
+            comments = comments_by_issue.get(item.issue_key)
+            for element in self._generate_item(item, comments):
+                self._graph.add(element)
+
+        # Edges to fields
+        for item in self._items.values():
+            for element in self._generate_assignees(item):
+                self._graph.add(element)
+
+    def _stream(self):
+        """
+        Download and process the project page by page, without keeping the
+        items in memory. Used in streaming mode.
+
+        Yields:
+            Node and edge tuples, each id only once.
+        """
+
+        seen = set()
+
+        def unseen(element):
+            key = element[0] if len(element) == 3 else element[1:4]
+            if key in seen:
+                return False
+            seen.add(key)
+            return True
+
+        seen_issues = set()
+
+        # Dependencies can point to items on later pages, so they are
+        # generated at the end from a lightweight copy of each item
+        dependencies = self._requested(*DEPENDENCY_SELECTIONS)
+        index = {}
+        uses = []
+
+        logger.info("Streaming nodes and edges.")
+
+        for project in self._projects:
+            project["id"] = self._get_project_id(
+                self.url, self.headers, project["organization"], project["number"]
+            )
+            project["fields"] = self._get_project_fields(
+                self.url, self.headers, project["id"]
+            )
+            project["field_index"] = self._index_fields(project["fields"])
+
+            if project is self._projects[0]:
+                self._set_primary_project()
+
+            yield from filter(unseen, self._generate_field_nodes(project["fields"]))
+
+            for page in self._iter_project_item_pages(project["id"]):
+                items = []
+                for item in page:
+                    # Issues on several boards are only included once
+                    if item.issue_key in seen_issues:
+                        continue
+                    seen_issues.add(item.issue_key)
+
+                    self._item_projects[item.id] = project
+                    items.append(item)
 
-            for field in fields:
-                if field.get("iterationId"):
-                    field_type = "Iteration"
-                    value["Iteration"] = field["title"]
-                    value["Iteration ID"] = field["iterationId"]
+                if self._requested(*COMMENT_SELECTIONS):
+                    comments_by_issue = self._get_comments_batch(
+                        self._get_comment_issue_keys(items)
+                    )
                 else:
-                    field_type = field["field"]["name"]
-                    value[field_type] = field.get("text") or field.get("name")
+                    comments_by_issue = {}
 
-            # add labels to item
-            labels = [
-                label["node"]["name"]
-                for label in value.get("content", {}).get("labels", {}).get("edges", [])
-            ]
+                for item in items:
+                    comments = comments_by_issue.get(item.issue_key)
+                    yield from filter(unseen, self._generate_item(item, comments))
+                    yield from filter(unseen, self._generate_assignees(item))
 
-            value["labels"] = labels
+                    if not dependencies:
+                        continue
 
-            # add assignees to item
-            assignees = [
-                assignee["login"]
-                for assignee in value.get("content", {})
-                .get("assignees", {})
-                .get("nodes", [])
-            ]
+                    stub = ProjectItem(
+                        item.id,
+                        item.repository,
+                        item.number,
+                        title=item.title,
+                        fields=item.fields,
+                    )
+                    index[item.issue_key.lower()] = stub
 
-            value["Assignees"] = assignees
+                    references = extract_uses(item.body, item.repository)
+                    if references:
+                        uses.append((stub, references))
 
-            # if issue, add IssueNumber
-            if value.get("content").get("number"):
-                value["IssueNumber"] = "project-planning" + str(
-                    value.get("content").get("number")
-                )
+        for item, references in uses:
+            yield from filter(
+                unseen, self._generate_dependencies(item, index, references)
+            )
+
+    def _consume_stream(self, nodes: bool):
+        """
+        Yield the nodes (or edges) of the stream. Elements of the other kind
+        encountered on the way are buffered for the other consumer.
+
+        Args:
+            nodes: Whether to yield nodes (True) or edges (False).
+        """
+
+        if self._stream_iterator is None:
+            self._stream_iterator = self._stream()
+
+        own, other = self._stream_buffers[nodes], self._stream_buffers[not nodes]
 
-            # add back to _items
-            self._items[key] = value
+        while own:
+            yield own.popleft()
 
-            title = value.get("Title")
+        for element in self._stream_iterator:
+            if (len(element) == 3) == nodes:
+                yield element
+            else:
+                other.append(element)
 
-            if not title:
-                logger.warning(f"Item {value['id']} has no title.")
+    def _generate_field_nodes(self, fields: list):
+        """
+        Yield a node for each option of the requested Status, Size, and
+        Priority fields of a project.
+        """
+
+        requested = [
+            field.value.capitalize()
+            for field in (
+                GitHubAdapterProjectField.STATUS,
+                GitHubAdapterProjectField.SIZE,
+                GitHubAdapterProjectField.PRIORITY,
+            )
+            if field in self.node_fields
+        ]
+
+        for field in fields:
+            if not field:
+                continue
+            if field["name"] not in requested:
                 continue
 
-            description = value.get("content").get("body", "")
+            for option in field["options"]:
+                name = option["name"].lower()
+                type = field["name"].lower()
 
+                yield (name, type, {})
+
+    def _generate_item(self, item: ProjectItem, comments: list = None):
+        """
+        Yield the project node of an item, its iteration and comment nodes,
+        and the edges connecting them.
+        """
+
+        if not item.title:
+            logger.warning(f"Item {item.id} has no title.")
+            return
+
+        if GitHubAdapterNodeType.PROJECT in self.node_types:
             label = self._get_label()
 
-            self._nodes.append(
-                (
-                    value["id"],
-                    label,
-                    {
-                        "title": title,
-                        "description": description,
-                        "labels": labels,
-                        "status": value.get("Status"),
-                        "size": value.get("Size"),
-                        "priority": value.get("Priority"),
-                        "iteration": value.get("Iteration"),
-                        "assignees": value.get("Assignees"),
-                        "issue_number": value.get("IssueNumber"),
-                    },
-                )
+            yield (item.id, label, self._get_project_properties(item))
+
+        # Create Iteration node
+        if item.iteration and GitHubAdapterNodeType.ITERATION in self.node_types:
+            yield (
+                item.iteration_id,
+                "iteration",
+                {
+                    "title": item.iteration,
+                },
             )
 
-            # Create Iteration node
-            if value.get("Iteration"):
-                iteration_id = value.get("Iteration ID")
-                if iteration_id not in [node[0] for node in self._nodes]:
-                    self._nodes.append(
-                        (
-                            iteration_id,
-                            "iteration",
-                            {
-                                "title": value.get("Iteration"),
-                            },
-                        )
-                    )
+        # Create edges from item to iteration
+        if item.iteration and GitHubAdapterEdgeType.PART_OF in self.edge_types:
+            yield (
+                None,
+                item.id,
+                item.iteration_id,
+                "part of",
+                {},
+            )
 
-            # Create edges from item to iteration
-            if value.get("Iteration"):
-                self._edges.append(
-                    (
+        if comments:
+            source_id = item.id
+            recency = 0
+            for comment in comments:
+                # add each author / body as an individual node and connect to the project node
+                comment_id = comment.get("id")
+                # Deleted accounts have no author
+                author = (comment.get("author") or {}).get("login", "ghost")
+                body = comment.get("body")
+                text = author if body is None else author + ": " + body
+                if GitHubAdapterNodeType.COMMENT in self.node_types:
+                    yield (
+                        comment_id,
+                        "comment",
+                        {"text": text},
+                    )
+                if GitHubAdapterEdgeType.HAS_COMMENT in self.edge_types:
+                    yield (
                         None,
-                        value["id"],
-                        value.get("Iteration ID"),
-                        "part of",
-                        {},
+                        source_id,
+                        comment_id,
+                        "has comment",
+                        {"recency": recency},
                     )
+                recency += 1
+
+    def _get_project_properties(self, item: ProjectItem) -> dict:
+        """
+        Extract the requested properties of the project node of an item.
+        """
+
+        extractors = {
+            GitHubAdapterProjectField.TITLE: lambda: item.title,
+            GitHubAdapterProjectField.DESCRIPTION: lambda: item.body,
+            GitHubAdapterProjectField.LABELS: lambda: list(item.labels),
+            GitHubAdapterProjectField.STATUS: lambda: item.status,
+            GitHubAdapterProjectField.SIZE: lambda: item.size,
+            GitHubAdapterProjectField.PRIORITY: lambda: item.priority,
+            GitHubAdapterProjectField.ITERATION: lambda: item.iteration,
+            GitHubAdapterProjectField.ASSIGNEES: lambda: list(item.assignees),
+            GitHubAdapterProjectField.ISSUE: lambda: item.issue_number,
+        }
+
+        return {
+            name: extractors[field]()
+            for field, name in PROJECT_PROPERTIES.items()
+            if field in self.node_fields
+        }
+
+    def _generate_assignees(self, item: ProjectItem):
+        """
+        Yield a person node and a leads edge for each assignee of an item.
+        """
+
+        for assignee in item.assignees:
+            if GitHubAdapterNodeType.PERSON in self.node_types:
+                yield (assignee, "person", {"name": assignee})
+            if GitHubAdapterEdgeType.LEADS in self.edge_types:
+                yield (None, assignee, item.id, "leads", {})
+
+    def get_comments(self, issue_key: str) -> list:
+        """
+        Load the comments of an issue on demand, e.g. for an issue whose
+        comments were skipped by the comment policy. The policy's number of
+        comments, history, and body settings apply.
+
+        Args:
+            issue_key: The key of the issue to get comments for, e.g.
+                "biocypher/project-planning#12".
+
+        Returns:
+            List of comments, oldest first, or None if the issue could not
+            be fetched.
+        """
+
+        return self._get_comments_batch([issue_key]).get(issue_key)
+
+    def _get_comment_issue_keys(self, items) -> list:
+        """
+        Get the keys of the titled issues whose comments are loaded according
+        to the comment policy.
+        """
+
+        return [
+            item.issue_key
+            for item in items
+            if item.title and self.comment_policy.applies_to(item)
+        ]
+
+    def _get_comments_batch(self, issue_keys: list) -> dict:
+        """
+        Get the comments of many issues, as many per issue as the comment
+        policy asks for. Issues are grouped by repository and requested in
+        chunks of `comment_batch_size`, each chunk being a single GraphQL
+        query with one aliased `issue` selection per issue. Issues with more
+        comments than fit on one page are paged backwards in further rounds
+        of batched queries.
+
+        Args:
+            issue_keys: The keys of the issues (e.g.
+                "biocypher/project-planning#12") to get comments for.
+
+        Returns:
+            Dictionary mapping issue key to its list of comments, oldest
+            first.
+        """
+
+        issues = {}
+        for issue_key in issue_keys:
+            try:
+                repository, number = issue_key.rsplit("#", 1)
+                issues[issue_key] = (repository, int(number))
+            except (AttributeError, ValueError):
+                logger.warning(f"Could not extract number from {issue_key}.")
+
+        comments = {}
+
+        # (issue key, cursor) of the next page of each incomplete issue
+        pending = [(issue_key, None) for issue_key in issues]
+
+        while pending:
+            repositories = {}
+            for issue_key, cursor in pending:
+                repository, number = issues[issue_key]
+                count = self.comment_policy.get_page_size(
+                    len(comments.get(issue_key, []))
+                )
+                repositories.setdefault(repository, []).append(
+                    (issue_key, number, count, cursor)
                 )
 
-            # Retrieve all comments for the issue
-            comments = self._get_comments(value.get("IssueNumber"))
-
-            if comments:
-                source_id = value["id"]
-                recency = 0
-                for comment in comments:
-                    # add each author / body as an individual node and connect to the project node
-                    comment_id = comment.get("id")
-                    text = (
-                        comment.get("author").get("login") + ": " + comment.get("body")
-                    )
-                    self._nodes.append(
-                        (
-                            comment_id,
-                            "comment",
-                            {"text": text},
-                        )
-                    )
-                    self._edges.append(
-                        (
-                            None,
-                            source_id,
-                            comment_id,
-                            "has comment",
-                            {"recency": recency},
-                        )
+            chunks = [
+                (repository, batch[start : start + self.comment_batch_size])
+                for repository, batch in repositories.items()
+                for start in range(0, len(batch), self.comment_batch_size)
+            ]
+
+            pending = []
+            for chunk_comments in self._run_concurrently(
+                [
+                    lambda repository=repository, chunk=chunk: self._get_comments_chunk(
+                        repository, chunk
                     )
-                    recency += 1
+                    for repository, chunk in chunks
+                ]
+            ):
+                for issue_key, connection in chunk_comments.items():
+                    # Earlier pages hold older comments
+                    comments[issue_key] = [
+                        self._trim_comment(comment)
+                        for comment in connection.get("nodes")
+                    ] + comments.get(issue_key, [])
+
+                    page_info = connection.get("pageInfo") or {}
+                    loaded = len(comments[issue_key])
+                    if (
+                        page_info.get("hasPreviousPage")
+                        and self.comment_policy.get_page_size(loaded) > 0
+                    ):
+                        pending.append((issue_key, page_info.get("startCursor")))
+
+        return comments
+
+    def _trim_comment(self, comment: dict) -> dict:
+        """
+        Truncate the body of a comment according to the comment policy.
+        """
 
-        # Edges to fields
-        for key, value in self._items.items():
-            for assignee in value.get("Assignees", []):
-                # check if assignee is in the first element of the list of tuples that is self._nodes
-                if assignee not in [node[0] for node in self._nodes]:
-                    self._nodes.append((assignee, "person", {"name": assignee}))
+        if comment.get("body") is not None:
+            comment["body"] = self.comment_policy.truncate(comment["body"])
 
-                self._edges.append((None, assignee, value["id"], "leads", {}))
+        return comment
 
-    def _get_comments(self, issue_number, k: int = 10):
+    def _get_comments_chunk(self, repository: str, chunk: list) -> dict:
         """
-        Get all comments for a given issue, up to k most recent.
+        Get comments for one chunk of issues of a repository in a single
+        GraphQL query.
 
         Args:
-            issue_number: The issue number to get comments for.
-            k: The number of most recent comments to get.
+            repository: The repository, as "owner/name".
+            chunk: List of (issue key, numeric issue number, number of
+                comments, cursor) tuples. Comments before the cursor are
+                requested, or the most recent ones if the cursor is None.
+
+        Returns:
+            Dictionary mapping issue key to the comments connection of the
+            issue, with its nodes and page info.
         """
-        try:
-            number = int(issue_number.split("project-planning")[1])
-        except (IndexError, ValueError):
-            logger.warning(f"Could not extract number from {issue_number}.")
-            return
 
-        query = """
-          query {
-            repository(owner: "biocypher", name: "project-planning") {
-              issue(number: %s) {
-                comments(last: %s) {
+        fields = "\n                    body" if self.comment_policy.bodies else ""
+
+        selections = "".join(
+            """
+              i%s: issue(number: %s) {
+                comments(last: %s%s) {
                   nodes {
                     author {
                       login
                     }
-                    id
-                    body
+                    id%s
+                  }
+                  pageInfo {
+                    hasPreviousPage
+                    startCursor
                   }
                 }
-              }
+              }"""
+            % (
+                number,
+                number,
+                count,
+                ", before: %s" % json.dumps(cursor) if cursor else "",
+                fields,
+            )
+            for _, number, count, cursor in chunk
+        )
+
+        query = """
+          query($owner: String!, $name: String!) {
+            repository(owner: $owner, name: $name) {%s
+            }
+            rateLimit {
+              cost
+              remaining
+              resetAt
             }
           }
         """ % (
-            number,
-            k,
+            selections,
         )
 
+        owner, name = repository.split("/")
+
         # Set the request data as a dictionary
-        data = {"query": query}
+        data = {"query": query, "variables": {"owner": owner, "name": name}}
 
         # Send the API request
-        response = requests.post(self.url, headers=self.headers, json=data)
+        response_json = self._query(data, "comments")
 
-        # Parse the response JSON
-        response_json = json.loads(response.text)
+        # Issues that cannot be fetched come back as errors
+        data = self._get_data(response_json, "comments", partial=True)
+        issues = data.get("repository") or {}
 
-        # Extract the data from the response JSON
-        data = (
-            response_json.get("data")
-            .get("repository")
-            .get("issue")
-            .get("comments")
-            .get("nodes")
-        )
+        comments = {}
+        for issue_key, number, _, _ in chunk:
+            issue = issues.get(f"i{number}")
+            if not issue:
+                logger.warning(f"Could not fetch comments for {issue_key}.")
+                continue
 
-        return data
+            comments[issue_key] = issue.get("comments")
+
+        return comments
 
     def _get_label(self):
         """
@@ -739,56 +2060,81 @@ class GitHubAdapter:
 
     def _process_edges(self):
         """
-        Returns a list of edge tuples for edge types specified in the
-        adapter constructor.
+        Generate the dependency edges between the items, from the "Uses:"
+        lines of their bodies.
         """
 
+        if not self._requested(*DEPENDENCY_SELECTIONS):
+            return
+
         logger.info("Generating edges.")
 
-        for value in self._items.values():
-            continue
-            uses = self._extract_uses(value["content"]["body"])
+        index = self._index_issues(self._items.values())
 
-            parent = "i" + str(value["content"]["number"])
+        for item in self._items.values():
+            for element in self._generate_dependencies(item, index):
+                self._graph.add(element)
 
-            for use in uses:
-                if not use:
-                    continue
+    def _index_issues(self, items) -> dict:
+        """
+        Index items by their lowercase issue key, to resolve the references
+        of `_generate_dependencies`.
+        """
 
-                part = use.replace("#", "i")
+        return {item.issue_key.lower(): item for item in items}
 
-                self._edges.append((None, part, parent, "part of", {}))
+    def _generate_dependencies(
+        self, item: ProjectItem, index: dict, references: list = None
+    ):
+        """
+        Yield a part of edge from each issue listed on the "Uses:" lines of
+        an item to the item. If the item is a pipeline, additionally yield
+        a uses edge to the data type of each listed issue, and the data type
+        node. Issues can be referenced as "#12", "owner/repo#12", or by URL.
 
-                # also connect pipelines to the adapter's data type
-                if value.get("Component Type") == "Pipeline":
-                    if not self._items.get(part):
-                        logger.warning(f"Could not find {part} in items.")
-                        continue
+        Args:
+            item: The item.
+            index: Dictionary mapping lowercase issue keys to items, see
+                `_index_issues`.
+            references: Lowercase issue keys referenced by the item, if
+                already extracted from its body.
+        """
 
-                    data_type = self._items.get(part).get("Data Type")
+        # Items without a title have no node
+        if not item.title:
+            return
 
-                    if not data_type:
-                        continue
+        if references is None:
+            references = extract_uses(item.body, item.repository)
 
-                    self._edges.append((None, parent, data_type.lower(), "uses", {}))
+        pipeline = item.get_field("Component Type") == "Pipeline"
 
-    def _extract_uses(self, body) -> list:
-        """
-        Extract the uses from the body of the item.
-        """
+        for key in references:
+            used = index.get(key)
 
-        if not body:
-            return []
+            if used is None:
+                logger.debug(f"Could not find {key}, used by {item.issue_key}.")
+                continue
+
+            if used.id == item.id or not used.title:
+                continue
 
-        lines = body.split("\n")
+            if GitHubAdapterEdgeType.PART_OF in self.edge_types:
+                yield (None, used.id, item.id, "part of", {})
 
-        for line in lines:
-            if line.startswith("Uses:"):
-                uses = line.split(": ")[1]
+            if not pipeline:
+                continue
+
+            # Also connect pipelines to the data types of their adapters
+            data_type = used.get_field("Data Type")
 
-                return uses.split(" ")
+            if not data_type:
+                continue
 
-        return []
+            if GitHubAdapterNodeType.DATA_TYPE in self.node_types:
+                yield (data_type.lower(), "data type", {"name": data_type})
+            if GitHubAdapterEdgeType.USES in self.edge_types:
+                yield (None, item.id, data_type.lower(), "uses", {})
 
     def get_node_count(self):
         """
@@ -796,13 +2142,26 @@ class GitHubAdapter:
         """
         return len(self.get_nodes())
 
+    def _requested(self, *selections) -> bool:
+        """
+        Check whether any of the given node types, node fields, or edge types
+        was requested in the adapter constructor.
+        """
+
+        return any(
+            selection in self.node_types
+            or selection in self.node_fields
+            or selection in self.edge_types
+            for selection in selections
+        )
+
     def _set_types_and_fields(self, node_types, node_fields, edge_types, edge_fields):
-        if node_types:
+        if node_types is not None:
             self.node_types = node_types
         else:
             self.node_types = [type for type in GitHubAdapterNodeType]
 
-        if node_fields:
+        if node_fields is not None:
             self.node_fields = node_fields
         else:
             self.node_fields = [
@@ -812,12 +2171,34 @@ class GitHubAdapter:
                 )
             ]
 
-        if edge_types:
+        if edge_types is not None:
             self.edge_types = edge_types
         else:
             self.edge_types = [type for type in GitHubAdapterEdgeType]
 
-        if edge_fields:
+        if edge_fields is not None:
             self.edge_fields = edge_fields
         else:
             self.edge_fields = [field for field in chain()]
+
+
+def _get_field_value(value: dict):
+    """
+    Get the option name, text, or iteration title of a field value.
+    """
+
+    if not value:
+        return None
+    return value.get("name") or value.get("text") or value.get("title")
+
+
+def _parse_http_date(value: str) -> datetime:
+    """
+    Parse the `Date` header of a response, or return None if it is missing
+    or invalid.
+    """
+
+    try:
+        return parsedate_to_datetime(value).astimezone(timezone.utc)
+    except (TypeError, ValueError):
+        return None
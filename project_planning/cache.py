@@ -0,0 +1,214 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from biocypher._logger import logger
+
+logger.debug(f"Loading module {__name__}.")
+
+
+DEFAULT_TTLS = {
+    "project_id": 7 * 24 * 3600,
+    "fields": 3600,
+    "items": 300,
+    "comments": 600,
+    # Listings of matching or changed items, and the re-fetch of changed
+    # items, must be current, since they decide what is built or mutated
+    "listing": 0,
+    "items_by_id": 0,
+}
+
+
+class CacheMissError(LookupError):
+    """
+    Raised in offline mode when a query has no cached response.
+    """
+
+
+class ResponseCache:
+    """
+    Base class for caches of GitHub GraphQL responses. Responses are keyed by
+    API endpoint, query and variables, and each query type (e.g. "fields",
+    "comments") has its own time to live. Query types without a TTL are not
+    cached.
+
+    Args:
+        ttls: Dictionary mapping query type to time to live in seconds.
+            Defaults to `DEFAULT_TTLS`.
+        offline: Whether to replay cached responses only. In offline mode,
+            entries never expire, and a miss or a mutation raises
+            `CacheMissError` instead of hitting the API.
+    """
+
+    def __init__(self, ttls: dict = None, offline: bool = False):
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        self.offline = offline
+
+    @staticmethod
+    def key(data: dict, url: str = None) -> str:
+        """
+        Build the cache key of a request payload from the endpoint URL, the
+        query and the variables, so that responses of different APIs, e.g.
+        a mock server and GitHub, are kept apart.
+        """
+
+        payload = json.dumps(
+            [url, data.get("query"), data.get("variables")], sort_keys=True
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def is_cacheable(self, query_type: str) -> bool:
+        """
+        Whether responses of a query type are served from and stored in the
+        cache. Mutations (query type None) are never cached; in offline mode
+        they raise `CacheMissError`, since they cannot be sent.
+        """
+
+        if query_type is None:
+            if self.offline:
+                raise CacheMissError("Offline mode: mutations cannot be sent.")
+            return False
+
+        return self.offline or self.ttls.get(query_type, 0) > 0
+
+    def get(self, data: dict, query_type: str, url: str = None):
+        """
+        Return the cached response text for a request to an endpoint, or
+        None if there is no fresh entry.
+        """
+
+        raise NotImplementedError
+
+    def set(self, data: dict, query_type: str, text: str, url: str = None):
+        """
+        Store the response text for a request to an endpoint.
+        """
+
+        raise NotImplementedError
+
+
+class SQLiteResponseCache(ResponseCache):
+    """
+    Response cache stored in a SQLite database. When the stored responses
+    exceed `max_size` bytes, the least recently used entries are evicted.
+
+    Args:
+        path: Path of the SQLite database file.
+        ttls: Dictionary mapping query type to time to live in seconds.
+        offline: Whether to replay cached responses only.
+        max_size: Maximum total size of cached responses in bytes.
+    """
+
+    def __init__(
+        self,
+        path: str = ".github_cache.sqlite",
+        ttls: dict = None,
+        offline: bool = False,
+        max_size: int = 256 * 1024 * 1024,
+    ):
+        super().__init__(ttls, offline)
+
+        self.path = path
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                query_type TEXT NOT NULL,
+                body TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._connection.commit()
+
+    def get(self, data: dict, query_type: str, url: str = None):
+        key = self.key(data, url)
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                if self.offline:
+                    raise CacheMissError(
+                        f"Offline mode: no cached response for {query_type} query."
+                    )
+                return None
+
+            body, stored_at = row
+            if not self.offline and time.time() - stored_at > self.ttls.get(
+                query_type, 0
+            ):
+                return None
+
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            self._connection.commit()
+
+        return body
+
+    def set(self, data: dict, query_type: str, text: str, url: str = None):
+        now = time.time()
+
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    self.key(data, url),
+                    query_type,
+                    text,
+                    len(text.encode("utf-8")),
+                    now,
+                    now,
+                ),
+            )
+            self._evict()
+            self._connection.commit()
+
+    def _evict(self):
+        """
+        Delete least recently used entries until the cache fits `max_size`.
+        """
+
+        (total,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+
+        if total <= self.max_size:
+            return
+
+        rows = self._connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall()
+
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_size:
+                break
+            evicted.append((key,))
+            total -= size
+
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        logger.debug(f"Evicted {len(evicted)} cached responses.")
+
+    def clear(self):
+        """
+        Delete all cached responses.
+        """
+
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+
+    def close(self):
+        self._connection.close()
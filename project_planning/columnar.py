@@ -0,0 +1,306 @@
+import glob
+import os
+from biocypher._logger import logger
+
+logger.debug(f"Loading module {__name__}.")
+
+
+FORMATS = ("arrow", "parquet")
+EXTENSIONS = {"arrow": ".arrow", "parquet": ".parquet"}
+
+# Columns with few distinct values, stored as indices into a dictionary
+DICTIONARY_COLUMNS = ("status", "size", "priority", "iteration", "labels", "assignees")
+
+
+class ColumnarExporter:
+    """
+    Exports node and edge tuples as one typed columnar table per label, e.g.
+    `project.arrow` and `has_comment.arrow`, in the Arrow IPC file format or
+    as Parquet. Node tables have an `id` column, edge tables `id`, `source`
+    and `target` columns, followed by one column per property. Low
+    cardinality columns such as status, size, priority, and assignees are
+    dictionary encoded. The tables can be loaded with `ColumnarReader`
+    without building the graph again.
+
+    Rows are collected per column while the elements are added and written
+    by `close()`. Tables of a previous export in the directory are removed.
+    Requires pyarrow.
+
+    Args:
+        directory: Output directory.
+        format: "arrow" for Arrow IPC files, which can be memory mapped
+            without decoding, or "parquet" for compressed Parquet files.
+        dictionary_columns: Names of the columns to dictionary encode.
+            Columns of string lists are encoded element-wise.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        format: str = "arrow",
+        dictionary_columns: tuple = DICTIONARY_COLUMNS,
+    ):
+        if format not in FORMATS:
+            raise ValueError(
+                f"Unknown columnar format {format}. Available formats: "
+                f"{', '.join(FORMATS)}."
+            )
+
+        self._pa = _import_pyarrow()
+        self.directory = directory
+        self.format = format
+        self.dictionary_columns = set(dictionary_columns)
+
+        # label -> (kind, number of rows, {column name: values})
+        self._tables = {}
+
+    def add(self, element: tuple):
+        """
+        Add a node tuple (id, label, properties) or an edge tuple (id,
+        source, target, label, properties).
+        """
+
+        if len(element) == 3:
+            node_id, label, properties = element
+            kind = "node"
+            row = {"id": node_id, **properties}
+        else:
+            edge_id, source, target, label, properties = element
+            kind = "edge"
+            row = {"id": edge_id, "source": source, "target": target, **properties}
+
+        table = self._tables.get(label)
+        if table is None:
+            table = self._tables[label] = [kind, 0, {}]
+
+        rows, columns = table[1], table[2]
+
+        for name, value in row.items():
+            column = columns.get(name)
+            if column is None:
+                # Property missing in the previous rows
+                column = columns[name] = [None] * rows
+            column.append(value)
+
+        if len(columns) > len(row):
+            # Property missing in this row
+            for column in columns.values():
+                if len(column) == rows:
+                    column.append(None)
+
+        table[1] = rows + 1
+
+    def tee(self, elements):
+        """
+        Add each element of a stream while passing it on, e.g. to export
+        the stream of the adapter while it is written by another writer.
+        Call `close()` once the stream is consumed.
+
+        Args:
+            elements: Iterable of node and edge tuples.
+
+        Yields:
+            The elements.
+        """
+
+        for element in elements:
+            self.add(element)
+            yield element
+
+    def write(self, elements) -> list:
+        """
+        Add node and edge tuples, in any order, and write the tables.
+
+        Args:
+            elements: Iterable of node and edge tuples, e.g.
+                `GitHubAdapter.get_nodes_and_edges()`.
+
+        Returns:
+            List of the written file paths.
+        """
+
+        for element in elements:
+            self.add(element)
+
+        return self.close()
+
+    def close(self) -> list:
+        """
+        Write one table per label and release the collected rows.
+
+        Returns:
+            List of the written file paths.
+        """
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        extension = EXTENSIONS[self.format]
+        for path in glob.glob(os.path.join(self.directory, f"*{extension}")):
+            os.remove(path)
+
+        paths = []
+        for label, (kind, _, columns) in self._tables.items():
+            table = self._pa.table(
+                {name: self._to_array(name, values) for name, values in columns.items()}
+            ).replace_schema_metadata({"label": label, "kind": kind})
+
+            path = os.path.join(self.directory, _get_file_name(label) + extension)
+            self._write_table(table, path)
+            paths.append(path)
+
+        logger.info(f"Exported {len(paths)} tables to {self.directory}.")
+
+        self._tables = {}
+        return paths
+
+    def _to_array(self, name: str, values: list):
+        pa = self._pa
+        array = pa.array(values)
+
+        if name not in self.dictionary_columns:
+            return array
+
+        if pa.types.is_string(array.type):
+            return array.dictionary_encode()
+
+        if pa.types.is_list(array.type) and pa.types.is_string(array.type.value_type):
+            return pa.ListArray.from_arrays(
+                array.offsets,
+                array.flatten().dictionary_encode(),
+                mask=array.is_null() if array.null_count else None,
+            )
+
+        return array
+
+    def _write_table(self, table, path: str):
+        if self.format == "arrow":
+            with self._pa.OSFile(path, "wb") as sink:
+                with self._pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+        else:
+            import pyarrow.parquet as pq
+
+            pq.write_table(table, path)
+
+
+class ColumnarReader:
+    """
+    Reads the tables written by `ColumnarExporter`. Files are memory mapped,
+    so that Arrow IPC tables are used in place without copying or decoding
+    them, and only the selected columns of Parquet tables are read. Rows can
+    be filtered by column values, e.g.
+    `reader.read("project", status=["Todo", "In Progress"])`.
+
+    Args:
+        directory: Directory of the exported tables.
+    """
+
+    def __init__(self, directory: str):
+        self._pa = _import_pyarrow()
+        self.directory = directory
+
+        # label -> (path, format)
+        self._files = {}
+
+        for format, extension in EXTENSIONS.items():
+            for path in sorted(glob.glob(os.path.join(directory, f"*{extension}"))):
+                metadata = self._read_schema(path, format).metadata or {}
+                label = metadata.get(b"label", b"").decode() or _get_label(path)
+                self._files[label] = (path, format)
+
+    @property
+    def labels(self) -> list:
+        """
+        Labels of the exported tables.
+        """
+
+        return list(self._files)
+
+    def read(self, label: str, columns: list = None, **values):
+        """
+        Read the table of a label.
+
+        Args:
+            label: The node or edge label, e.g. "project" or "has comment".
+            columns: Names of the columns to read. Defaults to all.
+            values: Column values to filter the rows by, e.g.
+                `status="Scheduled"`. Pass a list to match any of several
+                values.
+
+        Returns:
+            A `pyarrow.Table`; use `to_pandas()` or `to_pylist()` to convert
+            it.
+        """
+
+        if label not in self._files:
+            raise KeyError(f"No table for label {label} in {self.directory}.")
+
+        path, format = self._files[label]
+
+        # Filter columns are read as well, and dropped after filtering
+        read_columns = None
+        if columns is not None:
+            read_columns = list(columns) + [
+                name for name in values if name not in columns
+            ]
+
+        if format == "arrow":
+            with self._pa.memory_map(path) as source:
+                table = self._pa.ipc.open_file(source).read_all()
+            if read_columns is not None:
+                table = table.select(read_columns)
+        else:
+            import pyarrow.parquet as pq
+
+            table = pq.read_table(path, columns=read_columns, memory_map=True)
+
+        if values:
+            table = table.filter(self._get_filter(values))
+
+        if columns is not None:
+            table = table.select(list(columns))
+
+        return table
+
+    def _read_schema(self, path: str, format: str):
+        if format == "arrow":
+            with self._pa.memory_map(path) as source:
+                return self._pa.ipc.open_file(source).schema
+
+        import pyarrow.parquet as pq
+
+        return pq.read_schema(path, memory_map=True)
+
+    def _get_filter(self, values: dict):
+        import pyarrow.compute as pc
+
+        expression = None
+        for name, value in values.items():
+            if isinstance(value, (list, tuple, set)):
+                condition = pc.field(name).isin(list(value))
+            else:
+                condition = pc.field(name) == value
+            expression = condition if expression is None else expression & condition
+
+        return expression
+
+
+def _get_file_name(label: str) -> str:
+    return label.replace(" ", "_")
+
+
+def _get_label(path: str) -> str:
+    return os.path.splitext(os.path.basename(path))[0].replace("_", " ")
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+    except ImportError as e:
+        raise ImportError(
+            "The columnar export requires the pyarrow package. Install it "
+            "with `pip install pyarrow`."
+        ) from e
+
+    return pyarrow
@@ -0,0 +1,91 @@
+from biocypher._logger import logger
+from project_planning.item import ProjectItem
+
+logger.debug(f"Loading module {__name__}.")
+
+
+# GitHub returns at most 100 comments per page
+MAX_COMMENTS_PAGE_SIZE = 100
+
+
+class CommentPolicy:
+    """
+    Decides which issue comments `GitHubAdapter` loads. Comments can be
+    limited to items with certain statuses or iterations, to the k most
+    recent per issue or the full history, and bodies can be truncated or
+    left out. The default loads the 10 most recent comments with full bodies
+    for every issue.
+
+    Args:
+        k: Number of most recent comments to load per issue. Ignored if
+            `full_history` is set.
+        full_history: Whether to page through all comments of an issue.
+        statuses: Statuses of the items to load comments for, e.g.
+            ["Todo", "In Progress"]. Defaults to all.
+        skip_statuses: Statuses of the items not to load comments for, e.g.
+            ["Done", "Closed / Parked"].
+        iterations: Iteration titles of the items to load comments for.
+            Defaults to all, including items without an iteration.
+        bodies: Whether to load comment bodies. Without bodies, comment
+            nodes only contain the author.
+        max_body_length: Maximum number of characters of a comment body;
+            longer bodies are cut and followed by "...".
+    """
+
+    def __init__(
+        self,
+        k: int = 10,
+        full_history: bool = False,
+        statuses: list = None,
+        skip_statuses: list = None,
+        iterations: list = None,
+        bodies: bool = True,
+        max_body_length: int = None,
+    ):
+        if k < 1:
+            raise ValueError("k must be at least 1.")
+
+        if max_body_length is not None and max_body_length < 1:
+            raise ValueError("max_body_length must be at least 1.")
+
+        self.k = k
+        self.full_history = full_history
+        self.statuses = set(statuses) if statuses is not None else None
+        self.skip_statuses = set(skip_statuses or [])
+        self.iterations = set(iterations) if iterations is not None else None
+        self.bodies = bodies
+        self.max_body_length = max_body_length
+
+    def applies_to(self, item: ProjectItem) -> bool:
+        """
+        Whether comments are loaded for an item.
+        """
+
+        if self.statuses is not None and item.status not in self.statuses:
+            return False
+        if item.status in self.skip_statuses:
+            return False
+        if self.iterations is not None and item.iteration not in self.iterations:
+            return False
+        return True
+
+    def get_page_size(self, loaded: int) -> int:
+        """
+        Number of comments to request next for an issue, given the number
+        already loaded. Zero once the issue is complete.
+        """
+
+        if self.full_history:
+            return MAX_COMMENTS_PAGE_SIZE
+        return min(self.k - loaded, MAX_COMMENTS_PAGE_SIZE)
+
+    def truncate(self, body: str) -> str:
+        """
+        Truncate a comment body to `max_body_length` characters.
+        """
+
+        if self.max_body_length is None or body is None:
+            return body
+        if len(body) <= self.max_body_length:
+            return body
+        return body[: self.max_body_length] + "..."
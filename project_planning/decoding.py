@@ -0,0 +1,106 @@
+import importlib.util
+import json
+from biocypher._logger import logger
+from project_planning.item import ProjectItem
+
+logger.debug(f"Loading module {__name__}.")
+
+
+# In order of preference when no backend is requested
+BACKENDS = ("msgspec", "orjson", "json")
+
+
+class JSONDecoder:
+    """
+    Decodes GraphQL responses from their raw bytes, without decoding the
+    body into a `str` first. Uses msgspec or orjson if installed, and the
+    standard library otherwise. With msgspec, responses holding project items
+    are decoded straight into `ProjectItem`s via a typed schema, skipping the
+    intermediate dictionaries.
+
+    Args:
+        backend: "msgspec", "orjson", or "json". Defaults to the first
+            installed one.
+    """
+
+    def __init__(self, backend: str = None):
+        if backend is None:
+            backend = next(name for name in BACKENDS if _is_installed(name))
+        elif backend not in BACKENDS:
+            raise ValueError(
+                f"Unknown JSON backend {backend}. Available backends: "
+                f"{', '.join(BACKENDS)}."
+            )
+        elif not _is_installed(backend):
+            raise ImportError(
+                f"The {backend} JSON backend requires the {backend} package. "
+                f"Install it with `pip install {backend}`."
+            )
+
+        self.backend = backend
+
+        if backend == "msgspec":
+            import msgspec
+            from project_planning import structs
+
+            self._loads = msgspec.json.decode
+            self._decode_items = structs.decode_items
+        elif backend == "orjson":
+            import orjson
+
+            self._loads = orjson.loads
+            self._decode_items = None
+        else:
+            self._loads = json.loads
+            self._decode_items = None
+
+        logger.debug(f"Decoding JSON with {backend}.")
+
+    def decode(self, content) -> dict:
+        """
+        Decode a response.
+
+        Args:
+            content: The response body, as bytes or str.
+        """
+
+        return self._loads(content)
+
+    def decode_items(self, content) -> dict:
+        """
+        Decode a response holding project items, either a page of a
+        project's items or items by id. The raw items are parsed into
+        `ProjectItem`s, so that they can be released right away.
+
+        Args:
+            content: The response body, as bytes or str.
+
+        Returns:
+            The decoded response, with the items replaced by `ProjectItem`s.
+            Items not linked to an issue are dropped.
+        """
+
+        if self._decode_items is not None:
+            return self._decode_items(content)
+
+        response = self._loads(content)
+        data = response.get("data") or {}
+
+        if data.get("node"):
+            items = data["node"]["items"]
+            items["nodes"] = _parse_items(items["nodes"])
+
+        if data.get("nodes") is not None:
+            data["nodes"] = _parse_items(data["nodes"])
+
+        return response
+
+
+def _parse_items(nodes: list) -> list:
+    return [
+        item for item in map(ProjectItem.from_response, filter(None, nodes)) if item
+    ]
+
+
+def _is_installed(name: str) -> bool:
+    return name == "json" or importlib.util.find_spec(name) is not None
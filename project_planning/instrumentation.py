@@ -0,0 +1,239 @@
+import cProfile
+import json
+import os
+import resource
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from biocypher._logger import logger, logfile
+
+logger.debug(f"Loading module {__name__}.")
+
+
+PROFILERS = ("cprofile", "pyinstrument")
+
+
+class Instrumentation:
+    """
+    Collects timings of a knowledge graph build: stages (e.g. download,
+    processing, writing) with wall and CPU time and the memory high-water
+    mark, and one span per GraphQL request with its query type, duration,
+    JSON parsing time, payload sizes, and rate limit cost. The collected data
+    is written as a machine-readable report next to the BioCypher log.
+
+    Args:
+        profile: Optional profiler to run during `profile()`, either
+            "cprofile" or "pyinstrument". pyinstrument must be installed
+            separately.
+    """
+
+    def __init__(self, profile: str = None):
+        if profile and profile not in PROFILERS:
+            raise ValueError(
+                f"Unknown profiler {profile}. Available profilers: "
+                f"{', '.join(PROFILERS)}."
+            )
+
+        self.profiler = profile
+        self.stages = []
+        self.spans = []
+
+        self._started_at = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Time a stage of the build.
+
+        Args:
+            name: Name of the stage, e.g. "download".
+        """
+
+        start = time.perf_counter()
+        cpu_start = time.process_time()
+
+        try:
+            yield
+        finally:
+            stage = {
+                "name": name,
+                "start": round(start - self._started_at, 4),
+                "wall_time": round(time.perf_counter() - start, 4),
+                "cpu_time": round(time.process_time() - cpu_start, 4),
+                "peak_rss_mb": round(peak_rss_mb(), 1),
+            }
+            self.stages.append(stage)
+
+            logger.info(
+                f"Stage {name} took {stage['wall_time']:.2f}s "
+                f"(peak RSS {stage['peak_rss_mb']} MB)."
+            )
+
+    def add_span(self, query_type: str, start: float, **attributes):
+        """
+        Record a GraphQL request.
+
+        Args:
+            query_type: Kind of query, e.g. "comments", or None for
+                mutations.
+            start: `time.perf_counter()` at the start of the request.
+            attributes: Further attributes, e.g. `request_bytes`,
+                `response_bytes`, `parse_time`, `cost`, `cached`.
+        """
+
+        span = {
+            "query_type": query_type or "mutation",
+            "start": round(start - self._started_at, 4),
+            "duration": round(time.perf_counter() - start, 4),
+            "thread": threading.current_thread().name,
+            **attributes,
+        }
+
+        with self._lock:
+            self.spans.append(span)
+
+    @contextmanager
+    def profile(self):
+        """
+        Run the configured profiler, if any, and write its output next to
+        the BioCypher log.
+        """
+
+        if self.profiler is None:
+            yield
+            return
+
+        path = self._get_path(
+            "profile.prof" if self.profiler == "cprofile" else "profile.html"
+        )
+
+        if self.profiler == "cprofile":
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                yield
+            finally:
+                profiler.disable()
+                profiler.dump_stats(path)
+        else:
+            try:
+                from pyinstrument import Profiler
+            except ImportError as e:
+                raise ImportError(
+                    "Profiling with pyinstrument requires the pyinstrument "
+                    "package. Install it with `pip install pyinstrument`."
+                ) from e
+
+            profiler = Profiler()
+            profiler.start()
+            try:
+                yield
+            finally:
+                profiler.stop()
+                with open(path, "w") as f:
+                    f.write(profiler.output_html())
+
+        logger.info(f"Wrote {self.profiler} profile to {path}.")
+
+    def summarize_spans(self) -> dict:
+        """
+        Aggregate the spans per query type.
+
+        Returns:
+            Dictionary mapping query type to the number of requests, total
+            and maximum duration, total parsing time, bytes, and cost.
+        """
+
+        summary = {}
+
+        for span in self.spans:
+            entry = summary.setdefault(
+                span["query_type"],
+                {
+                    "requests": 0,
+                    "cached": 0,
+                    "duration": 0.0,
+                    "max_duration": 0.0,
+                    "parse_time": 0.0,
+                    "request_bytes": 0,
+                    "response_bytes": 0,
+                    "cost": 0,
+                },
+            )
+            entry["requests"] += 1
+            entry["cached"] += bool(span.get("cached"))
+            entry["duration"] += span["duration"]
+            entry["max_duration"] = max(entry["max_duration"], span["duration"])
+            entry["parse_time"] += span.get("parse_time", 0)
+            entry["request_bytes"] += span.get("request_bytes", 0)
+            entry["response_bytes"] += span.get("response_bytes", 0)
+            entry["cost"] += span.get("cost") or 0
+
+        for entry in summary.values():
+            for key in ("duration", "max_duration", "parse_time"):
+                entry[key] = round(entry[key], 4)
+
+        return summary
+
+    def write_report(self, path: str = None) -> str:
+        """
+        Write the build report as JSON.
+
+        Args:
+            path: Path of the report. Defaults to the path of the BioCypher
+                log with the suffix `-report.json`.
+
+        Returns:
+            The path of the report.
+        """
+
+        path = path or self._get_path("report.json")
+
+        report = {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "wall_time": round(time.perf_counter() - self._started_at, 4),
+            "cpu_time": round(time.process_time(), 4),
+            "peak_rss_mb": round(peak_rss_mb(), 1),
+            "stages": self.stages,
+            "queries": self.summarize_spans(),
+            "spans": self.spans,
+        }
+
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+
+        logger.info(f"Wrote build report to {path}.")
+
+        return path
+
+    def _get_path(self, suffix: str) -> str:
+        """
+        Get a path next to the BioCypher log, e.g.
+        `biocypher-log/biocypher-20240101-120000-report.json`.
+        """
+
+        try:
+            base = os.path.splitext(logfile())[0]
+        except (IndexError, AttributeError):
+            base = os.path.join(
+                "biocypher-log", f"biocypher-{datetime.now():%Y%m%d-%H%M%S}"
+            )
+            os.makedirs(os.path.dirname(base), exist_ok=True)
+
+        return f"{base}-{suffix}"
+
+
+def peak_rss_mb() -> float:
+    """
+    Peak resident set size of the process in megabytes.
+    """
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Kilobytes on Linux, bytes on macOS
+    if sys.platform == "darwin":
+        return peak / 1024 / 1024
+    return peak / 1024
@@ -0,0 +1,226 @@
+from sys import intern
+from biocypher._logger import logger
+
+logger.debug(f"Loading module {__name__}.")
+
+
+# Project fields with a dedicated attribute; other field values are kept in
+# `ProjectItem.fields`
+FIELD_ATTRIBUTES = {
+    "Title": "title",
+    "Status": "status",
+    "Size": "size",
+    "Priority": "priority",
+    "Timeslot": "timeslot",
+    "Duration": "duration",
+}
+
+
+class ProjectItem:
+    """
+    Compact representation of a project item (card) that is linked to an
+    issue. Parsed once from the GraphQL response, after which the raw JSON
+    can be released. Values that repeat across items, such as status, size,
+    priority, iteration, labels, and logins, are interned, so that all items
+    share one copy of each.
+
+    Attributes:
+        id: Node id of the project item.
+        updated_at: Modification time of the card.
+        content_updated_at: Modification time of the issue.
+        repository: Repository of the issue, as "owner/name".
+        number: Issue number.
+        title: Value of the Title field.
+        body: Body of the issue, empty if not requested.
+        status, size, priority, timeslot, duration: Names of the selected
+            options of the respective fields, if any.
+        iteration: Title of the iteration, if any.
+        iteration_id: Id of the iteration, if any.
+        labels: Tuple of label names.
+        assignees: Tuple of assignee logins.
+        fields: Values of other project fields by field name, or None.
+    """
+
+    __slots__ = (
+        "id",
+        "updated_at",
+        "content_updated_at",
+        "repository",
+        "number",
+        "title",
+        "body",
+        "status",
+        "size",
+        "priority",
+        "timeslot",
+        "duration",
+        "iteration",
+        "iteration_id",
+        "labels",
+        "assignees",
+        "fields",
+    )
+
+    def __init__(self, id: str, repository: str, number: int, **values):
+        self.id = id
+        self.repository = _intern(repository)
+        self.number = number
+
+        self.updated_at = values.get("updated_at")
+        self.content_updated_at = values.get("content_updated_at")
+        self.title = values.get("title")
+        self.body = values.get("body")
+        self.status = _intern(values.get("status"))
+        self.size = _intern(values.get("size"))
+        self.priority = _intern(values.get("priority"))
+        self.timeslot = _intern(values.get("timeslot"))
+        self.duration = _intern(values.get("duration"))
+        self.iteration = _intern(values.get("iteration"))
+        self.iteration_id = _intern(values.get("iteration_id"))
+        self.labels = tuple(_intern(label) for label in values.get("labels", ()))
+        self.assignees = tuple(_intern(login) for login in values.get("assignees", ()))
+        self.fields = (
+            {_intern(name): _intern(value) for name, value in values["fields"].items()}
+            if values.get("fields")
+            else None
+        )
+
+    @classmethod
+    def from_response(cls, node: dict) -> "ProjectItem":
+        """
+        Parse a project item as returned by the GraphQL API.
+
+        Args:
+            node: The project item, with its field values and issue content.
+
+        Returns:
+            The parsed item, or None if the item is not linked to an issue.
+        """
+
+        content = node.get("content") or {}
+        if not content.get("number"):
+            return None
+
+        return cls.from_field_values(
+            node["id"],
+            content["repository"]["nameWithOwner"],
+            content["number"],
+            (
+                (
+                    (field.get("field") or {}).get("name"),
+                    field["title"]
+                    if field.get("iterationId")
+                    else field.get("text") or field.get("name"),
+                    field.get("iterationId"),
+                )
+                for field in node.get("fieldValues", {}).get("nodes", [])
+                if field
+            ),
+            updated_at=node.get("updatedAt"),
+            content_updated_at=content.get("updatedAt"),
+            body=content.get("body", ""),
+            labels=[
+                label["node"]["name"]
+                for label in content.get("labels", {}).get("edges", [])
+            ],
+            assignees=[
+                assignee["login"]
+                for assignee in content.get("assignees", {}).get("nodes", [])
+            ],
+        )
+
+    @classmethod
+    def from_field_values(
+        cls, id: str, repository: str, number: int, field_values, **values
+    ) -> "ProjectItem":
+        """
+        Build an item from its project field values and further attributes.
+
+        Args:
+            id: Node id of the project item.
+            repository: Repository of the issue, as "owner/name".
+            number: Issue number.
+            field_values: Iterable of (field name, value, iteration id)
+                tuples. The iteration id is only set for iteration values.
+            values: Further attributes, e.g. `body` or `labels`.
+        """
+
+        fields = {}
+        for name, value, iteration_id in field_values:
+            if iteration_id:
+                values["iteration"] = value
+                values["iteration_id"] = iteration_id
+            elif name in FIELD_ATTRIBUTES:
+                values[FIELD_ATTRIBUTES[name]] = value
+            elif name is not None:
+                fields[name] = value
+
+        return cls(id, repository, number, fields=fields, **values)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ProjectItem":
+        """
+        Restore an item from the output of `to_dict`.
+        """
+
+        return cls(**data)
+
+    def to_dict(self) -> dict:
+        """
+        Serialise the item as a JSON-compatible dictionary, e.g. for the
+        project snapshot. Unset values are left out.
+        """
+
+        data = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value is None or value == ():
+                continue
+            data[name] = list(value) if isinstance(value, tuple) else value
+
+        return data
+
+    def replace(self, **changes) -> "ProjectItem":
+        """
+        Return a copy of the item with some attributes changed, e.g.
+        `item.replace(status="Done")`.
+        """
+
+        return self.from_dict({**self.to_dict(), **changes})
+
+    @property
+    def issue_key(self) -> str:
+        """
+        Repository-qualified key of the issue, e.g.
+        "biocypher/project-planning#12".
+        """
+
+        return f"{self.repository}#{self.number}"
+
+    @property
+    def issue_number(self) -> str:
+        """
+        Issue number prefixed with the repository name, e.g.
+        "project-planning12".
+        """
+
+        return self.repository.split("/")[1] + str(self.number)
+
+    def get_field(self, name: str):
+        """
+        Get the value of a project field by its name on the board, e.g.
+        "Status" or "Iteration".
+        """
+
+        if name == "Iteration":
+            return self.iteration
+        if name in FIELD_ATTRIBUTES:
+            return getattr(self, FIELD_ATTRIBUTES[name])
+        return (self.fields or {}).get(name)
+
+    def __repr__(self) -> str:
+        return f"ProjectItem({self.issue_key!r}, title={self.title!r})"
+
+
+def _intern(value):
+    return intern(value) if isinstance(value, str) else value
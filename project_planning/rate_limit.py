@@ -0,0 +1,165 @@
+import random
+import threading
+import time
+from datetime import datetime
+import requests
+from biocypher._logger import logger
+
+logger.debug(f"Loading module {__name__}.")
+
+
+RETRY_STATUS_CODES = {500, 502, 503, 504}
+
+
+class RateLimiter:
+    """
+    Schedules requests to the GitHub API. Tracks the remaining point budget
+    from the `x-ratelimit-*` response headers and from `rateLimit { cost
+    remaining resetAt }` selections, waits for the budget to reset when it
+    drops to `reserve` points, and retries transient failures and secondary
+    rate limits with jittered exponential backoff. A single instance can be
+    shared by several adapters to share one budget.
+
+    Args:
+        reserve: Number of points to leave untouched. When the remaining
+            budget drops to this value, requests wait for the reset.
+        max_retries: Maximum number of retries per request.
+        backoff_base: Base delay in seconds of the exponential backoff.
+        backoff_max: Maximum delay in seconds between two attempts.
+    """
+
+    def __init__(
+        self,
+        reserve: int = 100,
+        max_retries: int = 5,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+    ):
+        self.reserve = reserve
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self.remaining = None
+        self.reset_at = None
+        self.cost = 0
+
+        self._lock = threading.Lock()
+
+    def call(self, send) -> requests.Response:
+        """
+        Send a request, waiting for the point budget and retrying transient
+        failures.
+
+        Args:
+            send: Callable without arguments that sends the request and
+                returns the response.
+
+        Returns:
+            The last response. Its status code is not checked.
+        """
+
+        for attempt in range(self.max_retries + 1):
+            self._wait_for_budget()
+
+            try:
+                response = send()
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(
+                    f"GitHub API request failed ({e}), retrying in {delay:.1f}s."
+                )
+                time.sleep(delay)
+                continue
+
+            self._update_from_headers(response)
+
+            delay = self._retry_delay(response, attempt)
+            if delay is None or attempt == self.max_retries:
+                return response
+
+            logger.warning(
+                f"GitHub API request failed with status code "
+                f"{response.status_code}, retrying in {delay:.1f}s."
+            )
+            time.sleep(delay)
+
+    def update(self, rate_limit: dict):
+        """
+        Update the budget from a `rateLimit { cost remaining resetAt }`
+        selection of a GraphQL response.
+        """
+
+        with self._lock:
+            self.cost += rate_limit.get("cost", 0)
+            if "remaining" in rate_limit:
+                self.remaining = rate_limit["remaining"]
+            if rate_limit.get("resetAt"):
+                self.reset_at = datetime.fromisoformat(
+                    rate_limit["resetAt"].replace("Z", "+00:00")
+                ).timestamp()
+
+    def _update_from_headers(self, response: requests.Response):
+        remaining = response.headers.get("x-ratelimit-remaining")
+        reset = response.headers.get("x-ratelimit-reset")
+
+        with self._lock:
+            if remaining is not None:
+                self.remaining = int(remaining)
+            if reset is not None:
+                self.reset_at = float(reset)
+
+    def _wait_for_budget(self):
+        with self._lock:
+            if self.remaining is None or self.remaining > self.reserve:
+                return
+            delay = (self.reset_at or 0) - time.time()
+
+        if delay > 0:
+            logger.warning(
+                f"GitHub API budget down to {self.remaining} points, "
+                f"waiting {delay:.0f}s for the reset."
+            )
+            time.sleep(delay)
+
+        with self._lock:
+            if self.reset_at is None or self.reset_at <= time.time():
+                self.remaining = None
+
+    def _retry_delay(self, response: requests.Response, attempt: int):
+        """
+        Returns the delay before retrying a response, or None if the response
+        should not be retried.
+        """
+
+        retry_after = response.headers.get("Retry-After")
+
+        if response.status_code in (403, 429):
+            if retry_after is not None:
+                return float(retry_after)
+            if response.headers.get("x-ratelimit-remaining") == "0":
+                return max((self.reset_at or 0) - time.time(), 0) + 1
+            if b"secondary rate limit" in response.content.lower():
+                return max(60.0, self._backoff(attempt))
+            return None
+
+        if response.status_code in RETRY_STATUS_CODES:
+            return float(retry_after) if retry_after else self._backoff(attempt)
+
+        # Exhausted primary budget is reported as a GraphQL error. The raw
+        # bytes are searched, since response.text would decode every body
+        if response.status_code == 200 and b'"RATE_LIMITED"' in response.content:
+            return max((self.reset_at or 0) - time.time(), 0) + 1
+
+        return None
+
+    def _backoff(self, attempt: int) -> float:
+        """
+        Exponential backoff with full jitter.
+        """
+
+        return random.uniform(
+            0, min(self.backoff_max, self.backoff_base * 2**attempt)
+        )
@@ -0,0 +1,46 @@
+import re
+from biocypher._logger import logger
+
+logger.debug(f"Loading module {__name__}.")
+
+
+# "Uses:" lines of an issue body, e.g. "Uses: #12 biocypher/biocypher#345"
+USES_PATTERN = re.compile(r"^[ \t]*Uses:(.*)$", re.MULTILINE)
+
+# Issue references: "#12", "owner/repo#12", or an issue URL
+ISSUE_REFERENCE_PATTERN = re.compile(
+    r"github\.com/(?P<url_repository>[\w.-]+/[\w.-]+)/issues/(?P<url_number>\d+)"
+    r"|(?<![\w/#.-])(?:(?P<repository>[\w.-]+/[\w.-]+))?#(?P<number>\d+)\b"
+)
+
+
+def extract_uses(body: str, repository: str) -> list:
+    """
+    Extract the issues referenced on the "Uses:" lines of an issue body.
+    The body is scanned once with precompiled patterns; bodies without a
+    "Uses:" line are skipped without running a pattern.
+
+    Args:
+        body: The issue body.
+        repository: Repository of the issue, as "owner/name". References
+            without a repository, e.g. "#12", refer to this repository.
+
+    Returns:
+        List of lowercase issue keys, e.g. "biocypher/biocypher#12", in the
+        order of their first reference. GitHub repository names are case
+        insensitive, so keys are compared in lowercase.
+    """
+
+    if not body or "Uses:" not in body:
+        return []
+
+    keys = {}
+    for line in USES_PATTERN.finditer(body):
+        for match in ISSUE_REFERENCE_PATTERN.finditer(line.group(1)):
+            if match["url_number"]:
+                key = f"{match['url_repository']}#{int(match['url_number'])}"
+            else:
+                key = f"{match['repository'] or repository}#{int(match['number'])}"
+            keys[key.lower()] = None
+
+    return list(keys)
@@ -0,0 +1,135 @@
+from collections import defaultdict
+from biocypher._logger import logger
+
+logger.debug(f"Loading module {__name__}.")
+
+
+class GraphRegistry:
+    """
+    Registry of the nodes and edges generated by an adapter. Nodes are
+    indexed by id and edges by (source, target, label), so membership checks
+    and deduplication take constant time. Nodes and edges are additionally
+    kept in buckets per label, and are returned in insertion order.
+    """
+
+    def __init__(self):
+        self._nodes = {}
+        self._edges = {}
+        self._node_buckets = defaultdict(list)
+        self._edge_buckets = defaultdict(list)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._nodes
+
+    def add_node(
+        self, node_id: str, label: str, properties: dict, merge: bool = False
+    ) -> bool:
+        """
+        Add a node unless a node with the same id exists.
+
+        Args:
+            node_id: The node id.
+            label: The node label.
+            properties: The node properties.
+            merge: Whether to update the properties of an existing node with
+                the non-empty properties of the new one.
+
+        Returns:
+            True if the node was added, False if the id already existed.
+        """
+
+        existing = self._nodes.get(node_id)
+
+        if existing is not None:
+            if merge:
+                _merge(existing[2], properties)
+            return False
+
+        self._nodes[node_id] = (node_id, label, properties)
+        self._node_buckets[label].append(node_id)
+        return True
+
+    def add_edge(
+        self,
+        source: str,
+        target: str,
+        label: str,
+        properties: dict,
+        edge_id: str = None,
+        merge: bool = False,
+    ) -> bool:
+        """
+        Add an edge unless an edge with the same source, target and label
+        exists.
+
+        Args:
+            source: The source node id.
+            target: The target node id.
+            label: The edge label.
+            properties: The edge properties.
+            edge_id: The edge id, if any.
+            merge: Whether to update the properties of an existing edge with
+                the non-empty properties of the new one.
+
+        Returns:
+            True if the edge was added, False if it already existed.
+        """
+
+        key = (source, target, label)
+        existing = self._edges.get(key)
+
+        if existing is not None:
+            if merge:
+                _merge(existing[4], properties)
+            return False
+
+        self._edges[key] = (edge_id, source, target, label, properties)
+        self._edge_buckets[label].append(key)
+        return True
+
+    def add(self, element: tuple) -> bool:
+        """
+        Add a node tuple (id, label, properties) or an edge tuple (id,
+        source, target, label, properties).
+        """
+
+        if len(element) == 3:
+            return self.add_node(*element)
+
+        edge_id, source, target, label, properties = element
+        return self.add_edge(source, target, label, properties, edge_id)
+
+    def get_node(self, node_id: str) -> tuple:
+        return self._nodes.get(node_id)
+
+    def get_nodes(self, label: str = None) -> list:
+        """
+        Returns node tuples in insertion order, optionally of one label only.
+        """
+
+        if label is None:
+            return list(self._nodes.values())
+
+        return [self._nodes[node_id] for node_id in self._node_buckets.get(label, [])]
+
+    def get_edges(self, label: str = None) -> list:
+        """
+        Returns edge tuples in insertion order, optionally of one label only.
+        """
+
+        if label is None:
+            return list(self._edges.values())
+
+        return [self._edges[key] for key in self._edge_buckets.get(label, [])]
+
+    def node_count(self) -> int:
+        return len(self._nodes)
+
+    def edge_count(self) -> int:
+        return len(self._edges)
+
+
+def _merge(properties: dict, new_properties: dict):
+    for key, value in new_properties.items():
+        if value not in (None, "", []):
+            properties[key] = value
@@ -0,0 +1,374 @@
+import re
+from collections import defaultdict
+from math import gcd
+from biocypher._logger import logger
+from project_planning.item import ProjectItem
+from tabulate import tabulate
+
+logger.debug(f"Loading module {__name__}.")
+
+
+MINUTES_PER_DAY = 24 * 60
+DAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+# Timeslot options such as "Mon 10:00", "Tuesday 2pm", or "14:30"
+TIMESLOT_PATTERN = re.compile(
+    r"^\s*(?:(?P<day>mon|tue|wed|thu|fri|sat|sun)[a-z]*\.?,?\s+)?"
+    r"(?P<hour>\d{1,2})(?:[:.](?P<minute>\d{2}))?\s*(?P<meridiem>am|pm)?\b",
+    re.IGNORECASE,
+)
+
+# Duration options such as "30 min", "1 h", "1.5 hours", or "1h 30m"
+DURATION_PATTERN = re.compile(
+    r"(?P<value>\d+(?:\.\d+)?)\s*(?P<unit>h|hrs?|hours?|m|mins?|minutes?)\b",
+    re.IGNORECASE,
+)
+
+
+class TimeslotScheduler:
+    """
+    Assigns project items (cards) to the options of the Timeslot field, so
+    that nobody is assigned to two items at the same time. Items occupy
+    their timeslot for their Duration and must end on the day they start.
+
+    Time is divided into units of the greatest common divisor of all slot
+    starts and durations, e.g. 30 minutes. Each item placement and the
+    bookings of each person are bitsets over these units, so a conflict
+    check is a single AND per assignee.
+
+    Items with the scheduled status keep their timeslot. The other items
+    with one of the given statuses are placed greedily, most constrained
+    first: by priority, then longest duration, then most assignees. Each
+    keeps its current timeslot if it is still free, and otherwise gets the
+    earliest free one.
+
+    If the timeslot names cannot be read as times, each timeslot is a unit
+    of its own and durations are ignored.
+
+    Items without a Duration are placed with the default duration. If the
+    Duration options are given, the option of the default duration is
+    written back to these items, so that the board matches the schedule.
+
+    Args:
+        timeslots: Names of the Timeslot options, e.g. ["Mon 10:00",
+            "Mon 14:00"], usually `GitHubAdapter.get_field_options(
+            "Timeslot")`.
+        statuses: Statuses of the items to schedule.
+        scheduled_status: Status of scheduled items, set on newly scheduled
+            ones.
+        priorities: Names of the Priority options, highest priority first.
+            Items without priority come last.
+        default_duration: Duration of items without one, e.g. "1 h".
+        durations: Names of the Duration options, usually
+            `GitHubAdapter.get_field_options("Duration")`. One of them must
+            match the default duration. If not given, the Duration field
+            is not changed.
+    """
+
+    def __init__(
+        self,
+        timeslots: list,
+        statuses: tuple = ("Todo",),
+        scheduled_status: str = "Scheduled",
+        priorities: list = None,
+        default_duration: str = "1 h",
+        durations: list = None,
+    ):
+        if not timeslots:
+            raise ValueError("There are no timeslots to schedule items in.")
+
+        self.default_duration = parse_duration(default_duration)
+        if self.default_duration is None:
+            raise ValueError(f"Could not read default duration {default_duration}.")
+
+        # Option set on items without a duration
+        self.default_duration_option = None
+        if durations:
+            self.default_duration_option = next(
+                (
+                    name
+                    for name in durations
+                    if parse_duration(name) == self.default_duration
+                ),
+                None,
+            )
+            if self.default_duration_option is None:
+                raise ValueError(
+                    f"Default duration {default_duration} is not an option of "
+                    f"the Duration field."
+                )
+
+        self.timeslots = list(timeslots)
+        self.statuses = set(statuses)
+        self.scheduled_status = scheduled_status
+        self._priorities = {name: rank for rank, name in enumerate(priorities or [])}
+
+        starts = [parse_timeslot(timeslot) for timeslot in self.timeslots]
+
+        if None in starts:
+            logger.warning(
+                "Could not read all timeslots as times; scheduling at most one "
+                "item per person and timeslot, regardless of durations."
+            )
+            self._starts = None
+            self._order = list(self.timeslots)
+        else:
+            self._starts = dict(zip(self.timeslots, starts))
+            self._order = sorted(self.timeslots, key=self._starts.get)
+
+    def solve(self, items: list) -> "Schedule":
+        """
+        Schedule the items.
+
+        Args:
+            items: List of `ProjectItem`s, e.g. `GitHubAdapter.get_items()`.
+                Items with other statuses are ignored.
+
+        Returns:
+            The schedule.
+        """
+
+        fixed, candidates = [], []
+
+        for item in items:
+            if not item.title:
+                continue
+            if item.status == self.scheduled_status and item.timeslot in self._order:
+                fixed.append(item)
+            elif item.status in self.statuses or item.status == self.scheduled_status:
+                candidates.append(item)
+
+        durations = {item.id: self._get_duration(item) for item in fixed + candidates}
+        unit = self._get_unit(durations.values())
+
+        masks = {}
+
+        def get_mask(timeslot, duration):
+            key = (timeslot, duration)
+            if key not in masks:
+                masks[key] = self._get_mask(timeslot, duration, unit)
+            return masks[key]
+
+        # Bookings of each person, as a bitset over the time units
+        busy = defaultdict(int)
+        schedule = Schedule(self)
+
+        for item in fixed:
+            mask = get_mask(item.timeslot, durations[item.id]) or 0
+            for assignee in item.assignees:
+                if busy[assignee] & mask:
+                    logger.warning(
+                        f"{assignee} is booked twice at {item.timeslot} "
+                        f"({item.issue_key})."
+                    )
+                busy[assignee] |= mask
+            schedule.assignments.append((item, item.timeslot, durations[item.id]))
+
+        candidates.sort(
+            key=lambda item: (
+                self._priorities.get(item.priority, len(self._priorities)),
+                -durations[item.id],
+                -len(item.assignees),
+                item.repository,
+                item.number,
+            )
+        )
+
+        for item in candidates:
+            duration = durations[item.id]
+
+            # Keep the current timeslot if possible
+            timeslots = self._order
+            if item.timeslot in self._order:
+                timeslots = [item.timeslot] + self._order
+
+            for timeslot in timeslots:
+                mask = get_mask(timeslot, duration)
+                if mask is None:
+                    continue
+                if any(busy[assignee] & mask for assignee in item.assignees):
+                    continue
+
+                for assignee in item.assignees:
+                    busy[assignee] |= mask
+                schedule.assignments.append((item, timeslot, duration))
+                break
+            else:
+                schedule.unscheduled.append(item)
+
+        logger.info(
+            f"Scheduled {len(schedule.assignments)} items, "
+            f"{len(schedule.unscheduled)} could not be scheduled."
+        )
+
+        return schedule
+
+    def get_start(self, timeslot: str) -> int:
+        """
+        Start of a timeslot in minutes since Monday 0:00, or its position if
+        the timeslots are not times.
+        """
+
+        if self._starts is None:
+            return self._order.index(timeslot)
+        return self._starts[timeslot]
+
+    def _get_duration(self, item: ProjectItem) -> int:
+        if self._starts is None:
+            return 1
+        return parse_duration(item.duration) or self.default_duration
+
+    def _get_unit(self, durations) -> int:
+        if self._starts is None:
+            return 1
+        return gcd(*self._starts.values(), *durations, MINUTES_PER_DAY)
+
+    def _get_mask(self, timeslot: str, duration: int, unit: int) -> int:
+        """
+        Bitset of the time units occupied by an item, or None if the item
+        would not end on the day it starts.
+        """
+
+        if self._starts is None:
+            return 1 << self._order.index(timeslot)
+
+        start = self._starts[timeslot]
+        if start // MINUTES_PER_DAY != (start + duration - 1) // MINUTES_PER_DAY:
+            return None
+
+        return ((1 << (duration // unit)) - 1) << (start // unit)
+
+
+class Schedule:
+    """
+    Result of `TimeslotScheduler.solve()`.
+
+    Attributes:
+        assignments: List of (item, timeslot, duration in minutes) tuples.
+        unscheduled: Items for which no timeslot was free.
+    """
+
+    def __init__(self, scheduler: TimeslotScheduler):
+        self.scheduler = scheduler
+        self.assignments = []
+        self.unscheduled = []
+
+    def get_changes(self) -> list:
+        """
+        Get the field changes that apply the schedule to the board, for
+        `GitHubAdapter.mutate_fields()`. Only changed values are included.
+        Items placed with the default duration get the default Duration
+        option, if the scheduler knows the Duration options.
+
+        Returns:
+            List of (item id, field name, option name) tuples.
+        """
+
+        scheduler = self.scheduler
+        write_durations = (
+            scheduler.default_duration_option is not None
+            and scheduler._starts is not None
+        )
+
+        changes = []
+        for item, timeslot, _ in self.assignments:
+            if item.timeslot != timeslot:
+                changes.append((item.id, "Timeslot", timeslot))
+            if item.status != scheduler.scheduled_status:
+                changes.append((item.id, "Status", scheduler.scheduled_status))
+            if write_durations and parse_duration(item.duration) is None:
+                changes.append((item.id, "Duration", scheduler.default_duration_option))
+
+        return changes
+
+    def render(self) -> str:
+        """
+        Render the schedule as a Markdown table in timeslot order, followed
+        by the items that could not be scheduled.
+        """
+
+        rows = [
+            (
+                timeslot,
+                _format_duration(duration) if self.scheduler._starts else "",
+                _format_issue(item),
+                item.title,
+                ", ".join(item.assignees),
+            )
+            for item, timeslot, duration in sorted(
+                self.assignments,
+                key=lambda assignment: (
+                    self.scheduler.get_start(assignment[1]),
+                    assignment[0].number,
+                ),
+            )
+        ]
+
+        text = tabulate(
+            rows,
+            headers=["Time", "Duration", "Issue", "Title", "Assignees"],
+            tablefmt="github",
+        )
+
+        if self.unscheduled:
+            text += "\n\nCould not be scheduled:\n\n" + "\n".join(
+                f"- {_format_issue(item)} {item.title}" for item in self.unscheduled
+            )
+
+        return text + "\n"
+
+
+def parse_timeslot(name: str) -> int:
+    """
+    Read a timeslot name, e.g. "Mon 10:00" or "Tuesday 2pm", as minutes
+    since Monday 0:00. Timeslots without a day are on Monday. Returns None
+    if the name is not a time.
+    """
+
+    match = TIMESLOT_PATTERN.match(name or "")
+    if not match:
+        return None
+
+    hour = int(match["hour"])
+    minute = int(match["minute"] or 0)
+    meridiem = (match["meridiem"] or "").lower()
+
+    if meridiem == "pm" and hour < 12:
+        hour += 12
+    elif meridiem == "am" and hour == 12:
+        hour = 0
+
+    if hour > 23 or minute > 59:
+        return None
+
+    day = DAYS.index(match["day"][:3].lower()) if match["day"] else 0
+
+    return day * MINUTES_PER_DAY + hour * 60 + minute
+
+
+def parse_duration(name: str) -> int:
+    """
+    Read a duration name, e.g. "30 min", "1.5 h", or "1h 30m", as minutes.
+    Returns None if the name is not a duration.
+    """
+
+    minutes = 0
+    for match in DURATION_PATTERN.finditer(name or ""):
+        value = float(match["value"])
+        minutes += value * 60 if match["unit"][0].lower() == "h" else value
+
+    return round(minutes) or None
+
+
+def _format_duration(minutes: int) -> str:
+    hours, minutes = divmod(minutes, 60)
+    if not hours:
+        return f"{minutes} min"
+    return f"{hours} h {minutes} min" if minutes else f"{hours} h"
+
+
+def _format_issue(item: ProjectItem) -> str:
+    return (
+        f"[{item.repository}#{item.number}]"
+        f"(https://github.com/{item.repository}/issues/{item.number})"
+    )
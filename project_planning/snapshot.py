@@ -0,0 +1,210 @@
+import hashlib
+import json
+import os
+from biocypher._logger import logger
+from project_planning.item import ProjectItem
+
+logger.debug(f"Loading module {__name__}.")
+
+
+class ProjectSnapshot:
+    """
+    On-disk snapshot of a GitHub project, used for incremental builds.
+    Stores the parsed project items and issue comments of the last fetch, the
+    high-water mark of their `updatedAt` timestamps, and fingerprints of the
+    nodes and edges that were emitted from them.
+
+    Args:
+        path: Path of the JSON file the snapshot is stored in.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+        self.high_water_mark = None
+        self.items = {}
+        self.comments = {}
+        self.node_hashes = {}
+        self.edge_hashes = {}
+
+    @classmethod
+    def load(cls, path: str) -> "ProjectSnapshot":
+        """
+        Load a snapshot from disk. Returns an empty snapshot if the file does
+        not exist yet.
+
+        Args:
+            path: Path of the snapshot file.
+        """
+
+        snapshot = cls(path)
+
+        if not os.path.exists(path):
+            logger.info(f"No snapshot found at {path}, starting from scratch.")
+            return snapshot
+
+        with open(path, "r") as f:
+            data = json.load(f)
+
+        if any("content" in item for item in data["items"]):
+            logger.info(
+                f"Snapshot at {path} stores raw project items, starting from "
+                "scratch."
+            )
+            return snapshot
+
+        snapshot.high_water_mark = data.get("high_water_mark")
+        snapshot.items = {
+            item.issue_key: item for item in map(ProjectItem.from_dict, data["items"])
+        }
+        snapshot.comments = data.get("comments", {})
+        snapshot.node_hashes = data.get("node_hashes", {})
+        snapshot.edge_hashes = data.get("edge_hashes", {})
+
+        logger.info(
+            f"Loaded snapshot of {len(snapshot.items)} items from {path} "
+            f"(high-water mark {snapshot.high_water_mark})."
+        )
+
+        return snapshot
+
+    def save(self):
+        """
+        Write the snapshot to disk, replacing the previous file atomically.
+        """
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {
+                    "high_water_mark": self.high_water_mark,
+                    "items": [item.to_dict() for item in self.items.values()],
+                    "comments": self.comments,
+                    "node_hashes": self.node_hashes,
+                    "edge_hashes": self.edge_hashes,
+                },
+                f,
+            )
+        os.replace(tmp_path, self.path)
+
+    @property
+    def is_empty(self) -> bool:
+        return self.high_water_mark is None
+
+    def diff(self, nodes: list, edges: list) -> tuple:
+        """
+        Compare nodes and edges against the fingerprints of the previous
+        build and update the fingerprints.
+
+        Args:
+            nodes: List of node tuples of the current build.
+            edges: List of edge tuples of the current build.
+
+        Returns:
+            Tuple of the changed or new nodes, the changed or new edges, the
+            ids of removed nodes, and the (source, target, label) keys of
+            removed edges.
+        """
+
+        node_hashes = {}
+        changed_nodes = []
+        for node in nodes:
+            node_id, label, properties = node
+            fingerprint = _fingerprint(label, properties)
+            if self.node_hashes.get(node_id) != fingerprint:
+                changed_nodes.append(node)
+            node_hashes[node_id] = fingerprint
+
+        edge_hashes = {}
+        changed_edges = []
+        for edge in edges:
+            _, source, target, label, properties = edge
+            key = _edge_key(source, target, label)
+            fingerprint = _fingerprint(label, properties)
+            if self.edge_hashes.get(key) != fingerprint:
+                changed_edges.append(edge)
+            edge_hashes[key] = fingerprint
+
+        removed_nodes = [
+            node_id for node_id in self.node_hashes if node_id not in node_hashes
+        ]
+        removed_edges = [
+            tuple(json.loads(key)) for key in self.edge_hashes if key not in edge_hashes
+        ]
+
+        self.node_hashes = node_hashes
+        self.edge_hashes = edge_hashes
+
+        return changed_nodes, changed_edges, removed_nodes, removed_edges
+
+    def apply_delta(
+        self, nodes: list, edges: list, removed_nodes: list, removed_edges: list
+    ) -> tuple:
+        """
+        Update the fingerprints with a partial set of nodes and edges, e.g.
+        those regenerated for a few changed items, leaving all others as
+        they are.
+
+        Args:
+            nodes: List of regenerated node tuples.
+            edges: List of regenerated edge tuples.
+            removed_nodes: Ids of removed nodes.
+            removed_edges: (source, target, label) keys of removed edges.
+                Edges of removed nodes are removed as well.
+
+        Returns:
+            Tuple of the nodes and edges that actually changed, the ids of
+            removed nodes, and the keys of removed edges that existed.
+        """
+
+        changed_nodes = []
+        for node in nodes:
+            node_id, label, properties = node
+            fingerprint = _fingerprint(label, properties)
+            if self.node_hashes.get(node_id) != fingerprint:
+                changed_nodes.append(node)
+                self.node_hashes[node_id] = fingerprint
+
+        changed_edges = []
+        for edge in edges:
+            _, source, target, label, properties = edge
+            key = _edge_key(source, target, label)
+            fingerprint = _fingerprint(label, properties)
+            if self.edge_hashes.get(key) != fingerprint:
+                changed_edges.append(edge)
+                self.edge_hashes[key] = fingerprint
+
+        removed_nodes = [
+            node_id
+            for node_id in removed_nodes
+            if self.node_hashes.pop(node_id, None) is not None
+        ]
+        removed_edges = [
+            key
+            for key in removed_edges
+            if self.edge_hashes.pop(_edge_key(*key), None) is not None
+        ]
+
+        # Edges generated for other items may still point to removed nodes
+        if removed_nodes:
+            removed_ids = set(removed_nodes)
+            for key in list(self.edge_hashes):
+                source, target, label = json.loads(key)
+                if source in removed_ids or target in removed_ids:
+                    del self.edge_hashes[key]
+                    removed_edges.append((source, target, label))
+
+        return changed_nodes, changed_edges, removed_nodes, removed_edges
+
+
+def _edge_key(source: str, target: str, label: str) -> str:
+    return json.dumps([source, target, label])
+
+
+def _fingerprint(label: str, properties: dict) -> str:
+    payload = json.dumps([label, properties], sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()
@@ -0,0 +1,171 @@
+"""
+Typed schema of the project item responses of the GitHub GraphQL API, for
+decoding with msgspec. Only imported by `JSONDecoder` if msgspec is
+installed.
+"""
+
+from typing import Optional
+import msgspec
+from biocypher._logger import logger
+from project_planning.item import ProjectItem
+
+logger.debug(f"Loading module {__name__}.")
+
+
+class FieldName(msgspec.Struct):
+    name: Optional[str] = None
+
+
+class FieldValue(msgspec.Struct):
+    text: Optional[str] = None
+    name: Optional[str] = None
+    title: Optional[str] = None
+    iterationId: Optional[str] = None
+    field: Optional[FieldName] = None
+
+
+class FieldValues(msgspec.Struct):
+    nodes: list[Optional[FieldValue]] = []
+
+
+class Label(msgspec.Struct):
+    name: str
+
+
+class LabelEdge(msgspec.Struct):
+    node: Label
+
+
+class Labels(msgspec.Struct):
+    edges: list[LabelEdge] = []
+
+
+class User(msgspec.Struct):
+    login: str
+
+
+class Assignees(msgspec.Struct):
+    nodes: list[User] = []
+
+
+class Repository(msgspec.Struct):
+    nameWithOwner: str
+
+
+class Content(msgspec.Struct):
+    number: Optional[int] = None
+    updatedAt: Optional[str] = None
+    body: Optional[str] = ""
+    repository: Optional[Repository] = None
+    labels: Optional[Labels] = None
+    assignees: Optional[Assignees] = None
+
+
+class Item(msgspec.Struct):
+    id: str
+    updatedAt: Optional[str] = None
+    fieldValues: Optional[FieldValues] = None
+    content: Optional[Content] = None
+
+
+class PageInfo(msgspec.Struct):
+    endCursor: Optional[str] = None
+    hasNextPage: bool = False
+
+
+class ItemConnection(msgspec.Struct):
+    nodes: list[Optional[Item]] = []
+    pageInfo: Optional[PageInfo] = None
+
+
+class Project(msgspec.Struct):
+    items: Optional[ItemConnection] = None
+
+
+class Data(msgspec.Struct):
+    node: Optional[Project] = None
+    nodes: Optional[list[Optional[Item]]] = None
+    rateLimit: Optional[dict] = None
+
+
+class ItemsResponse(msgspec.Struct):
+    data: Optional[Data] = None
+    errors: Optional[list] = None
+
+
+ITEMS_DECODER = msgspec.json.Decoder(ItemsResponse)
+
+
+def decode_items(content) -> dict:
+    """
+    Decode a response holding project items, either a page of a project's
+    items or items by id, straight into `ProjectItem`s.
+
+    Returns:
+        The response as built-in types, with the items replaced by
+        `ProjectItem`s. Items not linked to an issue are dropped.
+    """
+
+    response = ITEMS_DECODER.decode(content)
+
+    result = {}
+    if response.errors is not None:
+        result["errors"] = response.errors
+
+    data = response.data
+    if data is None:
+        return result
+
+    result["data"] = {}
+    if data.rateLimit is not None:
+        result["data"]["rateLimit"] = data.rateLimit
+
+    if data.node is not None and data.node.items is not None:
+        items = data.node.items
+        result["data"]["node"] = {
+            "items": {
+                "nodes": _to_project_items(items.nodes),
+                "pageInfo": msgspec.to_builtins(items.pageInfo),
+            }
+        }
+
+    if data.nodes is not None:
+        result["data"]["nodes"] = _to_project_items(data.nodes)
+
+    return result
+
+
+def _to_project_items(nodes: list) -> list:
+    return [
+        _to_project_item(node)
+        for node in nodes
+        if node is not None and node.content is not None and node.content.number
+    ]
+
+
+def _to_project_item(node: Item) -> ProjectItem:
+    content = node.content
+
+    return ProjectItem.from_field_values(
+        node.id,
+        content.repository.nameWithOwner,
+        content.number,
+        (
+            (
+                field.field.name if field.field else None,
+                field.title if field.iterationId else field.text or field.name,
+                field.iterationId,
+            )
+            for field in (node.fieldValues.nodes if node.fieldValues else [])
+            if field is not None
+        ),
+        updated_at=node.updatedAt,
+        content_updated_at=content.updatedAt,
+        body=content.body,
+        labels=[edge.node.name for edge in content.labels.edges]
+        if content.labels
+        else [],
+        assignees=[user.login for user in content.assignees.nodes]
+        if content.assignees
+        else [],
+    )
@@ -0,0 +1,521 @@
+from collections import defaultdict
+from itertools import chain
+import neo4j
+from biocypher import BioCypher
+from biocypher._config import config
+from biocypher._create import BioCypherRelAsNode
+from biocypher._logger import logger
+
+logger.debug(f"Loading module {__name__}.")
+
+
+class Neo4jSync:
+    """
+    Synchronises the adapter output with a running Neo4j database instead of
+    re-importing it. The nodes and edges of the labels defined in the schema
+    are read from the database, compared with the new output by node id and
+    (source, target, type), and only the differences are written, as batched
+    `UNWIND ... MERGE` transactions. Nodes and edges that no longer exist are
+    deleted.
+
+    Nodes get the same labels and properties as with `neo4j-admin import`,
+    so a database built by the import pipeline can be kept up to date with
+    this class. The output must be complete, i.e. not the delta of an
+    incremental build, since everything missing from it is deleted.
+
+    Args:
+        bc: The BioCypher instance whose translator maps the adapter output
+            to the schema.
+        uri: URI of the database. Defaults to the `neo4j` configuration.
+        user: User name. Defaults to the `neo4j` configuration.
+        password: Password. Defaults to the `neo4j` configuration.
+        database: Name of the database. Defaults to the `neo4j`
+            configuration.
+        batch_size: Maximum number of rows per transaction.
+    """
+
+    def __init__(
+        self,
+        bc: BioCypher,
+        uri: str = None,
+        user: str = None,
+        password: str = None,
+        database: str = None,
+        batch_size: int = 1000,
+    ):
+        neo4j_config = config("neo4j")
+
+        self.uri = uri or neo4j_config.get("uri")
+        self.database = database or neo4j_config.get("database_name")
+        self.batch_size = batch_size
+
+        self.translator = bc._get_translator()
+        self.driver = neo4j.GraphDatabase.driver(
+            self.uri,
+            auth=(
+                user or neo4j_config.get("user"),
+                password or neo4j_config.get("password"),
+            ),
+        )
+
+        self._node_labels, self._edge_types = self._get_schema_labels()
+
+    def close(self):
+        self.driver.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def sync(self, nodes, edges) -> dict:
+        """
+        Write the changes between the database and the adapter output.
+
+        Args:
+            nodes: Iterable of node tuples (id, label, properties).
+            edges: Iterable of edge tuples (id, source, target, label,
+                properties).
+
+        Returns:
+            Dictionary with the number of upserted and deleted nodes and
+            edges.
+        """
+
+        new_nodes, new_edges = self._translate(nodes, edges)
+
+        self._create_indexes()
+        old_nodes = self._read_nodes()
+        old_edges = self._read_edges()
+
+        # Nodes
+        upserted_nodes = defaultdict(list)
+        for node_id, (label, labels, properties) in new_nodes.items():
+            old = old_nodes.get(node_id)
+            if old is None or old[1] != properties:
+                upserted_nodes[(label, labels)].append(
+                    {"id": node_id, "properties": properties}
+                )
+
+        deleted_nodes = [
+            internal_id
+            for node_id, (internal_id, *_) in old_nodes.items()
+            if node_id not in new_nodes
+        ]
+
+        self._upsert_nodes(upserted_nodes)
+
+        self._write(
+            """
+            UNWIND $rows AS id
+            MATCH (n) WHERE id(n) = id
+            DETACH DELETE n
+            """,
+            deleted_nodes,
+        )
+
+        # Edges
+        upserted_edges = defaultdict(list)
+        for (source, target, edge_type), properties in new_edges.items():
+            old = old_edges.get((source, target, edge_type))
+            if old is not None and old[1] == properties:
+                continue
+
+            source_label = self._get_node_label(source, new_nodes, old_nodes)
+            target_label = self._get_node_label(target, new_nodes, old_nodes)
+            if source_label is None or target_label is None:
+                logger.warning(
+                    f"Skipping {edge_type} edge from {source} to {target}: "
+                    "node not found."
+                )
+                continue
+
+            upserted_edges[(edge_type, source_label, target_label)].append(
+                {"source": source, "target": target, "properties": properties}
+            )
+
+        deleted_edges = [
+            internal_id
+            for key, (internal_id, _) in old_edges.items()
+            if key not in new_edges and key[0] in new_nodes and key[1] in new_nodes
+        ]
+
+        self._upsert_edges(upserted_edges)
+
+        self._write(
+            """
+            UNWIND $rows AS id
+            MATCH ()-[r]->() WHERE id(r) = id
+            DELETE r
+            """,
+            deleted_edges,
+        )
+
+        result = {
+            "nodes_upserted": sum(len(rows) for rows in upserted_nodes.values()),
+            "nodes_deleted": len(deleted_nodes),
+            "edges_upserted": sum(len(rows) for rows in upserted_edges.values()),
+            "edges_deleted": len(deleted_edges),
+        }
+        logger.info(f"Synchronised graph with {self.uri}: {result}.")
+
+        return result
+
+    def apply(
+        self, nodes, edges, removed_nodes: list = None, removed_edges: list = None
+    ) -> dict:
+        """
+        Write a delta, e.g. of an incremental build or of webhook events,
+        without reading the whole graph. Nodes and edges are upserted; the
+        removed ones are deleted.
+
+        Args:
+            nodes: Iterable of changed or new node tuples.
+            edges: Iterable of changed or new edge tuples.
+            removed_nodes: Ids of removed nodes.
+            removed_edges: (source, target, label) keys of removed edges.
+
+        Returns:
+            Dictionary with the number of upserted and deleted nodes and
+            edges.
+        """
+
+        new_nodes, new_edges = self._translate(nodes, edges)
+
+        # Edges of removed nodes are deleted with them
+        removed_nodes = list(removed_nodes or [])
+        removed_edges = [
+            (source, target, label)
+            for source, target, label in removed_edges or []
+            if source not in removed_nodes and target not in removed_nodes
+        ]
+        _, deleted_keys = self._translate(
+            [],
+            [
+                (None, source, target, label, {})
+                for source, target, label in removed_edges
+            ],
+        )
+
+        # Labels of removed nodes and of edge endpoints outside of the delta
+        edge_nodes = {
+            node_id for key in chain(new_edges, deleted_keys) for node_id in key[:2]
+        }
+        node_labels = self._find_nodes(
+            (edge_nodes - set(new_nodes)) | set(removed_nodes)
+        )
+        node_labels.update((node_id, node[0]) for node_id, node in new_nodes.items())
+
+        upserted_nodes = defaultdict(list)
+        for node_id, (label, labels, properties) in new_nodes.items():
+            upserted_nodes[(label, labels)].append(
+                {"id": node_id, "properties": properties}
+            )
+        self._upsert_nodes(upserted_nodes)
+
+        upserted_edges = defaultdict(list)
+        for (source, target, edge_type), properties in new_edges.items():
+            source_label = node_labels.get(source)
+            target_label = node_labels.get(target)
+            if source_label is None or target_label is None:
+                logger.warning(
+                    f"Skipping {edge_type} edge from {source} to {target}: "
+                    "node not found."
+                )
+                continue
+
+            upserted_edges[(edge_type, source_label, target_label)].append(
+                {"source": source, "target": target, "properties": properties}
+            )
+        self._upsert_edges(upserted_edges)
+
+        deleted_edges = defaultdict(list)
+        for source, target, edge_type in deleted_keys:
+            if source in node_labels and target in node_labels:
+                deleted_edges[
+                    (edge_type, node_labels[source], node_labels[target])
+                ].append({"source": source, "target": target})
+
+        for (edge_type, source_label, target_label), rows in deleted_edges.items():
+            self._write(
+                f"""
+                UNWIND $rows AS row
+                MATCH (s:{_quote(source_label)} {{id: row.source}})
+                MATCH (t:{_quote(target_label)} {{id: row.target}})
+                MATCH (s)-[r:{_quote(edge_type)}]->(t)
+                DELETE r
+                """,
+                rows,
+            )
+
+        deleted_nodes = defaultdict(list)
+        for node_id in removed_nodes:
+            if node_id in node_labels:
+                deleted_nodes[node_labels[node_id]].append(node_id)
+
+        for label, rows in deleted_nodes.items():
+            self._write(
+                f"""
+                UNWIND $rows AS id
+                MATCH (n:{_quote(label)} {{id: id}})
+                DETACH DELETE n
+                """,
+                rows,
+            )
+
+        result = {
+            "nodes_upserted": sum(len(rows) for rows in upserted_nodes.values()),
+            "nodes_deleted": sum(len(rows) for rows in deleted_nodes.values()),
+            "edges_upserted": sum(len(rows) for rows in upserted_edges.values()),
+            "edges_deleted": sum(len(rows) for rows in deleted_edges.values()),
+        }
+        logger.info(f"Applied delta to {self.uri}: {result}.")
+
+        return result
+
+    def _upsert_nodes(self, rows_by_labels: dict):
+        """
+        Merge nodes by id and replace their properties and labels.
+
+        Args:
+            rows_by_labels: Dictionary mapping (primary label, other labels)
+                to rows with the node id and properties.
+        """
+
+        for (label, labels), rows in rows_by_labels.items():
+            self._write(
+                f"""
+                UNWIND $rows AS row
+                MERGE (n:{_quote(label)} {{id: row.id}})
+                SET n = row.properties, n{"".join(f":{_quote(l)}" for l in labels)}
+                """,
+                rows,
+            )
+
+    def _upsert_edges(self, rows_by_type: dict):
+        """
+        Merge edges between existing nodes and replace their properties.
+
+        Args:
+            rows_by_type: Dictionary mapping (edge type, source label, target
+                label) to rows with the source and target ids and properties.
+        """
+
+        for (edge_type, source_label, target_label), rows in rows_by_type.items():
+            self._write(
+                f"""
+                UNWIND $rows AS row
+                MATCH (s:{_quote(source_label)} {{id: row.source}})
+                MATCH (t:{_quote(target_label)} {{id: row.target}})
+                MERGE (s)-[r:{_quote(edge_type)}]->(t)
+                SET r = row.properties
+                """,
+                rows,
+            )
+
+    def _translate(self, nodes, edges) -> tuple:
+        """
+        Translate node and edge tuples to the labels, types, and properties
+        used by the admin import.
+
+        Returns:
+            Tuple of a dictionary mapping node id to (primary label, other
+            labels, properties), and a dictionary mapping (source, target,
+            type) to properties.
+        """
+
+        new_nodes = {}
+        new_edges = {}
+        labels = {}
+
+        def add_node(node):
+            label = node.get_label()
+            if label not in labels:
+                labels[label] = self._get_labels(label)
+            new_nodes[node.get_id()] = (
+                *labels[label],
+                _clean(node.get_properties()),
+            )
+
+        def add_edge(edge):
+            key = (
+                edge.get_source_id(),
+                edge.get_target_id(),
+                self.translator.name_sentence_to_pascal(edge.get_label()),
+            )
+            properties = _clean(edge.get_properties())
+            if edge.get_id():
+                properties["id"] = edge.get_id()
+            new_edges[key] = properties
+
+        for node in self.translator.translate_nodes(nodes):
+            add_node(node)
+
+        # The translator fails on empty edge input
+        edges = list(edges)
+        translated_edges = self.translator.translate_edges(edges) if edges else []
+
+        for edge in translated_edges:
+            if isinstance(edge, BioCypherRelAsNode):
+                add_node(edge.get_node())
+                add_edge(edge.get_source_edge())
+                add_edge(edge.get_target_edge())
+            else:
+                add_edge(edge)
+
+        return new_nodes, new_edges
+
+    def _get_labels(self, label: str) -> tuple:
+        """
+        Get the primary label and the sorted ancestor labels of a node label,
+        in PascalCase.
+        """
+
+        primary = self.translator.name_sentence_to_pascal(label)
+        ancestors = {
+            self.translator.name_sentence_to_pascal(ancestor)
+            for ancestor in self.translator.ontology.get_ancestors(label)
+        }
+        ancestors.discard(primary)
+
+        return primary, tuple(sorted(ancestors))
+
+    def _get_schema_labels(self) -> tuple:
+        """
+        Get the node labels and edge types defined in the schema. Only nodes
+        and edges of these labels and types are synchronised.
+        """
+
+        node_labels = set()
+        edge_types = set()
+
+        for label, entry in self.translator.ontology.mapping.extended_schema.items():
+            if not isinstance(entry, dict):
+                continue
+
+            pascal = self.translator.name_sentence_to_pascal(
+                entry.get("label_as_edge") or label
+            )
+            if entry.get("represented_as") == "edge":
+                edge_types.add(pascal)
+            else:
+                node_labels.add(pascal)
+
+        return node_labels, edge_types
+
+    def _get_node_label(self, node_id: str, new_nodes: dict, old_nodes: dict):
+        if node_id in new_nodes:
+            return new_nodes[node_id][0]
+        if node_id in old_nodes:
+            return old_nodes[node_id][2]
+        return None
+
+    def _create_indexes(self):
+        with self.driver.session(database=self.database) as session:
+            for label in self._node_labels:
+                session.run(
+                    f"CREATE INDEX IF NOT EXISTS FOR (n:{_quote(label)}) ON (n.id)"
+                )
+
+    def _find_nodes(self, node_ids: set) -> dict:
+        """
+        Look up the primary labels of nodes in the database, using the id
+        index of each schema label.
+
+        Returns:
+            Dictionary mapping the ids of the nodes found to their label.
+        """
+
+        found = {}
+        if not node_ids:
+            return found
+
+        with self.driver.session(database=self.database) as session:
+            for label in self._node_labels:
+                for record in session.run(
+                    f"MATCH (n:{_quote(label)}) WHERE n.id IN $ids RETURN n.id AS id",
+                    ids=list(node_ids),
+                ):
+                    found[record["id"]] = label
+
+        return found
+
+    def _read_nodes(self) -> dict:
+        """
+        Read the nodes of the schema labels from the database.
+
+        Returns:
+            Dictionary mapping node id to (internal id, properties, primary
+            label).
+        """
+
+        nodes = {}
+
+        with self.driver.session(database=self.database) as session:
+            for label in self._node_labels:
+                for record in session.run(
+                    f"""
+                    MATCH (n:{_quote(label)})
+                    RETURN n.id AS id, id(n) AS internal_id,
+                        properties(n) AS properties
+                    """
+                ):
+                    nodes[record["id"]] = (
+                        record["internal_id"],
+                        record["properties"],
+                        label,
+                    )
+
+        return nodes
+
+    def _read_edges(self) -> dict:
+        """
+        Read the edges of the schema types from the database.
+
+        Returns:
+            Dictionary mapping (source, target, type) to (internal id,
+            properties).
+        """
+
+        edges = {}
+
+        with self.driver.session(database=self.database) as session:
+            for edge_type in self._edge_types:
+                for record in session.run(
+                    f"""
+                    MATCH (s)-[r:{_quote(edge_type)}]->(t)
+                    RETURN s.id AS source, t.id AS target, id(r) AS internal_id,
+                        properties(r) AS properties
+                    """
+                ):
+                    edges[(record["source"], record["target"], edge_type)] = (
+                        record["internal_id"],
+                        record["properties"],
+                    )
+
+        return edges
+
+    def _write(self, query: str, rows: list):
+        """
+        Run a write query with `$rows` in batches of `batch_size`, one
+        transaction per batch.
+        """
+
+        with self.driver.session(database=self.database) as session:
+            for start in range(0, len(rows), self.batch_size):
+                with session.begin_transaction() as tx:
+                    tx.run(query, rows=rows[start : start + self.batch_size])
+                    tx.commit()
+
+
+def _quote(name: str) -> str:
+    return "`%s`" % name.replace("`", "``")
+
+
+def _clean(properties: dict) -> dict:
+    """
+    Drop empty values, which Neo4j does not store.
+    """
+
+    return {key: value for key, value in properties.items() if value is not None}
@@ -0,0 +1,608 @@
+import hashlib
+import hmac
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import chain
+from biocypher._logger import logger
+from project_planning.adapters.github_adapter import (
+    COMMENT_SELECTIONS,
+    MAX_PAGE_SIZE,
+    GitHubAdapter,
+)
+
+logger.debug(f"Loading module {__name__}.")
+
+
+EVENTS = ("projects_v2_item", "issues", "issue_comment")
+
+# Project item actions after which the item is re-fetched or removed
+ITEM_UPDATE_ACTIONS = ("created", "edited", "restored", "converted")
+ITEM_REMOVE_ACTIONS = ("deleted", "archived")
+
+# Issue actions after which the issue is no longer part of the board
+ISSUE_REMOVE_ACTIONS = ("deleted", "transferred")
+
+
+class WebhookProcessor:
+    """
+    Turns GitHub webhook events into node and edge deltas. Events are
+    debounced and processed in batches: after `debounce` seconds without new
+    events, but at the latest `max_delay` seconds after the first pending
+    one.
+
+    The current state of the board is kept in the adapter's snapshot, which
+    is updated and saved with every batch, so that later incremental builds
+    continue from it. For each affected item, the nodes and edges are
+    generated with the adapter's mapping before and after the events and
+    compared with the snapshot's fingerprints; only the differences are
+    passed on.
+
+    - `issues` events update the title, body, labels, and assignees of the
+      card from the payload, without API requests.
+    - `issue_comment` events update the stored comments of the issue,
+      following the adapter's comment policy, without API requests.
+    - `projects_v2_item` events carry no field values, so the changed cards
+      are re-fetched, up to 100 per request.
+
+    Person, iteration, and data type nodes are shared by several cards and
+    are not removed with a card; the next full sync removes them if unused.
+    Dependency edges are regenerated for the cards whose "Uses:" line
+    changed; a changed data type of a used card is picked up by the next
+    build.
+
+    Args:
+        adapter: Adapter with a snapshot, e.g. `GitHubAdapter(snapshot_path=
+            ..., incremental=True)`, whose mapping, comment policy, and API
+            access are used.
+        apply: Callable receiving each delta as (nodes, edges, removed node
+            ids, removed (source, target, label) edge keys), e.g.
+            `Neo4jSync.apply`.
+        debounce: Seconds without new events before a batch is processed.
+        max_delay: Maximum seconds an event waits for its batch.
+    """
+
+    def __init__(
+        self,
+        adapter: GitHubAdapter,
+        apply=None,
+        debounce: float = 2.0,
+        max_delay: float = 10.0,
+    ):
+        if adapter._snapshot is None:
+            raise ValueError("Processing webhook events requires a snapshot_path.")
+
+        self.adapter = adapter
+        self.snapshot = adapter._snapshot
+        self.apply = apply
+        self.debounce = debounce
+        self.max_delay = max_delay
+
+        self._pending = []
+        self._first_event = None
+        self._last_event = None
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._thread = None
+        self._stopped = False
+        self._projects_by_id = None
+
+    def submit(self, event: str, payload: dict):
+        """
+        Queue a webhook event for the next batch.
+
+        Args:
+            event: The event name, from the `X-GitHub-Event` header.
+            payload: The event payload.
+        """
+
+        if event not in EVENTS:
+            return
+
+        with self._condition:
+            now = time.monotonic()
+            if not self._pending:
+                self._first_event = now
+            self._last_event = now
+            self._pending.append((event, payload))
+            self._condition.notify()
+
+    def start(self):
+        """
+        Process batches in a background thread.
+        """
+
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run, name="webhook-processor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop the background thread and process the remaining events.
+        """
+
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        self.flush()
+
+    def flush(self) -> tuple:
+        """
+        Process all pending events now.
+
+        Returns:
+            The delta as a tuple of changed nodes, changed edges, removed
+            node ids, and removed edge keys, or None if there were no events.
+        """
+
+        with self._flush_lock:
+            with self._condition:
+                events, self._pending = self._pending, []
+
+            if not events:
+                return None
+
+            delta = self._process(events)
+
+            logger.info(
+                f"Processed {len(events)} webhook events: {len(delta[0])} "
+                f"changed nodes, {len(delta[1])} changed edges, "
+                f"{len(delta[2])} removed nodes, {len(delta[3])} removed edges."
+            )
+
+            if self.apply is not None and any(delta):
+                self.apply(*delta)
+
+            return delta
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopped:
+                    self._condition.wait()
+
+                # Wait for a quiet period, but not beyond the maximum delay
+                while not self._stopped:
+                    deadline = min(
+                        self._last_event + self.debounce,
+                        self._first_event + self.max_delay,
+                    )
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+                if self._stopped:
+                    return
+
+            try:
+                self.flush()
+            except Exception as e:
+                # The next incremental build picks up what was missed
+                logger.error(f"Could not process webhook events: {e}")
+
+    def _process(self, events: list) -> tuple:
+        """
+        Apply a batch of events to the snapshot and compute the delta.
+        """
+
+        changes = self._collect(events)
+        snapshot = self.snapshot
+        policy = self.adapter.comment_policy
+
+        # Previous state of every affected issue
+        before = {}
+
+        def touch(issue_key):
+            if issue_key not in before:
+                before[issue_key] = (
+                    snapshot.items.get(issue_key),
+                    snapshot.comments.get(issue_key),
+                )
+
+        keys_by_item_id = {item.id: key for key, item in snapshot.items.items()}
+
+        # Removed cards and issues
+        for issue_key in chain(
+            (keys_by_item_id.get(item_id) for item_id in changes["removed_items"]),
+            changes["removed_issues"],
+        ):
+            if issue_key in snapshot.items:
+                touch(issue_key)
+                del snapshot.items[issue_key]
+                snapshot.comments.pop(issue_key, None)
+
+        # Re-fetched cards
+        refetched = set()
+        for item in self._get_items(changes["items"]):
+            touch(item.issue_key)
+            snapshot.items[item.issue_key] = item
+            refetched.add(item.issue_key)
+
+        # Issue changes of cards that were not re-fetched
+        for issue_key, issue in changes["issues"].items():
+            item = snapshot.items.get(issue_key)
+            if item is None or issue_key in refetched:
+                continue
+
+            touch(issue_key)
+            snapshot.items[issue_key] = item.replace(
+                title=issue.get("title"),
+                body=issue.get("body") or "",
+                labels=[label["name"] for label in issue.get("labels") or []],
+                assignees=[user["login"] for user in issue.get("assignees") or []],
+                content_updated_at=issue.get("updated_at"),
+            )
+
+        # Comments
+        for issue_key in changes["comments"]:
+            if issue_key in snapshot.items:
+                touch(issue_key)
+
+        missing_comments = []
+        for issue_key in before:
+            item = snapshot.items.get(issue_key)
+
+            if item is None or not item.title or not policy.applies_to(item):
+                snapshot.comments.pop(issue_key, None)
+            elif issue_key not in snapshot.comments:
+                # New card, or one the policy did not apply to before
+                missing_comments.append(issue_key)
+            elif issue_key in changes["comments"]:
+                snapshot.comments[issue_key] = self._apply_comments(
+                    snapshot.comments[issue_key], changes["comments"][issue_key]
+                )
+
+        if missing_comments and self.adapter._requested(*COMMENT_SELECTIONS):
+            snapshot.comments.update(self.adapter._get_comments_batch(missing_comments))
+
+        # Regenerate the affected cards and compare
+        nodes, edges, removed_nodes, removed_edges = [], [], [], []
+        owned_labels = (self.adapter._get_label(), "comment")
+        index = self.adapter._index_issues(snapshot.items.values())
+
+        for issue_key, (old_item, old_comments) in before.items():
+            old = self._generate(old_item, old_comments, index)
+            new = self._generate(
+                snapshot.items.get(issue_key), snapshot.comments.get(issue_key), index
+            )
+
+            new_nodes = [element for element in new if len(element) == 3]
+            new_edges = [element for element in new if len(element) == 5]
+            node_ids = {node[0] for node in new_nodes}
+            edge_keys = {edge[1:4] for edge in new_edges}
+
+            nodes.extend(new_nodes)
+            edges.extend(new_edges)
+            removed_nodes.extend(
+                element[0]
+                for element in old
+                if len(element) == 3
+                and element[1] in owned_labels
+                and element[0] not in node_ids
+            )
+            removed_edges.extend(
+                element[1:4]
+                for element in old
+                if len(element) == 5 and element[1:4] not in edge_keys
+            )
+
+        delta = snapshot.apply_delta(nodes, edges, removed_nodes, removed_edges)
+        snapshot.save()
+
+        return delta
+
+    def _collect(self, events: list) -> dict:
+        """
+        Reduce a batch of events to the changes to apply: cards to re-fetch
+        or remove, latest issue payloads, removed issues, and comment
+        operations per issue.
+        """
+
+        changes = {
+            "items": {},
+            "removed_items": set(),
+            "issues": {},
+            "removed_issues": set(),
+            "comments": {},
+        }
+
+        for event, payload in events:
+            action = payload.get("action")
+
+            if event == "projects_v2_item":
+                item = payload.get("projects_v2_item") or {}
+                project = self._get_projects_by_id().get(item.get("project_node_id"))
+                if project is None or item.get("content_type") != "Issue":
+                    continue
+
+                item_id = item["node_id"]
+                if action in ITEM_REMOVE_ACTIONS:
+                    changes["items"].pop(item_id, None)
+                    changes["removed_items"].add(item_id)
+                elif action in ITEM_UPDATE_ACTIONS:
+                    changes["removed_items"].discard(item_id)
+                    changes["items"][item_id] = project
+                continue
+
+            issue_key = self._get_issue_key(payload)
+            if issue_key is None:
+                continue
+
+            if event == "issues":
+                if action in ISSUE_REMOVE_ACTIONS:
+                    changes["issues"].pop(issue_key, None)
+                    changes["removed_issues"].add(issue_key)
+                else:
+                    changes["issues"][issue_key] = payload["issue"]
+            elif event == "issue_comment":
+                changes["comments"].setdefault(issue_key, []).append(
+                    (action, payload["comment"])
+                )
+
+        return changes
+
+    def _apply_comments(self, comments: list, operations: list) -> list:
+        """
+        Apply comment operations from `issue_comment` events to the stored
+        comments of an issue, following the comment policy.
+        """
+
+        policy = self.adapter.comment_policy
+        comments = list(comments)
+
+        for action, payload in operations:
+            comment = {
+                "author": {"login": (payload.get("user") or {}).get("login")},
+                "id": payload["node_id"],
+            }
+            if policy.bodies:
+                comment["body"] = payload.get("body") or ""
+                self.adapter._trim_comment(comment)
+
+            index = next(
+                (
+                    i
+                    for i, stored in enumerate(comments)
+                    if stored["id"] == comment["id"]
+                ),
+                None,
+            )
+
+            if action == "deleted":
+                if index is not None:
+                    del comments[index]
+            elif index is not None:
+                comments[index] = comment
+            elif action == "created":
+                comments.append(comment)
+
+        if not policy.full_history:
+            comments = comments[-policy.k :]
+
+        return comments
+
+    def _get_items(self, items: dict) -> list:
+        """
+        Re-fetch cards by id, up to 100 per request.
+
+        Args:
+            items: Dictionary mapping item id to its project board.
+        """
+
+        ids = list(items)
+        chunks = [
+            ids[start : start + MAX_PAGE_SIZE]
+            for start in range(0, len(ids), MAX_PAGE_SIZE)
+        ]
+
+        fetched = []
+        for nodes in self.adapter._run_concurrently(
+            [
+                lambda chunk=chunk: self.adapter._get_items_by_id(chunk)
+                for chunk in chunks
+            ]
+        ):
+            for item in nodes:
+                self.adapter._item_projects[item.id] = items[item.id]
+                fetched.append(item)
+
+        return fetched
+
+    def _get_projects_by_id(self) -> dict:
+        """
+        Get the adapter's project boards by their node id, resolving the ids
+        on first use.
+        """
+
+        if self._projects_by_id is None:
+            adapter = self.adapter
+            for project in adapter._projects:
+                if not project.get("id"):
+                    project["id"] = adapter._get_project_id(
+                        adapter.url,
+                        adapter.headers,
+                        project["organization"],
+                        project["number"],
+                    )
+            self._projects_by_id = {
+                project["id"]: project for project in adapter._projects
+            }
+
+        return self._projects_by_id
+
+    def _get_issue_key(self, payload: dict) -> str:
+        issue = payload.get("issue") or {}
+        repository = (payload.get("repository") or {}).get("full_name")
+
+        if not repository or not issue.get("number"):
+            return None
+        return f"{repository}#{issue['number']}"
+
+    def _generate(self, item, comments, index: dict) -> list:
+        if item is None:
+            return []
+        return list(
+            chain(
+                self.adapter._generate_item(item, comments),
+                self.adapter._generate_assignees(item),
+                self.adapter._generate_dependencies(item, index),
+            )
+        )
+
+
+class WebhookServer(ThreadingHTTPServer):
+    """
+    Receives GitHub webhook deliveries and passes the `projects_v2_item`,
+    `issues`, and `issue_comment` events to a `WebhookProcessor`. Deliveries
+    are verified against the webhook secret, and can be recorded to replay
+    them later with `replay()`.
+
+    Args:
+        processor: The processor to pass the events to.
+        secret: The webhook secret. Deliveries with a missing or wrong
+            `X-Hub-Signature-256` are rejected. Required unless `insecure`
+            is set.
+        address: Host and port to listen on.
+        record_dir: Directory to record the accepted deliveries to, one JSON
+            file per delivery.
+        insecure: Whether to accept unsigned deliveries when no secret is
+            given, e.g. for local tests. Never expose such a server.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        processor: WebhookProcessor,
+        secret: str = None,
+        address: tuple = ("0.0.0.0", 8000),
+        record_dir: str = None,
+        insecure: bool = False,
+    ):
+        if not secret and not insecure:
+            raise ValueError(
+                "A webhook secret is required to verify deliveries. Pass "
+                "insecure=True to accept unsigned deliveries."
+            )
+
+        if not secret:
+            logger.warning("Webhook signatures are not verified.")
+
+        super().__init__(address, WebhookHandler)
+
+        self.processor = processor
+        self.secret = secret.encode() if secret else None
+        self.record_dir = record_dir
+
+        if record_dir:
+            os.makedirs(record_dir, exist_ok=True)
+
+    def verify(self, body: bytes, signature: str) -> bool:
+        if self.secret is None:
+            return True
+
+        expected = "sha256=" + hmac.new(self.secret, body, hashlib.sha256).hexdigest()
+        return hmac.compare_digest(expected, signature or "")
+
+    def record(self, event: str, delivery: str, payload: dict):
+        path = os.path.join(
+            self.record_dir, f"{time.time_ns()}-{delivery or 'delivery'}.json"
+        )
+        with open(path, "w") as f:
+            json.dump({"event": event, "delivery": delivery, "payload": payload}, f)
+
+
+class WebhookHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+
+        if not self.server.verify(body, self.headers.get("X-Hub-Signature-256")):
+            logger.warning("Rejected webhook delivery with invalid signature.")
+            self._send(401)
+            return
+
+        event = self.headers.get("X-GitHub-Event")
+        if event not in EVENTS:
+            self._send(204)
+            return
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            self._send(400)
+            return
+
+        if self.server.record_dir:
+            self.server.record(event, self.headers.get("X-GitHub-Delivery"), payload)
+
+        self.server.processor.submit(event, payload)
+        self._send(202)
+
+    def _send(self, status: int):
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        logger.debug(f"Webhook request: {format % args}")
+
+
+def load_recordings(path: str) -> list:
+    """
+    Load recorded webhook deliveries.
+
+    Args:
+        path: A recorded delivery, or a directory of them, which are loaded
+            in the order of their file names. Each file holds the event name
+            and payload as `{"event": ..., "payload": ...}`.
+
+    Returns:
+        List of (event, payload) tuples.
+    """
+
+    if os.path.isdir(path):
+        paths = [
+            os.path.join(path, name)
+            for name in sorted(os.listdir(path))
+            if name.endswith(".json")
+        ]
+    else:
+        paths = [path]
+
+    recordings = []
+    for file_path in paths:
+        with open(file_path) as f:
+            recording = json.load(f)
+        recordings.append((recording["event"], recording["payload"]))
+
+    return recordings
+
+
+def replay(processor: WebhookProcessor, recordings: list) -> tuple:
+    """
+    Pass recorded deliveries to a processor as one batch, e.g. against a
+    local stand-in of the GitHub API.
+
+    Args:
+        processor: The processor.
+        recordings: List of (event, payload) tuples, see `load_recordings`.
+
+    Returns:
+        The delta, see `WebhookProcessor.flush`.
+    """
+
+    for event, payload in recordings:
+        processor.submit(event, payload)
+
+    return processor.flush()
@@ -0,0 +1,211 @@
+import glob
+import os
+from itertools import islice
+from biocypher import BioCypher
+from biocypher._config import config
+from biocypher._create import BioCypherRelAsNode
+from biocypher._logger import logger
+from biocypher.output.write._batch_writer import parse_label
+from biocypher.output.write.graph._neo4j import _Neo4jBatchWriter
+
+logger.debug(f"Loading module {__name__}.")
+
+
+class ShardedNeo4jWriter(_Neo4jBatchWriter):
+    """
+    Neo4j admin import writer that writes nodes and edges while they are
+    generated. Rows are appended to a rotating set of shard files per label
+    (`<Label>-part000.csv`, `<Label>-part001.csv`, ...), so neither the graph
+    nor the rows of a label have to be held in memory, and `neo4j-admin
+    import` can read the shards of a label in parallel.
+
+    The delimiter, array delimiter, quote character, and import settings are
+    read from the `neo4j` section of the BioCypher configuration, as for the
+    default writer. The writer replaces the writer of the BioCypher instance,
+    so `write_import_call()`, `write_schema_info()` and `summary()` of the
+    instance can be used as usual.
+
+    Args:
+        bc: The BioCypher instance providing configuration, translator, and
+            deduplicator.
+        shard_size: Maximum number of rows per shard file.
+        chunk_size: Number of elements translated and written at once.
+    """
+
+    def __init__(
+        self, bc: BioCypher, shard_size: int = 100_000, chunk_size: int = 1000
+    ):
+        neo4j_config = config("neo4j")
+
+        # Resolve the output directory the same way as BioCypher does
+        if not bc._writer:
+            bc._get_writer()
+
+        super().__init__(
+            translator=bc._get_translator(),
+            deduplicator=bc._get_deduplicator(),
+            delimiter=neo4j_config.get("delimiter"),
+            array_delimiter=neo4j_config.get("array_delimiter"),
+            quote=neo4j_config.get("quote_character"),
+            output_directory=bc._output_directory,
+            db_name=neo4j_config.get("database_name"),
+            import_call_bin_prefix=neo4j_config.get("import_call_bin_prefix"),
+            import_call_file_prefix=neo4j_config.get("import_call_file_prefix"),
+            wipe=neo4j_config.get("wipe"),
+            strict_mode=bc._strict_mode,
+            skip_bad_relationships=neo4j_config.get("skip_bad_relationships"),
+            skip_duplicate_nodes=neo4j_config.get("skip_duplicate_nodes"),
+        )
+
+        self.shard_size = shard_size
+        self.chunk_size = chunk_size
+
+        # label -> [open file, number of rows, shard index]
+        self._shards = {}
+
+        bc._writer = self
+
+    def write(self, elements) -> bool:
+        """
+        Write a stream of node tuples (id, label, properties) and edge tuples
+        (id, source, target, label, properties), in any order, and the header
+        files of all written labels.
+
+        Args:
+            elements: Iterable of node and edge tuples, e.g.
+                `GitHubAdapter.get_nodes_and_edges()`.
+
+        Returns:
+            bool: True for success, False otherwise.
+        """
+
+        elements = iter(elements)
+
+        try:
+            while True:
+                chunk = list(islice(elements, self.chunk_size))
+                if not chunk:
+                    break
+
+                if not self._write_chunk(chunk):
+                    return False
+        finally:
+            self._close_shards()
+
+        if self.node_property_dict and not self._write_node_headers():
+            return False
+        if self.edge_property_dict and not self._write_edge_headers():
+            return False
+
+        return True
+
+    def write_nodes(self, nodes, batch_size: int = int(1e6), force: bool = False):
+        """
+        Write nodes and their headers like the default writer, closing the
+        shards afterwards.
+        """
+
+        try:
+            return super().write_nodes(nodes, batch_size, force)
+        finally:
+            self._close_shards()
+
+    def write_edges(self, edges, batch_size: int = int(1e6)) -> bool:
+        """
+        Write edges and their headers like the default writer, closing the
+        shards afterwards.
+        """
+
+        try:
+            return super().write_edges(edges, batch_size)
+        finally:
+            self._close_shards()
+
+    def _write_chunk(self, chunk: list) -> bool:
+        """
+        Translate one chunk of node and edge tuples and append their rows to
+        the shards of their labels.
+        """
+
+        node_tuples = [element for element in chunk if len(element) == 3]
+        edge_tuples = [element for element in chunk if len(element) != 3]
+
+        nodes = list(self.translator.translate_nodes(node_tuples))
+        edges = []
+
+        if edge_tuples:
+            for edge in self.translator.translate_edges(edge_tuples):
+                if isinstance(edge, BioCypherRelAsNode):
+                    if self.deduplicator.rel_as_node_seen(edge):
+                        continue
+                    nodes.append(edge.get_node())
+                    edges.append(edge.get_source_edge())
+                    edges.append(edge.get_target_edge())
+                elif not self.deduplicator.edge_seen(edge):
+                    edges.append(edge)
+
+        if nodes and not self._write_node_data(nodes, self.chunk_size):
+            return False
+        if edges and not self._write_edge_data(edges, self.chunk_size):
+            return False
+
+        return True
+
+    def _write_next_part(self, label: str, lines: list):
+        """
+        Append lines to the current shard of a label, starting a new shard
+        when it is full.
+        """
+
+        while lines:
+            shard = self._get_shard(label)
+            batch = lines[: self.shard_size - shard[1]]
+
+            shard[0].writelines(batch)
+            shard[1] += len(batch)
+            lines = lines[len(batch) :]
+
+    def _get_shard(self, label: str) -> list:
+        """
+        Return the current shard of a label with room for more rows, opening
+        the next shard file if necessary.
+        """
+
+        label_pascal = self.translator.name_sentence_to_pascal(parse_label(label))
+        shard = self._shards.get(label)
+
+        if shard is not None and shard[1] < self.shard_size:
+            return shard
+
+        if shard is None:
+            index = 0
+
+            # Parts of previous runs would be picked up by the import call
+            stale = glob.glob(os.path.join(self.outdir, f"{label_pascal}-part*.csv"))
+            if stale:
+                logger.warning(
+                    f"Removing {len(stale)} existing part files of {label_pascal}."
+                )
+                for path in stale:
+                    os.remove(path)
+        else:
+            shard[0].close()
+            index = shard[2] + 1
+
+        part = f"{label_pascal}-part{str(index).zfill(3)}.csv"
+        logger.info(f"Writing {label_pascal} rows to {part}.")
+
+        shard = [open(os.path.join(self.outdir, part), "w", encoding="utf-8"), 0, index]
+        self._shards[label] = shard
+        self.parts.setdefault(label, []).append(part)
+
+        return shard
+
+    def _close_shards(self):
+        """
+        Close all shard files. Later writes start new shards.
+        """
+
+        for shard in self._shards.values():
+            shard[0].close()
+            shard[1] = self.shard_size
@@ -0,0 +1,6 @@
+#!/bin/bash -c
+cd /usr/app/
+cp -r /src/* .
+cp config/biocypher_docker_config.yaml config/biocypher_config.yaml
+poetry install
+python3 webhook_service.py
@@ -0,0 +1,18 @@
+import os
+from biocypher import BioCypher
+from project_planning.adapters.github_adapter import GitHubAdapter
+from project_planning.sync import Neo4jSync
+
+
+def main():
+    bc = BioCypher()
+
+    adapter = GitHubAdapter()
+
+    # Update the running database in place instead of re-importing it
+    with Neo4jSync(bc, uri=os.environ.get("NEO4J_URI")) as sync:
+        sync.sync(adapter.get_nodes(), adapter.get_edges())
+
+
+if __name__ == "__main__":
+    main()
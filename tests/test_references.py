@@ -0,0 +1,46 @@
+from project_planning.references import extract_uses
+
+
+def test_local_reference():
+    assert extract_uses("Uses: #12", "biocypher/project-planning") == [
+        "biocypher/project-planning#12"
+    ]
+
+
+def test_repository_reference():
+    assert extract_uses("Uses: biocypher/BioCypher#345", "a/b") == [
+        "biocypher/biocypher#345"
+    ]
+
+
+def test_url_reference():
+    assert extract_uses(
+        "Uses: https://github.com/biocypher/biocypher/issues/346", "a/b"
+    ) == ["biocypher/biocypher#346"]
+
+
+def test_mixed_references_are_deduplicated_in_order():
+    body = (
+        "Description\n"
+        "Uses: #12, biocypher/biocypher#3 https://github.com/a/b/issues/7 #012\n"
+        "  Uses: #5 #12 Org/Repo#12\n"
+    )
+
+    assert extract_uses(body, "Org/Repo") == [
+        "org/repo#12",
+        "biocypher/biocypher#3",
+        "a/b#7",
+        "org/repo#5",
+    ]
+
+
+def test_only_uses_lines():
+    body = "See #1\nnot Uses: #2\nUses:#3"
+
+    assert extract_uses(body, "a/b") == ["a/b#3"]
+
+
+def test_no_references():
+    assert extract_uses("", "a/b") == []
+    assert extract_uses(None, "a/b") == []
+    assert extract_uses("Uses: nothing", "a/b") == []
@@ -0,0 +1,157 @@
+import pytest
+from project_planning.item import ProjectItem
+from project_planning.scheduling import (
+    TimeslotScheduler,
+    parse_duration,
+    parse_timeslot,
+)
+
+TIMESLOTS = ["Mon 10:00", "Mon 11:00", "Mon 23:00", "Tue 10:00"]
+
+
+def item(number, assignees=("alice",), status="Todo", **values):
+    return ProjectItem(
+        f"PVTI_{number}",
+        "biocypher/project-planning",
+        number,
+        title=f"Issue {number}",
+        status=status,
+        assignees=assignees,
+        **values,
+    )
+
+
+def assignments(schedule):
+    return {item.number: timeslot for item, timeslot, _ in schedule.assignments}
+
+
+def test_parse_timeslot():
+    assert parse_timeslot("Mon 10:00") == 10 * 60
+    assert parse_timeslot("Tuesday 2pm") == 24 * 60 + 14 * 60
+    assert parse_timeslot("14:30") == 14 * 60 + 30
+    assert parse_timeslot("Later") is None
+
+
+def test_parse_duration():
+    assert parse_duration("30 min") == 30
+    assert parse_duration("1.5 h") == 90
+    assert parse_duration("1h 30m") == 90
+    assert parse_duration("") is None
+
+
+def test_assignee_conflicts():
+    schedule = TimeslotScheduler(TIMESLOTS).solve(
+        [
+            item(1, ["alice"]),
+            item(2, ["alice", "bob"]),
+            item(3, ["bob"]),
+            item(4, ["carol"]),
+        ]
+    )
+
+    placed = assignments(schedule)
+
+    # Nobody is booked twice at the same time
+    assert placed[1] != placed[2]
+    assert placed[2] != placed[3]
+
+    # Unrelated cards take the earliest slot
+    assert placed[4] == "Mon 10:00"
+    assert not schedule.unscheduled
+
+
+def test_long_card_blocks_following_slots():
+    schedule = TimeslotScheduler(TIMESLOTS).solve(
+        [item(1, duration="2 h"), item(2, duration="1 h")]
+    )
+
+    # The longer card goes first and occupies 10:00 and 11:00
+    assert assignments(schedule) == {1: "Mon 10:00", 2: "Mon 23:00"}
+
+
+def test_full_schedule_reports_unscheduled():
+    schedule = TimeslotScheduler(["Mon 10:00"]).solve([item(1), item(2)])
+
+    assert len(schedule.assignments) == 1
+    assert [item.number for item in schedule.unscheduled] == [2]
+    assert "Could not be scheduled" in schedule.render()
+
+
+def test_pinned_slot_is_kept():
+    pinned = item(1, status="Scheduled", timeslot="Mon 11:00")
+    schedule = TimeslotScheduler(TIMESLOTS).solve([item(2), pinned])
+
+    assert assignments(schedule) == {1: "Mon 11:00", 2: "Mon 10:00"}
+
+    # The pinned card is already scheduled, so only the new card changes
+    assert schedule.get_changes() == [
+        ("PVTI_2", "Timeslot", "Mon 10:00"),
+        ("PVTI_2", "Status", "Scheduled"),
+    ]
+
+
+def test_current_slot_is_kept():
+    schedule = TimeslotScheduler(TIMESLOTS).solve([item(1, timeslot="Tue 10:00")])
+
+    assert assignments(schedule) == {1: "Tue 10:00"}
+    assert schedule.get_changes() == [("PVTI_1", "Status", "Scheduled")]
+
+
+def test_card_does_not_run_past_midnight():
+    # Starting at 23:00, a 2 h card would end on Tuesday
+    schedule = TimeslotScheduler(["Mon 23:00", "Tue 10:00"]).solve(
+        [item(1, duration="2 h", timeslot="Mon 23:00")]
+    )
+
+    assert assignments(schedule) == {1: "Tue 10:00"}
+
+
+def test_card_running_past_midnight_is_unscheduled():
+    schedule = TimeslotScheduler(["Mon 23:00"]).solve([item(1, duration="2 h")])
+
+    assert not schedule.assignments
+    assert [item.number for item in schedule.unscheduled] == [1]
+
+
+def test_priorities():
+    schedule = TimeslotScheduler(["Mon 10:00"], priorities=["P0", "P1"]).solve(
+        [item(1, priority="P1"), item(2, priority="P0"), item(3)]
+    )
+
+    assert assignments(schedule) == {2: "Mon 10:00"}
+
+
+def test_timeslots_without_times():
+    schedule = TimeslotScheduler(["Morning", "Afternoon"]).solve(
+        [item(1, duration="3 h"), item(2, duration="3 h")]
+    )
+
+    # Each slot holds one card per person, regardless of durations
+    assert assignments(schedule) == {1: "Morning", 2: "Afternoon"}
+
+
+def test_no_timeslots():
+    with pytest.raises(ValueError):
+        TimeslotScheduler([])
+
+
+def test_default_duration_is_written_back():
+    scheduler = TimeslotScheduler(
+        TIMESLOTS, default_duration="1 h", durations=["30 min", "1 h", "2 h"]
+    )
+    schedule = scheduler.solve(
+        [
+            item(1, status="Scheduled", timeslot="Mon 10:00"),
+            item(2, duration="2 h", timeslot="Tue 10:00"),
+        ]
+    )
+
+    assert schedule.get_changes() == [
+        ("PVTI_1", "Duration", "1 h"),
+        ("PVTI_2", "Status", "Scheduled"),
+    ]
+
+
+def test_default_duration_must_be_an_option():
+    with pytest.raises(ValueError):
+        TimeslotScheduler(TIMESLOTS, default_duration="45 min", durations=["1 h"])
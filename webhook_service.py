@@ -0,0 +1,97 @@
+import argparse
+import os
+from biocypher import BioCypher
+from project_planning.adapters.github_adapter import GitHubAdapter
+from project_planning.sync import Neo4jSync
+from project_planning.webhooks import (
+    WebhookProcessor,
+    WebhookServer,
+    load_recordings,
+    replay,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Apply GitHub webhook events to the knowledge graph."
+    )
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--snapshot",
+        default=os.getenv("BIOCYPHER_GITHUB_SNAPSHOT", "data/snapshot.json"),
+        help="Path of the project snapshot holding the current state.",
+    )
+    parser.add_argument("--debounce", type=float, default=2.0)
+    parser.add_argument("--max-delay", type=float, default=10.0)
+    parser.add_argument("--record", help="Directory to record deliveries to.")
+    parser.add_argument(
+        "--replay",
+        help="Recorded delivery or directory of deliveries to apply, then exit.",
+    )
+    parser.add_argument(
+        "--insecure",
+        action="store_true",
+        help="Accept unsigned deliveries if no webhook secret is set. Only "
+        "for local tests.",
+    )
+    parser.add_argument(
+        "--no-sync",
+        action="store_true",
+        help="Only update the snapshot, without writing to Neo4j.",
+    )
+    args = parser.parse_args()
+
+    secret = os.environ.get("BIOCYPHER_GITHUB_WEBHOOK_SECRET")
+    if not args.replay and not secret and not args.insecure:
+        parser.error(
+            "Set BIOCYPHER_GITHUB_WEBHOOK_SECRET to verify deliveries, or pass "
+            "--insecure for local tests."
+        )
+
+    # Catch up on changes since the snapshot was taken
+    adapter = GitHubAdapter(snapshot_path=args.snapshot, incremental=True)
+
+    sync = None
+    apply = None
+    if not args.no_sync:
+        sync = Neo4jSync(BioCypher(), uri=os.environ.get("NEO4J_URI"))
+        apply = sync.apply
+        apply(
+            adapter.get_nodes(),
+            adapter.get_edges(),
+            adapter.get_removed_nodes(),
+            adapter.get_removed_edges(),
+        )
+
+    processor = WebhookProcessor(
+        adapter, apply=apply, debounce=args.debounce, max_delay=args.max_delay
+    )
+
+    try:
+        if args.replay:
+            replay(processor, load_recordings(args.replay))
+            return
+
+        server = WebhookServer(
+            processor,
+            secret=secret,
+            address=("0.0.0.0", args.port),
+            record_dir=args.record,
+            insecure=args.insecure,
+        )
+        processor.start()
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            processor.stop()
+    finally:
+        adapter.close()
+        if sync is not None:
+            sync.close()
+
+
+if __name__ == "__main__":
+    main()